@@ -44,7 +44,7 @@ class Amd64StackUnwinder(StackUnwindingManager):
                 )
 
                 # Check if the return address is in a valid memory location
-                if not any(map.start <= return_address < map.end for map in maps):
+                if not maps.contains(return_address):
                     break
 
                 # Read the previous rbp and set it as the current one
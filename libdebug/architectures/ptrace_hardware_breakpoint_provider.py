@@ -6,9 +6,6 @@
 
 from typing import Callable
 
-from libdebug.architectures.amd64.amd64_ptrace_hw_bp_helper import (
-    Amd64PtraceHardwareBreakpointManager,
-)
 from libdebug.architectures.ptrace_hardware_breakpoint_manager import (
     PtraceHardwareBreakpointManager,
 )
@@ -26,6 +23,10 @@ def ptrace_hardware_breakpoint_manager_provider(
 
     match architecture:
         case "amd64":
+            from libdebug.architectures.amd64.amd64_ptrace_hw_bp_helper import (
+                Amd64PtraceHardwareBreakpointManager,
+            )
+
             return Amd64PtraceHardwareBreakpointManager(thread, peek_user, poke_user)
         case _:
             raise NotImplementedError(f"Architecture {architecture} not available.")
@@ -6,9 +6,6 @@
 
 from typing import Callable
 
-from libdebug.architectures.amd64.amd64_ptrace_register_holder import (
-    Amd64PtraceRegisterHolder,
-)
 from libdebug.data.register_holder import RegisterHolder
 from libdebug.utils.libcontext import libcontext
 
@@ -23,6 +20,10 @@ def register_holder_provider(
 
     match architecture:
         case "amd64":
+            from libdebug.architectures.amd64.amd64_ptrace_register_holder import (
+                Amd64PtraceRegisterHolder,
+            )
+
             return Amd64PtraceRegisterHolder(register_file)
         case _:
             raise NotImplementedError(f"Architecture {architecture} not available.")
@@ -4,21 +4,27 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
-from libdebug.architectures.amd64.amd64_stack_unwinder import (
-    Amd64StackUnwinder,
-)
 from libdebug.architectures.stack_unwinding_manager import StackUnwindingManager
 from libdebug.utils.libcontext import libcontext
 
-_amd64_stack_unwinder = Amd64StackUnwinder()
+_amd64_stack_unwinder = None
 
 
 def stack_unwinding_provider() -> StackUnwindingManager:
     """Returns an instance of the stack unwinding provider to be used by the `_InternalDebugger` class."""
+    global _amd64_stack_unwinder
+
     architecture = libcontext.arch
 
     match architecture:
         case "amd64":
+            if _amd64_stack_unwinder is None:
+                from libdebug.architectures.amd64.amd64_stack_unwinder import (
+                    Amd64StackUnwinder,
+                )
+
+                _amd64_stack_unwinder = Amd64StackUnwinder()
+
             return _amd64_stack_unwinder
         case _:
             raise NotImplementedError(f"Architecture {architecture} not available.")
@@ -4,21 +4,27 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
-from libdebug.architectures.amd64.amd64_syscall_hijacker import (
-    Amd64SyscallHijacker,
-)
 from libdebug.architectures.syscall_hijacking_manager import SyscallHijackingManager
 from libdebug.utils.libcontext import libcontext
 
-_amd64_syscall_hijacker = Amd64SyscallHijacker()
+_amd64_syscall_hijacker = None
 
 
 def syscall_hijacking_provider() -> SyscallHijackingManager:
     """Returns an instance of the syscall hijacking provider to be used by the `_InternalDebugger` class."""
+    global _amd64_syscall_hijacker
+
     architecture = libcontext.arch
 
     match architecture:
         case "amd64":
+            if _amd64_syscall_hijacker is None:
+                from libdebug.architectures.amd64.amd64_syscall_hijacker import (
+                    Amd64SyscallHijacker,
+                )
+
+                _amd64_syscall_hijacker = Amd64SyscallHijacker()
+
             return _amd64_syscall_hijacker
         case _:
             raise NotImplementedError(f"Architecture {architecture} not available.")
@@ -5,7 +5,9 @@
 #
 
 from typing import TYPE_CHECKING, Tuple, Any
+from libdebug.utils.libcontext import libcontext
 from libdebug.utils.print_style import PrintStyle
+from libdebug.utils.syscall_decoders import get_syscall_decoders
 from libdebug.utils.syscall_utils import (
     resolve_syscall_name,
     resolve_syscall_arguments,
@@ -14,6 +16,33 @@ from libdebug.utils.syscall_utils import (
 if TYPE_CHECKING:
     from libdebug.state.thread_context import ThreadContext
 
+# The maximum number of bytes printed for each string or buffer
+PPRINT_MAX_SIZE = 32
+
+
+def _format_decoded(value: Any) -> str:
+    """Formats a decoded syscall argument."""
+    if isinstance(value, bytes):
+        if len(value) > PPRINT_MAX_SIZE:
+            return f"{value[:PPRINT_MAX_SIZE]!r}..."
+        return repr(value)
+    elif isinstance(value, list):
+        return f"[{', '.join(_format_decoded(entry) for entry in value)}]"
+    elif isinstance(value, dict):
+        return f"{{{', '.join(f'{key}={_format_decoded(entry)}' for key, entry in value.items())}}}"
+    else:
+        return str(value)
+
+
+def _format_argument(arg: str, value: int, decoded: dict[str, Any]) -> str:
+    """Formats a syscall argument, followed by the decoded value of the pointer if available."""
+    name = arg.rsplit("*", 1)[-1].split()[-1]
+
+    if name in decoded:
+        return f"{arg} = {PrintStyle.BRIGHT_YELLOW}0x{value:x} {_format_decoded(decoded[name])}{PrintStyle.DEFAULT_COLOR}"
+
+    return f"{arg} = {PrintStyle.BRIGHT_YELLOW}0x{value:x}{PrintStyle.DEFAULT_COLOR}"
+
 def pprint_on_enter(d: "ThreadContext", syscall_number: int, **kwargs: Any):
     """Function that will be called when a syscall is entered in pretty print mode.
 
@@ -44,8 +73,9 @@ def pprint_on_enter(d: "ThreadContext", syscall_number: int, **kwargs: Any):
             if arg is not None
         ]
     else:
+        decoded = d.syscall_decoded_args
         entries = [
-            f"{arg} = {PrintStyle.BRIGHT_YELLOW}0x{value:x}{PrintStyle.DEFAULT_COLOR}"
+            _format_argument(arg, value, decoded)
             for arg, value in zip(syscall_args, values)
             if arg is not None
         ]
@@ -68,16 +98,28 @@ def pprint_on_enter(d: "ThreadContext", syscall_number: int, **kwargs: Any):
         )
 
 
-def pprint_on_exit(syscall_return: int | Tuple[int, int]):
+def pprint_on_exit(syscall_return: int | Tuple[int, int], thread: "ThreadContext | None" = None):
     """Function that will be called when a syscall is exited in pretty print mode.
 
     Args:
         syscall_return (int | list[int]): the syscall return value.
+        thread (ThreadContext, optional): the thread context, used to print the decoded output arguments.
     """
 
+    outputs = ""
+    if thread is not None:
+        decoded = thread.syscall_decoded_args
+        entries = [
+            f"{name} = {PrintStyle.BRIGHT_YELLOW}{_format_decoded(decoded[name])}{PrintStyle.RESET}"
+            for _, name, _, is_input in get_syscall_decoders(libcontext.arch, thread.syscall_number)
+            if not is_input and name in decoded
+        ]
+        if entries:
+            outputs = f" ({', '.join(entries)})"
+
     if isinstance(syscall_return, Tuple):
         print(
-            f"{PrintStyle.YELLOW}{PrintStyle.STRIKE}0x{syscall_return[0]:x}{PrintStyle.RESET} {PrintStyle.YELLOW}0x{syscall_return[1]:x}{PrintStyle.RESET}"
+            f"{PrintStyle.YELLOW}{PrintStyle.STRIKE}0x{syscall_return[0]:x}{PrintStyle.RESET} {PrintStyle.YELLOW}0x{syscall_return[1]:x}{PrintStyle.RESET}{outputs}"
         )
     else:
-        print(f"{PrintStyle.YELLOW}0x{syscall_return:x}{PrintStyle.RESET}")
+        print(f"{PrintStyle.YELLOW}0x{syscall_return:x}{PrintStyle.RESET}{outputs}")
@@ -0,0 +1,265 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from collections import deque
+from typing import IO, TYPE_CHECKING
+
+from libdebug.builtin.syscall_tracer import (
+    SYSCALL_ENTRY_RETURN,
+    SyscallTraceWriter,
+    _to_json,
+    read_syscall_trace,
+)
+from libdebug.liblog import liblog
+from libdebug.utils.libcontext import libcontext
+from libdebug.utils.syscall_decoders import (
+    MAX_ARRAY_ENTRIES,
+    ArgumentKind,
+    decode_syscall_arguments,
+    get_syscall_decoders,
+)
+from libdebug.utils.syscall_utils import resolve_syscall_name, resolve_syscall_number
+
+if TYPE_CHECKING:
+    from libdebug.state.thread_context import ThreadContext
+
+# The syscalls whose results depend on the environment rather than on the process. The clocks are left out, as
+# libc reads them through the vDSO without entering the kernel, so there is no syscall to record or replay
+DEFAULT_RECORDED_SYSCALLS = (
+    "read",
+    "pread64",
+    "readv",
+    "preadv",
+    "recvfrom",
+    "getrandom",
+)
+
+# The kernel skips a syscall whose number is invalid, and returns -ENOSYS without side effects
+SKIPPED_SYSCALL_NUMBER = 2**64 - 1
+
+
+def default_recorded_syscalls() -> set[int]:
+    """Returns the numbers of the syscalls recorded by default."""
+    numbers = set()
+
+    for name in DEFAULT_RECORDED_SYSCALLS:
+        try:
+            numbers.add(resolve_syscall_number(name))
+        except ValueError:
+            # The syscall does not exist on this architecture
+            pass
+
+    return numbers
+
+
+def _get_arguments(thread: ThreadContext) -> list[int]:
+    """Returns the values of the syscall arguments of a thread."""
+    return [
+        thread.syscall_arg0,
+        thread.syscall_arg1,
+        thread.syscall_arg2,
+        thread.syscall_arg3,
+        thread.syscall_arg4,
+        thread.syscall_arg5,
+    ]
+
+
+def _from_json(value):
+    """Converts the latin-1 strings of a recorded output back to bytes."""
+    if isinstance(value, list):
+        return [entry.encode("latin-1") for entry in value]
+
+    return value.encode("latin-1")
+
+
+def _write_outputs(thread: ThreadContext, number: int, values: list[int], outputs: dict[str, bytes | list[bytes]]):
+    """Writes the recorded outputs of a syscall to the memory its arguments point to."""
+    memory = thread.memory
+
+    for index, name, kind, is_input in get_syscall_decoders(libcontext.arch, number):
+        if is_input or name not in outputs or not values[index]:
+            continue
+
+        data = outputs[name]
+
+        match kind:
+            case ArgumentKind.IOVEC:
+                # The recorded data is scattered over the buffers of the current call
+                data = b"".join(data)
+                vectors = thread.context.debugging_interface.read_memory(
+                    values[index], min(values[index + 1], MAX_ARRAY_ENTRIES) * 16
+                )
+
+                for base, length in struct.iter_unpack("<QQ", vectors[: len(vectors) // 16 * 16]):
+                    if not data:
+                        break
+                    if length:
+                        memory.write(base, data[:length])
+                        data = data[length:]
+            case ArgumentKind.SOCKADDR:
+                # The kernel also stores the length of the address
+                memory.write(values[index + 1], struct.pack("<i", len(data)))
+                if data:
+                    memory.write(values[index], data)
+            case _:
+                if data:
+                    memory.write(values[index], data)
+
+
+class SyscallRecorder:
+    """Records the results of the syscalls of the process, so that they can be replayed by a `SyscallReplayer`.
+
+    Each record holds the thread id (`tid`), the syscall `number` and `name`, its signed return value (`return`)
+    and the data it wrote to the memory pointed to by its arguments (`outputs`, keyed by argument name, with buffers
+    as latin-1 strings).
+
+    Attributes:
+        syscalls (set[int]): The syscall numbers to record.
+        writer (SyscallTraceWriter): The writer of the recording.
+    """
+
+    def __init__(self, writer: SyscallTraceWriter, syscalls: set[int]):
+        self.writer = writer
+        self.syscalls = syscalls
+
+        # The syscalls entered but not yet exited, by thread id, None if they are not recorded
+        self._pending: dict[int, int | None] = {}
+
+    def is_entering(self, thread: ThreadContext) -> bool:
+        """Returns whether the thread is stopped on the entry of a syscall, before the hooks run."""
+        if thread.thread_id in self._pending:
+            return False
+
+        return thread.syscall_return == SYSCALL_ENTRY_RETURN
+
+    def on_enter(self, thread: ThreadContext):
+        """Tracks the entry of a syscall, after the syscall hooks have run."""
+        number = thread.syscall_number
+        self._pending[thread.thread_id] = number if number in self.syscalls else None
+
+    def on_exit(self, thread: ThreadContext):
+        """Records the results of a syscall, before the syscall hooks run."""
+        number = self._pending.pop(thread.thread_id, None)
+
+        if number is None:
+            return
+
+        return_value = thread.syscall_return
+        if return_value >= 1 << 63:
+            return_value -= 1 << 64
+
+        outputs = {}
+
+        if return_value >= 0:
+            outputs = decode_syscall_arguments(
+                thread.context.debugging_interface.read_memory,
+                number,
+                _get_arguments(thread),
+                return_value,
+                sys.maxsize,
+                inputs=False,
+                raw=True,
+            )
+
+        self.writer.write(
+            {
+                "tid": thread.thread_id,
+                "number": number,
+                "name": resolve_syscall_name(number),
+                "return": return_value,
+                "outputs": _to_json(outputs),
+            }
+        )
+
+    def close(self):
+        """Closes the recording."""
+        self._pending.clear()
+        self.writer.close()
+
+
+class SyscallReplayer:
+    """Emulates the recorded syscalls of the process, instead of executing them.
+
+    The recorded results of each syscall are consumed in order. A syscall is skipped on entry and, on exit, its
+    return value and outputs are injected. Once the results of a syscall run out, it is executed normally.
+
+    Attributes:
+        syscalls (set[int]): The syscall numbers to emulate.
+    """
+
+    def __init__(self, records: list[dict], syscalls: set[int] | None = None):
+        self._records: dict[int, deque[dict]] = {}
+
+        for record in records:
+            self._records.setdefault(record["number"], deque()).append(record)
+
+        self.syscalls = set(self._records) if syscalls is None else syscalls
+
+        # The syscalls entered but not yet exited, by thread id, with the record to inject if they are emulated
+        self._pending: dict[int, tuple[int, dict | None]] = {}
+
+    @property
+    def remaining(self) -> int:
+        """The number of recorded syscalls that have not been replayed yet."""
+        return sum(len(records) for number, records in self._records.items() if number in self.syscalls)
+
+    def is_entering(self, thread: ThreadContext) -> bool:
+        """Returns whether the thread is stopped on the entry of a syscall, before the hooks run."""
+        if thread.thread_id in self._pending:
+            return False
+
+        return thread.syscall_return == SYSCALL_ENTRY_RETURN
+
+    def on_enter(self, thread: ThreadContext):
+        """Skips a syscall that has a recorded result, after the syscall hooks have run."""
+        number = thread.syscall_number
+        records = self._records.get(number) if number in self.syscalls else None
+
+        if not records:
+            if records is not None:
+                liblog.debugger("No recorded results left for syscall %d, executing it", number)
+            self._pending[thread.thread_id] = (number, None)
+            return
+
+        self._pending[thread.thread_id] = (number, records.popleft())
+        thread.syscall_number = SKIPPED_SYSCALL_NUMBER
+
+    def on_exit(self, thread: ThreadContext):
+        """Injects the recorded result of a skipped syscall, before the syscall hooks run."""
+        number, record = self._pending.pop(thread.thread_id, (None, None))
+
+        if record is None:
+            return
+
+        thread.syscall_number = number
+
+        if record["return"] >= 0:
+            outputs = {name: _from_json(value) for name, value in record["outputs"].items()}
+            _write_outputs(thread, number, _get_arguments(thread), outputs)
+
+        thread.syscall_return = record["return"] & (2**64 - 1)
+
+    def close(self):
+        """Forgets the syscalls that have not been replayed."""
+        self._pending.clear()
+        self._records.clear()
+
+
+def load_syscall_recording(source: str | os.PathLike | IO[bytes]) -> list[dict]:
+    """Reads all the records of a syscall recording.
+
+    Args:
+        source (str | os.PathLike | IO[bytes]): The path of the recording, or a binary file object.
+
+    Returns:
+        list[dict]: The records, in the order they were written.
+    """
+    return list(read_syscall_trace(source))
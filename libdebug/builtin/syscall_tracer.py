@@ -0,0 +1,322 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import errno
+import gzip
+import json
+import lzma
+import os
+import time
+from collections.abc import Iterator
+from queue import Empty, SimpleQueue
+from threading import Thread
+from typing import IO, TYPE_CHECKING
+
+from libdebug.utils.syscall_decoders import decode_syscall_arguments
+from libdebug.utils.syscall_utils import resolve_syscall_arguments, resolve_syscall_name
+
+if TYPE_CHECKING:
+    from libdebug.state.thread_context import ThreadContext
+
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+
+# Records are written in batches of at most this many lines
+WRITER_BATCH_SIZE = 1024
+
+# The kernel sets the return value register to -ENOSYS before stopping on a syscall entry
+SYSCALL_ENTRY_RETURN = 2**64 - errno.ENOSYS
+
+_STOP = object()
+
+
+def _to_json(value):
+    """Converts a decoded syscall argument to JSON-serializable values, with bytes as latin-1 strings."""
+    if isinstance(value, bytes):
+        return value.decode("latin-1")
+    elif isinstance(value, list):
+        return [_to_json(entry) for entry in value]
+    elif isinstance(value, dict):
+        return {key: _to_json(entry) for key, entry in value.items()}
+    else:
+        return value
+
+
+def _open_trace(path: str | os.PathLike, mode: str, compression: str | None) -> IO[bytes]:
+    """Opens a trace file with the specified compression, either None, "gzip" or "lzma"."""
+    match compression:
+        case None:
+            return open(path, mode + "b", buffering=1 << 20)
+        case "gzip":
+            return gzip.open(path, mode + "b")
+        case "lzma":
+            return lzma.open(path, mode + "b")
+        case _:
+            raise ValueError(f"Unsupported compression {compression}. Please use gzip or lzma.")
+
+
+def _compression_from_suffix(path: str | os.PathLike) -> str | None:
+    """Infers the compression of a trace file from its suffix."""
+    suffix = os.path.splitext(os.fspath(path))[1]
+
+    match suffix:
+        case ".gz":
+            return "gzip"
+        case ".xz" | ".lzma":
+            return "lzma"
+        case _:
+            return None
+
+
+class SyscallTraceWriter:
+    """Writes syscall records as JSON lines from a background thread, so that the debugged process is not slowed
+    down by serialization, compression and disk writes."""
+
+    def __init__(self, sink: str | os.PathLike | IO[bytes], compression: str | None = None):
+        """Opens the sink and starts the writer thread.
+
+        Args:
+            sink (str | os.PathLike | IO[bytes]): The path of the trace file, or a binary file object.
+            compression (str, optional): The compression of the trace file, "gzip" or "lzma". Inferred from the
+                suffix of the path if not specified. Defaults to None.
+        """
+        if hasattr(sink, "write"):
+            self._file = sink
+            self._owns_file = False
+        else:
+            if compression is None:
+                compression = _compression_from_suffix(sink)
+            self._file = _open_trace(sink, "w", compression)
+            self._owns_file = True
+
+        self._queue = SimpleQueue()
+        self._error: BaseException | None = None
+        self.records_written = 0
+
+        self._thread = Thread(target=self._write_loop, name="libdebug-syscall-trace", daemon=True)
+        self._thread.start()
+
+    def _write_loop(self):
+        """Serializes and writes the queued records until the writer is closed."""
+        encoder = json.JSONEncoder(separators=(",", ":"))
+        stopping = False
+
+        while not stopping:
+            batch = [self._queue.get()]
+
+            while len(batch) < WRITER_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+
+            if batch[-1] is _STOP:
+                batch.pop()
+                stopping = True
+
+            if not batch or self._error is not None:
+                continue
+
+            try:
+                self._file.write("".join(encoder.encode(record) + "\n" for record in batch).encode())
+                self.records_written += len(batch)
+            except Exception as e:
+                # Keep draining the queue, the error is reported on close
+                self._error = e
+
+    def write(self, record: dict):
+        """Queues a record to be written.
+
+        Args:
+            record (dict): The record, which must be JSON serializable.
+        """
+        self._queue.put(record)
+
+    def close(self):
+        """Writes the queued records and closes the sink.
+
+        Raises:
+            OSError: If writing the trace failed.
+        """
+        self._queue.put(_STOP)
+        self._thread.join()
+
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+        if self._error is not None:
+            raise OSError(f"Failed to write the syscall trace: {self._error}") from self._error
+
+
+def read_syscall_trace(source: str | os.PathLike | IO[bytes]) -> Iterator[dict]:
+    """Reads a syscall trace lazily, one record at a time.
+
+    Compressed traces are detected automatically.
+
+    Args:
+        source (str | os.PathLike | IO[bytes]): The path of the trace file, or a binary file object.
+
+    Yields:
+        dict: The syscall records, in the order they were written.
+    """
+    if hasattr(source, "read"):
+        trace = source
+        owned = False
+    else:
+        with open(source, "rb") as trace_file:
+            magic = trace_file.read(len(XZ_MAGIC))
+
+        if magic.startswith(GZIP_MAGIC):
+            compression = "gzip"
+        elif magic.startswith(XZ_MAGIC):
+            compression = "lzma"
+        else:
+            compression = None
+
+        trace = _open_trace(source, "r", compression)
+        owned = True
+
+    try:
+        for line in trace:
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        if owned:
+            trace.close()
+
+
+class SyscallTracer:
+    """Records every syscall executed by the debugged process into a trace.
+
+    Each record holds the thread id (`tid`), the wall-clock time of the syscall entry in nanoseconds (`timestamp`),
+    its duration in nanoseconds (`duration`), the syscall `number` and `name`, its arguments (`args`), its signed
+    return value (`return`, None if the syscall never returned) and, if enabled, the strings and buffers pointed
+    to by its arguments (`decoded`, keyed by argument name, with strings and buffers as latin-1 strings).
+
+    Attributes:
+        syscalls (set[int] | None): The syscall numbers to trace, None to trace all of them.
+        decode (bool): Whether to read the strings and buffers pointed to by the arguments.
+        max_decoded_size (int): The maximum number of bytes to read for each string or buffer.
+        writer (SyscallTraceWriter): The writer of the trace.
+    """
+
+    def __init__(
+        self,
+        writer: SyscallTraceWriter,
+        syscalls: set[int] | None = None,
+        decode: bool = True,
+        max_decoded_size: int = 256,
+    ):
+        self.writer = writer
+        self.syscalls = syscalls
+        self.decode = decode
+        self.max_decoded_size = max_decoded_size
+
+        # The records of the syscalls entered but not yet exited, by thread id
+        self._pending: dict[int, tuple[dict | None, int]] = {}
+
+    def is_entering(self, thread: ThreadContext) -> bool:
+        """Returns whether the thread is stopped on the entry of a syscall, before the hooks run."""
+        if thread.thread_id in self._pending:
+            return False
+
+        # Tracing may have started while the thread was inside a syscall
+        return thread.syscall_return == SYSCALL_ENTRY_RETURN
+
+    def on_enter(self, thread: ThreadContext):
+        """Records the entry of a syscall, after the syscall hooks have run."""
+        number = thread.syscall_number
+
+        if self.syscalls is not None and number not in self.syscalls:
+            # Exits must still be matched with their entries
+            self._pending[thread.thread_id] = (None, 0)
+            return
+
+        try:
+            name = resolve_syscall_name(number)
+            signature = resolve_syscall_arguments(number)
+        except ValueError:
+            name, signature = None, ("",) * 6
+
+        values = [
+            thread.syscall_arg0,
+            thread.syscall_arg1,
+            thread.syscall_arg2,
+            thread.syscall_arg3,
+            thread.syscall_arg4,
+            thread.syscall_arg5,
+        ][: len(signature)]
+
+        record = {
+            "tid": thread.thread_id,
+            "timestamp": time.time_ns(),
+            "duration": None,
+            "number": number,
+            "name": name,
+            "args": values,
+            "return": None,
+        }
+
+        if self.decode and name is not None:
+            record["decoded"] = self._decode_arguments(thread, number, values, None)
+
+        self._pending[thread.thread_id] = (record, time.perf_counter_ns())
+
+    def on_exit(self, thread: ThreadContext):
+        """Records the exit of a syscall, before the syscall hooks run."""
+        record, entry_time = self._pending.pop(thread.thread_id, (None, 0))
+
+        if record is None:
+            return
+
+        return_value = thread.syscall_return
+        if return_value >= 1 << 63:
+            return_value -= 1 << 64
+
+        record["return"] = return_value
+        record["duration"] = time.perf_counter_ns() - entry_time
+
+        if self.decode and record["name"] is not None and return_value >= 0:
+            record["decoded"].update(
+                self._decode_arguments(thread, record["number"], record["args"], return_value)
+            )
+
+        self.writer.write(record)
+
+    def _decode_arguments(
+        self,
+        thread: ThreadContext,
+        number: int,
+        values: list[int],
+        return_value: int | None,
+    ) -> dict:
+        """Reads the strings, buffers and structures pointed to by the arguments of a syscall.
+
+        Input arguments are read on entry, output arguments on exit, when the kernel has filled them.
+        """
+        decoded = decode_syscall_arguments(
+            thread.context.debugging_interface.read_memory,
+            number,
+            values,
+            return_value,
+            self.max_decoded_size,
+            inputs=return_value is None,
+        )
+
+        return _to_json(decoded)
+
+    def close(self):
+        """Writes the syscalls that never returned, such as exit_group, and closes the trace."""
+        for record, _ in self._pending.values():
+            if record is not None:
+                self.writer.write(record)
+
+        self._pending.clear()
+        self.writer.close()
@@ -49,6 +49,15 @@ if platform.machine() == "x86_64":
     #define IS_SW_BREAKPOINT(instruction) (instruction == 0xCC)
     """
 
+    syscall_define = """
+    #define SYSCALL_NUMBER(regs) (regs.orig_rax)
+    #define SYSCALL_RETURN(regs) (regs.rax)
+    #define INSTALL_SYSCALL(instruction) ((instruction & 0xFFFFFFFFFFFF0000) | 0x050F)
+
+    // clone(CLONE_PARENT | SIGCHLD, 0, 0, 0, 0), so that the child is reaped by the debugger
+    #define PREPARE_FORK(regs) do { regs.rax = 56; regs.rdi = 0x8000 | 17; regs.rsi = 0; regs.rdx = 0; regs.r10 = 0; regs.r8 = 0; } while (0)
+    """
+
     finish_define = """
     #define IS_RET_INSTRUCTION(instruction) (instruction == 0xC3 || instruction == 0xCB || instruction == 0xC2 || instruction == 0xCA)
     
@@ -101,6 +110,9 @@ ffibuilder.cdef(
         int tid;
         struct user_regs_struct regs;
         int signal_to_deliver;
+        _Bool in_syscall;
+        _Bool syscall_forwarded;
+        uint64_t syscall_entry_ns;
         struct thread *next;
     };
 
@@ -110,10 +122,28 @@ ffibuilder.cdef(
         struct thread_status *next;
     };
 
+    #define SYSCALL_STATS_SIZE 512
+
+    struct syscall_stat {
+        uint64_t calls;
+        uint64_t errors;
+        uint64_t total_ns;
+    };
+
+    struct syscall_stats {
+        int tid;
+        struct syscall_stat table[SYSCALL_STATS_SIZE];
+        struct syscall_stats *next;
+    };
+
     struct global_state {
         struct thread *t_HEAD;
         struct software_breakpoint *b_HEAD;
+        struct syscall_stats *s_HEAD;
         _Bool syscall_hooks_enabled;
+        _Bool syscall_stats_enabled;
+        _Bool syscall_forward_all;
+        _Bool syscall_forward[SYSCALL_STATS_SIZE];
     };
 
 
@@ -140,6 +170,8 @@ ffibuilder.cdef(
 
     int exact_finish(struct global_state *state, int tid);
 
+    int fork_template(int pid, struct user_regs_struct *regs);
+
     struct thread_status *wait_all_and_update_regs(struct global_state *state, int pid);
     void free_thread_status_list(struct thread_status *head);
 
@@ -152,13 +184,16 @@ ffibuilder.cdef(
     void enable_breakpoint(struct global_state *state, uint64_t address);
     void disable_breakpoint(struct global_state *state, uint64_t address);
     void free_breakpoints(struct global_state *state);
+
+    void enable_syscall_stats(struct global_state *state, _Bool enabled);
+    void free_syscall_stats(struct global_state *state);
 """
 )
 
 with open("libdebug/cffi/ptrace_cffi_source.c") as f:
     ffibuilder.set_source(
         "libdebug.cffi._ptrace_cffi",
-        breakpoint_define + finish_define + f.read(),
+        breakpoint_define + syscall_define + finish_define + f.read(),
         libraries=[],
     )
 
@@ -13,6 +13,12 @@
 #include <sys/types.h>
 #include <sys/user.h>
 #include <sys/wait.h>
+#include <time.h>
+
+// Syscalls with a higher number are never counted
+#define SYSCALL_STATS_SIZE 512
+
+#define IS_SYSCALL_STOP(status) (WIFSTOPPED(status) && WSTOPSIG(status) == (SIGTRAP | 0x80))
 
 struct ptrace_hit_bp {
     int pid;
@@ -33,6 +39,9 @@ struct thread {
     int tid;
     struct user_regs_struct regs;
     int signal_to_deliver;
+    _Bool in_syscall;
+    _Bool syscall_forwarded;
+    uint64_t syscall_entry_ns;
     struct thread *next;
 };
 
@@ -42,10 +51,26 @@ struct thread_status {
     struct thread_status *next;
 };
 
+struct syscall_stat {
+    uint64_t calls;
+    uint64_t errors;
+    uint64_t total_ns;
+};
+
+struct syscall_stats {
+    int tid;
+    struct syscall_stat table[SYSCALL_STATS_SIZE];
+    struct syscall_stats *next;
+};
+
 struct global_state {
     struct thread *t_HEAD;
     struct software_breakpoint *b_HEAD;
+    struct syscall_stats *s_HEAD;
     _Bool syscall_hooks_enabled;
+    _Bool syscall_stats_enabled;
+    _Bool syscall_forward_all;
+    _Bool syscall_forward[SYSCALL_STATS_SIZE];
 };
 
 struct user_regs_struct *register_thread(struct global_state *state, int tid)
@@ -60,6 +85,9 @@ struct user_regs_struct *register_thread(struct global_state *state, int tid)
     t = malloc(sizeof(struct thread));
     t->tid = tid;
     t->signal_to_deliver = 0;
+    t->in_syscall = 0;
+    t->syscall_forwarded = 0;
+    t->syscall_entry_ns = 0;
 
     ptrace(PTRACE_GETREGS, tid, NULL, &t->regs);
 
@@ -251,6 +279,8 @@ long singlestep(struct global_state *state, int tid)
         if (t->tid == tid) {
             signal_to_deliver = t->signal_to_deliver;
             t->signal_to_deliver = 0;
+            // A syscall entered before the step exits without a syscall-exit-stop
+            t->in_syscall = 0;
         }
         t = t->next;
     }
@@ -280,6 +310,8 @@ int step_until(struct global_state *state, int tid, uint64_t addr, int max_steps
         return -1;
     }
 
+    stepping_thread->in_syscall = 0;
+
     while (max_steps == -1 || count < max_steps) {
         if (ptrace(PTRACE_SINGLESTEP, tid, NULL, NULL)) return -1;
 
@@ -366,13 +398,110 @@ int prepare_for_run(struct global_state *state, int pid)
     return status;
 }
 
+uint64_t monotonic_ns(void)
+{
+    struct timespec ts;
+
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+
+    return (uint64_t)ts.tv_sec * 1000000000 + ts.tv_nsec;
+}
+
+struct syscall_stats *get_syscall_stats(struct global_state *state, int tid)
+{
+    struct syscall_stats *s = state->s_HEAD;
+
+    while (s != NULL) {
+        if (s->tid == tid) return s;
+        s = s->next;
+    }
+
+    // The table of a thread outlives the thread, so that it can be read after it exits
+    s = calloc(1, sizeof(struct syscall_stats));
+    s->tid = tid;
+    s->next = state->s_HEAD;
+    state->s_HEAD = s;
+
+    return s;
+}
+
+int account_syscall_stop(struct global_state *state, int tid, uint64_t now)
+{
+    // Returns 1 if the stop does not need to be reported to the debugger
+    struct thread *t = state->t_HEAD;
+    while (t != NULL && t->tid != tid) t = t->next;
+
+    if (t == NULL || ptrace(PTRACE_GETREGS, tid, NULL, &t->regs)) return 0;
+
+    if (!t->in_syscall) {
+        // The kernel sets the return value to -ENOSYS before the syscall-enter-stop,
+        // anything else is the exit of a syscall entered before the stats were enabled
+        if (SYSCALL_RETURN(t->regs) != (unsigned long)-ENOSYS) return 0;
+
+        uint64_t number = SYSCALL_NUMBER(t->regs);
+
+        t->in_syscall = 1;
+        t->syscall_entry_ns = now;
+        t->syscall_forwarded = state->syscall_forward_all || number >= SYSCALL_STATS_SIZE ||
+                               state->syscall_forward[number];
+
+        return !t->syscall_forwarded;
+    }
+
+    t->in_syscall = 0;
+
+    // The hooks may have changed the syscall on entry, the register holds the one the kernel executed
+    uint64_t number = SYSCALL_NUMBER(t->regs);
+
+    if (number < SYSCALL_STATS_SIZE) {
+        struct syscall_stat *stat = &get_syscall_stats(state, tid)->table[number];
+
+        stat->calls++;
+        stat->total_ns += now - t->syscall_entry_ns;
+
+        if (SYSCALL_RETURN(t->regs) >= (unsigned long)-4095) stat->errors++;
+    }
+
+    return !t->syscall_forwarded;
+}
+
+void enable_syscall_stats(struct global_state *state, _Bool enabled)
+{
+    // Syscalls already in progress were not seen entering, so they are not counted
+    struct thread *t = state->t_HEAD;
+    while (t != NULL) {
+        t->in_syscall = 0;
+        t = t->next;
+    }
+
+    state->syscall_stats_enabled = enabled;
+}
+
+void free_syscall_stats(struct global_state *state)
+{
+    struct syscall_stats *s = state->s_HEAD;
+    struct syscall_stats *next;
+
+    while (s != NULL) {
+        next = s->next;
+        free(s);
+        s = next;
+    }
+
+    state->s_HEAD = NULL;
+}
+
 int cont_all_and_set_bps(struct global_state *state, int pid)
 {
     int status = prepare_for_run(state, pid);
 
+    // the time spent stopped in the debugger does not count towards the syscalls
+    uint64_t now = state->syscall_stats_enabled ? monotonic_ns() : 0;
+
     // continue the execution of all the threads
     struct thread *t = state->t_HEAD;
     while (t != NULL) {
+        t->syscall_entry_ns = now;
         if (ptrace(state->syscall_hooks_enabled ? PTRACE_SYSCALL : PTRACE_CONT, t->tid, NULL, t->signal_to_deliver))
             fprintf(stderr, "ptrace_cont failed for thread %d with signal %d: %s\\n", t->tid, t->signal_to_deliver,
                     strerror(errno));
@@ -391,12 +520,21 @@ struct thread_status *wait_all_and_update_regs(struct global_state *state, int p
     head->next = NULL;
 
     // The first element is the first status we get from polling with waitpid
-    head->tid = waitpid(-getpgid(pid), &head->status, 0);
+    while (1) {
+        head->tid = waitpid(-getpgid(pid), &head->status, 0);
 
-    if (head->tid == -1) {
-        free(head);
-        perror("waitpid");
-        return NULL;
+        if (head->tid == -1) {
+            free(head);
+            perror("waitpid");
+            return NULL;
+        }
+
+        if (!state->syscall_stats_enabled || !IS_SYSCALL_STOP(head->status)) break;
+
+        // Syscalls without hooks are only counted, the thread is resumed without stopping the others
+        if (!account_syscall_stop(state, head->tid, monotonic_ns())) break;
+
+        if (ptrace(PTRACE_SYSCALL, head->tid, NULL, NULL)) break;
     }
 
     // We must interrupt all the other threads with a SIGSTOP
@@ -412,13 +550,17 @@ struct thread_status *wait_all_and_update_regs(struct global_state *state, int p
                 // Wait for the thread to stop
                 temp_tid = waitpid(t->tid, &temp_status, 0);
 
-                // Register the status of the thread, as it might contain useful
-                // information
-                struct thread_status *ts = malloc(sizeof(struct thread_status));
-                ts->tid = temp_tid;
-                ts->status = temp_status;
-                ts->next = head;
-                head = ts;
+                // Syscalls without hooks are only counted, the thread stays stopped but the stop is not reported
+                if (!state->syscall_stats_enabled || !IS_SYSCALL_STOP(temp_status) ||
+                    !account_syscall_stop(state, temp_tid, monotonic_ns())) {
+                    // Register the status of the thread, as it might contain useful
+                    // information
+                    struct thread_status *ts = malloc(sizeof(struct thread_status));
+                    ts->tid = temp_tid;
+                    ts->status = temp_status;
+                    ts->next = head;
+                    head = ts;
+                }
             }
         }
         t = t->next;
@@ -426,6 +568,10 @@ struct thread_status *wait_all_and_update_regs(struct global_state *state, int p
 
     // We keep polling but don't block, we want to get all the statuses we can
     while ((temp_tid = waitpid(-getpgid(pid), &temp_status, WNOHANG)) > 0) {
+        if (state->syscall_stats_enabled && IS_SYSCALL_STOP(temp_status) &&
+            account_syscall_stop(state, temp_tid, monotonic_ns()))
+            continue;
+
         struct thread_status *ts = malloc(sizeof(struct thread_status));
         ts->tid = temp_tid;
         ts->status = temp_status;
@@ -568,6 +714,78 @@ void free_breakpoints(struct global_state *state)
     state->b_HEAD = NULL;
 }
 
+int fork_template(int pid, struct user_regs_struct *regs)
+{
+    // Returns the pid of a copy of the stopped process, traced and stopped where the process is,
+    // with the specified registers, or -1 on error
+    uint64_t ip = INSTRUCTION_POINTER((*regs));
+    int status = 0, child = -1, in_syscall = 0;
+
+    errno = 0;
+    uint64_t instruction = ptrace(PTRACE_PEEKDATA, pid, (void *)ip, NULL);
+    if (errno) return -1;
+
+    // The syscall instruction temporarily replaces the current one
+    struct user_regs_struct injected = *regs;
+    PREPARE_FORK(injected);
+
+    if (ptrace(PTRACE_POKEDATA, pid, (void *)ip, INSTALL_SYSCALL(instruction))) return -1;
+
+    if (ptrace(PTRACE_SETREGS, pid, NULL, &injected)) goto restore;
+
+    while (1) {
+        if (ptrace(PTRACE_SYSCALL, pid, NULL, NULL)) goto restore;
+
+        if (waitpid(pid, &status, __WALL) == -1) goto restore;
+
+        if (!WIFSTOPPED(status)) {
+            errno = ESRCH;
+            return -1;
+        }
+
+        int event = status >> 16;
+
+        if (event == PTRACE_EVENT_FORK || event == PTRACE_EVENT_VFORK || event == PTRACE_EVENT_CLONE) {
+            unsigned long message = 0;
+            ptrace(PTRACE_GETEVENTMSG, pid, NULL, &message);
+            child = (int)message;
+        } else if (IS_SYSCALL_STOP(status)) {
+            if (in_syscall) break;
+            in_syscall = 1;
+        }
+        // Any other signal is discarded, the process is a frozen snapshot
+    }
+
+    if (ptrace(PTRACE_GETREGS, pid, NULL, &injected)) goto restore;
+
+    if ((int64_t)SYSCALL_RETURN(injected) < 0) {
+        errno = -(int64_t)SYSCALL_RETURN(injected);
+        child = -1;
+        goto restore;
+    }
+
+    // The child starts stopped by a SIGSTOP, with the syscall instruction in its copy of the memory
+    if (child <= 0 || waitpid(child, &status, __WALL) == -1) {
+        child = -1;
+        goto restore;
+    }
+
+    ptrace(PTRACE_POKEDATA, child, (void *)ip, instruction);
+    ptrace(PTRACE_SETREGS, child, NULL, regs);
+
+restore:
+    {
+        int saved_errno = errno;
+
+        ptrace(PTRACE_POKEDATA, pid, (void *)ip, instruction);
+        ptrace(PTRACE_SETREGS, pid, NULL, regs);
+
+        errno = saved_errno;
+    }
+
+    return child;
+}
+
 int exact_finish(struct global_state *state, int tid)
 {
     int status = prepare_for_run(state, tid);
@@ -586,6 +804,8 @@ int exact_finish(struct global_state *state, int tid)
         return -1;
     }
 
+    stepping_thread->in_syscall = 0;
+
     uint64_t previous_ip, current_ip;
     uint64_t opcode_window, first_opcode_byte;
 
@@ -0,0 +1,31 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(eq=False)
+class Checkpoint:
+    """A copy of the process, parked under ptrace, to which the process can be restored.
+
+    Attributes:
+        process_id (int): The process ID of the parked copy.
+        instruction_pointer (int): The instruction pointer of the process when the checkpoint was taken.
+        restore_count (int): The number of times the process has been restored to the checkpoint.
+        released (bool): Whether the parked copy has been killed.
+    """
+
+    process_id: int
+    instruction_pointer: int
+    restore_count: int = 0
+    released: bool = False
+
+    _state: Any = field(default=None, repr=False)
+    """The backend state tracking the parked copy."""
+
+    _registers: Any = field(default=None, repr=False)
+    """The registers of the parked copy."""
@@ -4,10 +4,11 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
+import os
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryMap:
     """A memory map of the target process.
 
@@ -18,6 +19,8 @@ class MemoryMap:
         size (int): The size of the memory map.
         offset (int): The relative offset of the memory map.
         backing_file (str): The backing file of the memory map, or the symbolic name of the memory map.
+        device (int): The device of the backing file, as in `os.stat_result.st_dev`.
+        inode (int): The inode of the backing file.
     """
 
     start: int = 0
@@ -31,6 +34,12 @@ class MemoryMap:
     backing_file: str = ""
     """The backing file of the memory map, such as 'libc.so.6', or the symbolic name of the memory map, such as '[stack]'."""
 
+    device: int = 0
+    """The device of the backing file, as in `os.stat_result.st_dev`, or 0 if the memory map is not file-backed."""
+
+    inode: int = 0
+    """The inode of the backing file, or 0 if the memory map is not file-backed."""
+
     @staticmethod
     def parse(map: str) -> "MemoryMap":
         """Parses a memory map from a /proc/pid/maps string representation.
@@ -42,18 +51,21 @@ class MemoryMap:
             MemoryMap: The parsed memory map.
         """
         try:
-            address, permissions, offset, *_, backing_file = map.split(" ", 6)
+            address, permissions, offset, device, inode, *_, backing_file = map.split(" ", 6)
             start = int(address.split("-")[0], 16)
             end = int(address.split("-")[1], 16)
             size = end - start
             int_offset = int(offset, 16)
+            major, minor = device.split(":")
+            int_device = os.makedev(int(major, 16), int(minor, 16))
+            int_inode = int(inode)
             backing_file = backing_file.strip()
         except ValueError:
             raise ValueError(
                 f"Invalid memory map: {map}. Please specify a valid memory map."
             )
 
-        return MemoryMap(start, end, permissions, size, int_offset, backing_file)
+        return MemoryMap(start, end, permissions, size, int_offset, backing_file, int_device, int_inode)
 
     def __repr__(self) -> str:
         return f"MemoryMap(start={hex(self.start)}, end={hex(self.end)}, permissions={self.permissions}, size={hex(self.size)}, offset={hex(self.offset)}, backing_file={self.backing_file})"
@@ -0,0 +1,204 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import os
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import repeat
+
+from libdebug.data.memory_map import MemoryMap
+
+# start-end permissions offset major:minor inode backing_file
+_MAPS_LINE = re.compile(
+    r"^([0-9a-f]+)-([0-9a-f]+) (....) ([0-9a-f]+) ([0-9a-f]+):([0-9a-f]+) ([0-9]+) +([^\n]*)", re.MULTILINE
+)
+
+
+class MemoryMaps(Sequence):
+    """The memory maps of the target process, sorted by address.
+
+    The maps are stored as parallel arrays of their fields, and the `MemoryMap` objects are only created when
+    they are accessed. The maps of a process never overlap, so every address query is a binary search on the
+    sorted start addresses instead of a scan of all the maps.
+    """
+
+    def __init__(self, maps: Iterable[MemoryMap] = ()):
+        """Initializes the collection.
+
+        Args:
+            maps (Iterable[MemoryMap], optional): The memory maps, sorted by start address as in /proc/pid/maps.
+        """
+        maps = list(maps)
+
+        self._starts = array("Q", [vmap.start for vmap in maps])
+        self._ends = array("Q", [vmap.end for vmap in maps])
+        self._offsets = array("Q", [vmap.offset for vmap in maps])
+        self._permissions = [vmap.permissions for vmap in maps]
+        self._backing_files = [vmap.backing_file for vmap in maps]
+        self._devices = array("Q", [vmap.device for vmap in maps])
+        self._inodes = array("Q", [vmap.inode for vmap in maps])
+        self._maps: list[MemoryMap | None] = maps
+
+    @staticmethod
+    def parse(maps: str) -> MemoryMaps:
+        """Parses the memory maps from the contents of a /proc/pid/maps file.
+
+        Args:
+            maps (str): The contents of the file.
+
+        Returns:
+            MemoryMaps: The parsed memory maps.
+        """
+        lines = _MAPS_LINE.findall(maps)
+
+        # Every line must be a valid map, the last one may lack the newline
+        if len(lines) != maps.count("\n") + (bool(maps) and not maps.endswith("\n")):
+            raise ValueError(
+                "Invalid memory maps. Please specify the contents of a /proc/pid/maps file."
+            )
+
+        if not lines:
+            return MemoryMaps()
+
+        starts, ends, permissions, offsets, majors, minors, inodes, backing_files = zip(*lines)
+
+        parsed = MemoryMaps()
+        parsed._starts = array("Q", map(int, starts, repeat(16)))
+        parsed._ends = array("Q", map(int, ends, repeat(16)))
+        parsed._offsets = array("Q", map(int, offsets, repeat(16)))
+        parsed._permissions = list(permissions)
+        parsed._backing_files = list(backing_files)
+        parsed._devices = array(
+            "Q", map(os.makedev, map(int, majors, repeat(16)), map(int, minors, repeat(16)))
+        )
+        parsed._inodes = array("Q", map(int, inodes))
+        parsed._maps = [None] * len(starts)
+
+        return parsed
+
+    def _materialize(self, index: int) -> MemoryMap:
+        """Returns the `MemoryMap` at the specified index, creating it on first access."""
+        vmap = self._maps[index]
+
+        if vmap is None:
+            start, end = self._starts[index], self._ends[index]
+            vmap = self._maps[index] = MemoryMap(
+                start,
+                end,
+                self._permissions[index],
+                end - start,
+                self._offsets[index],
+                self._backing_files[index],
+                self._devices[index],
+                self._inodes[index],
+            )
+
+        return vmap
+
+    def _select(self, indexes: Iterable[int]) -> MemoryMaps:
+        """Returns a new collection with the maps at the specified indexes."""
+        indexes = list(indexes)
+
+        selected = MemoryMaps()
+        selected._starts = array("Q", [self._starts[i] for i in indexes])
+        selected._ends = array("Q", [self._ends[i] for i in indexes])
+        selected._offsets = array("Q", [self._offsets[i] for i in indexes])
+        selected._permissions = [self._permissions[i] for i in indexes]
+        selected._backing_files = [self._backing_files[i] for i in indexes]
+        selected._devices = array("Q", [self._devices[i] for i in indexes])
+        selected._inodes = array("Q", [self._inodes[i] for i in indexes])
+        selected._maps = [self._maps[i] for i in indexes]
+
+        return selected
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._select(range(len(self))[index])
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("MemoryMaps index out of range")
+
+        return self._materialize(index)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[MemoryMap]:
+        return map(self._materialize, range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"MemoryMaps({list(self)})"
+
+    def _index_of(self, address: int) -> int:
+        """Returns the index of the map containing the specified address, or -1 if it is not mapped."""
+        index = bisect_right(self._starts, address) - 1
+
+        if index < 0 or address >= self._ends[index]:
+            return -1
+
+        return index
+
+    def find(self, address: int) -> MemoryMap | None:
+        """Returns the memory map containing the specified address.
+
+        Args:
+            address (int): The address to look up.
+
+        Returns:
+            MemoryMap | None: The memory map, or None if the address is not mapped.
+        """
+        index = self._index_of(address)
+
+        return self._materialize(index) if index >= 0 else None
+
+    def contains(self, address: int) -> bool:
+        """Checks whether the specified address belongs to any memory map.
+
+        Args:
+            address (int): The address to check.
+
+        Returns:
+            bool: True if the address is mapped, False otherwise.
+        """
+        return self._index_of(address) >= 0
+
+    def filter(self, perms: str | None = None, file: str | None = None) -> MemoryMaps:
+        """Returns the memory maps with the specified permissions and backing file.
+
+        Args:
+            perms (str, optional): The permissions the maps must have, such as `rx`. Defaults to None.
+            file (str, optional): The backing file of the maps, either its full path or a part of its name, such
+                as `libc` or `[stack]`. Defaults to None.
+
+        Returns:
+            MemoryMaps: The matching memory maps.
+        """
+        indexes = range(len(self))
+
+        if perms is not None:
+            indexes = [
+                i
+                for i in indexes
+                if all(p in self._permissions[i] for p in perms)
+            ]
+
+        if file is not None:
+            backing_files = self._backing_files
+            indexes = [
+                i
+                for i in indexes
+                if backing_files[i] == file
+                or (backing_files[i] and file in os.path.basename(backing_files[i]))
+            ]
+
+        return self._select(indexes)
@@ -0,0 +1,246 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import functools
+import struct
+from bisect import bisect_right
+
+# The unsigned integer type of each supported word size
+_WORD_TYPES = {1: "u1", 2: "<u2", 4: "<u4", 8: "<u8"}
+
+# The size of the blocks compared at once when NumPy is not available
+_BLOCK_SIZE = 4096
+
+# The header of a delta, followed by the regions of the resulting snapshot and by the changed ranges
+_DELTA_HEADER = struct.Struct("<4sII")
+_DELTA_MAGIC = b"LDMD"
+
+# A region or a changed range, as its start address and size
+_DELTA_RANGE = struct.Struct("<QI")
+
+
+@functools.cache
+def _numpy():
+    """Returns the NumPy module, or None if it is not installed. It is only imported on first use, as it is slow
+    to import."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def _changed_words(old: bytes, new: bytes, word_size: int) -> list[tuple[int, int]]:
+    """Returns the ranges of offsets of the words that differ between two buffers of the same size.
+
+    Args:
+        old (bytes): The first buffer.
+        new (bytes): The second buffer.
+        word_size (int): The size of the compared words.
+
+    Returns:
+        list[tuple[int, int]]: The (start, end) offsets of the runs of differing words.
+    """
+    if old == new:
+        return []
+
+    # A partial word at the end is compared as a whole word
+    padding = -len(old) % word_size
+    old += b"\0" * padding
+    new += b"\0" * padding
+
+    np = _numpy()
+
+    if np is not None:
+        dtype = np.dtype(_WORD_TYPES[word_size])
+        changed = np.frombuffer(old, dtype) != np.frombuffer(new, dtype)
+
+        # The edges of the runs are where the comparison result flips
+        edges = np.flatnonzero(np.diff(changed, prepend=False, append=False))
+        edges *= word_size
+
+        ranges = list(zip(edges[::2].tolist(), edges[1::2].tolist(), strict=True))
+    else:
+        ranges = []
+
+        for block in range(0, len(old), _BLOCK_SIZE):
+            if old[block : block + _BLOCK_SIZE] == new[block : block + _BLOCK_SIZE]:
+                continue
+
+            for offset in range(block, min(block + _BLOCK_SIZE, len(old)), word_size):
+                if old[offset : offset + word_size] == new[offset : offset + word_size]:
+                    continue
+
+                if ranges and ranges[-1][1] == offset:
+                    ranges[-1] = (ranges[-1][0], offset + word_size)
+                else:
+                    ranges.append((offset, offset + word_size))
+
+    if padding and ranges and ranges[-1][1] > len(old) - padding:
+        ranges[-1] = (ranges[-1][0], len(old) - padding)
+
+    return ranges
+
+
+class MemorySnapshot:
+    """A copy of some memory regions of the target process, taken at a given time.
+
+    Attributes:
+        regions (dict[int, bytes]): The content of each region, indexed by its start address.
+    """
+
+    def __init__(self, regions: dict[int, bytes]):
+        """Initializes the snapshot.
+
+        Args:
+            regions (dict[int, bytes]): The content of each region, indexed by its start address.
+        """
+        self.regions = dict(sorted(regions.items()))
+
+    def __repr__(self) -> str:
+        regions = ", ".join(f"{hex(start)}-{hex(start + len(content))}" for start, content in self.regions.items())
+        return f"MemorySnapshot({regions})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MemorySnapshot):
+            return NotImplemented
+
+        return self.regions == other.regions
+
+    def __contains__(self, address: int) -> bool:
+        return any(start <= address < start + len(content) for start, content in self.regions.items())
+
+    @property
+    def size(self) -> int:
+        """The total size of the regions in the snapshot."""
+        return sum(len(content) for content in self.regions.values())
+
+    def read(self, address: int, size: int) -> bytes:
+        """Reads memory from the snapshot.
+
+        Args:
+            address (int): The address to read from.
+            size (int): The number of bytes to read.
+
+        Returns:
+            bytes: The read bytes.
+        """
+        for start, content in self.regions.items():
+            if start <= address and address + size <= start + len(content):
+                return content[address - start : address - start + size]
+
+        raise ValueError(f"The range {hex(address)}-{hex(address + size)} is not in the snapshot.")
+
+    def diff(self, other: MemorySnapshot, word_size: int = 8) -> list[tuple[int, int]]:
+        """Returns the address ranges whose content differs in another snapshot.
+
+        Regions are matched by their start address. The part of a region that is missing from the other snapshot is
+        reported as changed as a whole.
+
+        Args:
+            other (MemorySnapshot): The snapshot to compare with.
+            word_size (int, optional): The granularity of the comparison, either 1, 2, 4 or 8 bytes. Defaults to 8.
+
+        Returns:
+            list[tuple[int, int]]: The (start, end) address ranges of the runs of differing words, in ascending order.
+        """
+        if word_size not in _WORD_TYPES:
+            raise ValueError("The word size must be either 1, 2, 4 or 8.")
+
+        ranges = []
+
+        for start in sorted(self.regions.keys() | other.regions.keys()):
+            old = self.regions.get(start, b"")
+            new = other.regions.get(start, b"")
+            common = min(len(old), len(new))
+
+            for run_start, run_end in _changed_words(old[:common], new[:common], word_size):
+                ranges.append((start + run_start, start + run_end))
+
+            if len(old) != len(new):
+                ranges.append((start + common, start + max(len(old), len(new))))
+
+        return ranges
+
+    def delta(self, other: MemorySnapshot, word_size: int = 8) -> bytes:
+        """Returns a compact binary delta that turns this snapshot into another one.
+
+        The delta stores the layout of the other snapshot and the content of the ranges that changed, so that a
+        long series of snapshots can be stored as a base snapshot followed by the delta of each one from the previous.
+
+        Args:
+            other (MemorySnapshot): The snapshot the delta leads to.
+            word_size (int, optional): The granularity of the comparison, either 1, 2, 4 or 8 bytes. Defaults to 8.
+
+        Returns:
+            bytes: The delta, to be passed to `apply_delta` on this snapshot.
+        """
+        if word_size not in _WORD_TYPES:
+            raise ValueError("The word size must be either 1, 2, 4 or 8.")
+
+        # Only what is in the other snapshot is needed, the regions that were removed or shrunk are not
+        changes = []
+
+        for start, new in other.regions.items():
+            old = self.regions.get(start, b"")
+            common = min(len(old), len(new))
+
+            for run_start, run_end in _changed_words(old[:common], new[:common], word_size):
+                changes.append((start + run_start, new[run_start:run_end]))
+
+            if len(new) > common:
+                changes.append((start + common, new[common:]))
+
+        delta = [_DELTA_HEADER.pack(_DELTA_MAGIC, len(other.regions), len(changes))]
+
+        for start, content in other.regions.items():
+            delta.append(_DELTA_RANGE.pack(start, len(content)))
+
+        for address, content in changes:
+            delta.append(_DELTA_RANGE.pack(address, len(content)))
+            delta.append(content)
+
+        return b"".join(delta)
+
+    def apply_delta(self, delta: bytes) -> MemorySnapshot:
+        """Rebuilds the snapshot a delta leads to from this snapshot.
+
+        Args:
+            delta (bytes): The delta returned by `delta` on this snapshot.
+
+        Returns:
+            MemorySnapshot: The snapshot the delta leads to.
+        """
+        magic, region_count, range_count = _DELTA_HEADER.unpack_from(delta)
+
+        if magic != _DELTA_MAGIC:
+            raise ValueError("Invalid memory snapshot delta.")
+
+        offset = _DELTA_HEADER.size
+        regions = {}
+
+        for _ in range(region_count):
+            start, size = _DELTA_RANGE.unpack_from(delta, offset)
+            offset += _DELTA_RANGE.size
+
+            content = bytearray(self.regions.get(start, b"")[:size])
+            content.extend(bytes(size - len(content)))
+            regions[start] = content
+
+        starts = list(regions)
+
+        for _ in range(range_count):
+            address, size = _DELTA_RANGE.unpack_from(delta, offset)
+            offset += _DELTA_RANGE.size
+
+            region = starts[bisect_right(starts, address) - 1]
+            regions[region][address - region : address - region + size] = delta[offset : offset + size]
+            offset += size
+
+        return MemorySnapshot({start: bytes(content) for start, content in regions.items()})
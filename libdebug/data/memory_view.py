@@ -4,11 +4,58 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
+import mmap
+import os
+import re
+from collections import deque
 from collections.abc import MutableSequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
+from libdebug.data.memory_maps import MemoryMaps
 from libdebug.liblog import liblog
 from libdebug.state.debugging_context import DebuggingContext, debugging_context
+from libdebug.utils.elf_utils import get_elf_reader, get_relocated_ranges
+from libdebug.utils.process_utils import (
+    clear_soft_dirty,
+    get_anonymous_pages,
+    get_soft_dirty_pages,
+    soft_dirty_supported,
+)
+
+# The size of the chunks in which memory is read when searching it
+SEARCH_CHUNK_SIZE = 1024 * 1024
+
+# The number of threads reading the chunks ahead of the search
+SEARCH_WORKERS = 4
+
+
+def _compile_pattern(pattern: bytes | str | int | list[int | None]) -> tuple[re.Pattern[bytes], int]:
+    """Compiles a search pattern into a regular expression.
+
+    Args:
+        pattern (bytes | str | int | list[int | None]): The bytes to search, a string to search encoded as UTF-8, an
+            integer to search as a 64-bit little-endian value, or a list of byte values where None matches any byte.
+
+    Returns:
+        tuple[re.Pattern[bytes], int]: The regular expression and the length of its matches.
+    """
+    if isinstance(pattern, int):
+        pattern = pattern.to_bytes(8, "little", signed=pattern < 0)
+    elif isinstance(pattern, str):
+        pattern = pattern.encode()
+
+    if isinstance(pattern, bytes | bytearray):
+        expression = re.escape(bytes(pattern))
+    elif isinstance(pattern, list):
+        expression = b"".join(b"." if byte is None else re.escape(bytes([byte])) for byte in pattern)
+    else:
+        raise TypeError("Invalid pattern type")
+
+    if not pattern:
+        raise ValueError("The pattern is empty.")
+
+    return re.compile(expression, re.DOTALL), len(pattern)
 
 
 class MemoryView(MutableSequence):
@@ -18,14 +65,21 @@ class MemoryView(MutableSequence):
     Attributes:
             getter (Callable[[int], bytes]): A function that reads memory from the target process.
             setter (Callable[[int, bytes], None]): A function that writes memory to the target process.
-            maps_provider (Callable[[], list[MemoryMap]]): A function that returns the memory maps of the target process.
+            maps_provider (Callable[[], MemoryMaps]): A function that returns the memory maps of the target process.
             unit_size (int, optional): The data size used by the getter and setter functions. Defaults to 8.
             align_to (int, optional): The address alignment that must be used when reading and writing memory. Defaults to 1.
+            file_backed_reads (bool): Whether reads of non-writable file-backed memory should be served from the backing file.
     """
 
     context: DebuggingContext
     """The debugging context of the target process."""
 
+    file_backed_reads: bool
+    """Whether reads of non-writable file-backed memory should be served from the backing file instead of the
+    target process. Pages written by the debugger, pages holding software breakpoints, pages relocated by the
+    dynamic loader and pages the process holds a private copy of are always read from the target process, as is
+    memory whose backing file was deleted or replaced since it was mapped."""
+
     def __init__(
         self,
         getter: Callable[[int], bytes],
@@ -41,6 +95,341 @@ class MemoryView(MutableSequence):
         self.context = debugging_context()
         self.maps_provider = self.context.debugging_interface.maps
 
+        self.file_backed_reads = False
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self._file_mappings: dict[str, tuple[mmap.mmap | None, tuple[int, int, int, int]]] = {}
+        self._written_pages: set[int] = set()
+        self._written_pages_pid = 0
+        self._tracked_writes_pid = 0
+        self._tracked_contents: dict[int, bytes] | None = None
+
+    def _sync_written_pages(self):
+        """Forgets the pages written by the debugger if the process has been restarted."""
+        if self._written_pages_pid != self.context.process_id:
+            self._written_pages.clear()
+            self._written_pages_pid = self.context.process_id
+
+            # The backing files may have been rebuilt since the previous process was started
+            self.close_file_mappings()
+
+    def close_file_mappings(self):
+        """Closes the local mappings of the backing files, which are mapped again on the next read that needs them."""
+        for backing_file, _ in self._file_mappings.values():
+            if backing_file is not None:
+                backing_file.close()
+
+        self._file_mappings.clear()
+
+    def _map_backing_file(self, path: str, device: int, inode: int) -> mmap.mmap | None:
+        """Returns a read-only local mapping of the specified backing file, or None if it cannot be mapped or it is
+        not the file mapped by the target process, identified by its device and inode."""
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            liblog.debugger(f"Cannot map {path} locally: {e}")
+            return None
+
+        if (stat.st_dev, stat.st_ino) != (device, inode):
+            # The path now refers to a different file than the one mapped by the process
+            return None
+
+        identity = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+        if path in self._file_mappings:
+            backing_file, mapped_identity = self._file_mappings[path]
+
+            if mapped_identity == identity:
+                return backing_file
+
+            # The file was replaced or modified since it was mapped
+            if backing_file is not None:
+                backing_file.close()
+
+            get_elf_reader.cache_clear()
+            get_relocated_ranges.cache_clear()
+
+        try:
+            with open(path, "rb") as f:
+                backing_file = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+        except (OSError, ValueError) as e:
+            liblog.debugger(f"Cannot map {path} locally: {e}")
+            backing_file = None
+
+        self._file_mappings[path] = (backing_file, identity)
+
+        return backing_file
+
+    def _read_from_file(self, address: int, size: int) -> bytes | None:
+        """Reads memory of the target process from the file backing it, if the read is eligible.
+
+        Args:
+            address (int): The address to read from.
+            size (int): The number of bytes to read.
+
+        Returns:
+            bytes | None: The read bytes, or None if the memory must be read from the target process.
+        """
+        self._sync_written_pages()
+
+        vmap = self.maps_provider().find(address)
+
+        if vmap is None:
+            return None
+
+        if (
+            address + size > vmap.end
+            or "w" in vmap.permissions
+            or not vmap.backing_file.startswith("/")
+            or vmap.backing_file.endswith(" (deleted)")
+        ):
+            return None
+
+        first_page = address & ~(self._page_size - 1)
+        last_page = (address + size - 1) & ~(self._page_size - 1)
+
+        for page in range(first_page, last_page + 1, self._page_size):
+            if page in self._written_pages:
+                return None
+
+        for bp in self.context.breakpoints.values():
+            if not bp.hardware and first_page <= bp.address < last_page + self._page_size:
+                # The breakpoint may be installed in memory right now
+                return None
+
+        offset = vmap.offset + address - vmap.start
+
+        # Mapped first, as it forgets what is known about the file if it changed
+        backing_file = self._map_backing_file(vmap.backing_file, vmap.device, vmap.inode)
+
+        if backing_file is None or offset + size > len(backing_file):
+            return None
+
+        relocated = get_relocated_ranges(vmap.backing_file)
+
+        if relocated is None:
+            return None
+
+        for start, end in relocated:
+            if start < offset + size and offset < end:
+                return None
+
+        # The process may have written to the pages while they were writable, replacing them with private copies
+        try:
+            if get_anonymous_pages(self.context.process_id, [(first_page, last_page + self._page_size)]):
+                return None
+        except OSError as e:
+            liblog.debugger(f"Cannot inspect the pages of the process: {e}")
+            return None
+
+        return backing_file[offset : offset + size]
+
+    def _writable_ranges(self) -> list[tuple[int, int]]:
+        """Returns the address ranges of the writable memory maps of the target process."""
+        return [
+            (vmap.start, vmap.end)
+            for vmap in self.maps_provider()
+            if "w" in vmap.permissions
+        ]
+
+    def _read_writable_pages(self) -> dict[int, bytes]:
+        """Reads every page of writable memory of the target process, with a single access for each memory map."""
+        read_memory = self.context.debugging_interface.read_memory
+        pages = {}
+
+        for start, end in self._writable_ranges():
+            data = read_memory(start, end - start)
+
+            for offset in range(0, len(data), self._page_size):
+                pages[start + offset] = data[offset : offset + self._page_size]
+
+        return pages
+
+    def _changed_pages(self) -> dict[int, bytes]:
+        """Returns the current content of the pages that differ from the content saved by `track_writes`."""
+        return {
+            page: content
+            for page, content in self._read_writable_pages().items()
+            if self._tracked_contents.get(page) != content
+        }
+
+    def _ensure_tracking_writes(self):
+        """Validates that the writes to the target process are being tracked."""
+        if self._tracked_writes_pid != self.context.process_id:
+            raise RuntimeError(
+                "Writes are not being tracked in this process. Did you call track_writes()?"
+            )
+
+    def track_writes(self):
+        """Starts tracking the pages of writable memory written by the target process or by the debugger.
+        Calling it again forgets the pages written so far.
+
+        The soft-dirty bits of the pages are used when the kernel supports them. Otherwise, the content of writable
+        memory is saved and compared against when the written pages are requested.
+        """
+        if soft_dirty_supported():
+            clear_soft_dirty(self.context.process_id)
+            self._tracked_contents = None
+        else:
+            self._tracked_contents = self._read_writable_pages()
+
+        self._tracked_writes_pid = self.context.process_id
+
+    def dirty_pages(self) -> list[int]:
+        """Returns the addresses of the pages of writable memory written since `track_writes` was last called.
+
+        Returns:
+            list[int]: The addresses of the written pages, in ascending order.
+        """
+        self._ensure_tracking_writes()
+
+        if self._tracked_contents is not None:
+            return sorted(self._changed_pages())
+
+        return get_soft_dirty_pages(self.context.process_id, self._writable_ranges())
+
+    def read_dirty_pages(self) -> dict[int, bytes]:
+        """Reads the pages of writable memory written since `track_writes` was last called, with a single access for
+        each run of contiguous pages.
+
+        Returns:
+            dict[int, bytes]: The content of the written pages, indexed by their address.
+        """
+        self._ensure_tracking_writes()
+
+        if self._tracked_contents is not None:
+            return dict(sorted(self._changed_pages().items()))
+
+        read_memory = self.context.debugging_interface.read_memory
+        pages = {}
+
+        dirty_pages = self.dirty_pages()
+        index = 0
+
+        while index < len(dirty_pages):
+            start = dirty_pages[index]
+            count = 1
+
+            while (
+                index + count < len(dirty_pages)
+                and dirty_pages[index + count] == start + count * self._page_size
+            ):
+                count += 1
+
+            data = read_memory(start, count * self._page_size)
+
+            for offset in range(0, len(data), self._page_size):
+                pages[start + offset] = data[offset : offset + self._page_size]
+
+            index += count
+
+        return pages
+
+    def _read_chunk(self, start: int, end: int) -> bytes:
+        """Reads a chunk of memory for a search, returning what could be read."""
+        try:
+            return self.context.debugging_interface.read_memory(start, end - start)
+        except OSError:
+            # Some special maps, such as [vvar], cannot be read
+            return b""
+
+    def find_all(
+        self,
+        pattern: bytes | str | int | list[int | None],
+        maps: MemoryMaps | str | None = None,
+        align: int = 1,
+        limit: int | None = None,
+    ) -> list[int]:
+        """Searches a pattern in the memory of the target process.
+
+        Memory is read in large chunks with a single access each, by a pool of threads that reads ahead of the
+        search. Matches that cross the boundary between two chunks are found, and matches may overlap.
+
+        Args:
+            pattern (bytes | str | int | list[int | None]): The bytes to search, a string to search encoded as UTF-8,
+                an integer to search as a 64-bit little-endian value, or a list of byte values where None matches any
+                byte.
+            maps (MemoryMaps | str, optional): The memory maps to search, or the backing file of the maps to search,
+                such as `libc` or `[heap]`. Defaults to every readable map.
+            align (int, optional): The alignment of the addresses of the matches. Defaults to 1.
+            limit (int, optional): The maximum number of matches to return. Defaults to None.
+
+        Returns:
+            list[int]: The addresses of the matches, in ascending order.
+        """
+        regex, length = _compile_pattern(pattern)
+
+        if maps is None:
+            maps = self.maps_provider().filter("r")
+        elif isinstance(maps, str):
+            maps = self.maps_provider().filter(file=maps)
+
+        # Each chunk is followed by enough bytes to complete the matches starting at its end
+        chunks = [
+            (start, min(start + SEARCH_CHUNK_SIZE, vmap.end), min(start + SEARCH_CHUNK_SIZE + length - 1, vmap.end))
+            for vmap in maps
+            for start in range(vmap.start, vmap.end, SEARCH_CHUNK_SIZE)
+        ]
+
+        matches = []
+
+        if not chunks:
+            return matches
+
+        with ThreadPoolExecutor(SEARCH_WORKERS, thread_name_prefix="libdebug_search") as executor:
+            # The first chunk is read right away, which also opens the memory file before the threads share it
+            data = self._read_chunk(chunks[0][0], chunks[0][2])
+            pending = deque()
+
+            for index, (start, end, _) in enumerate(chunks):
+                while len(pending) < 2 * SEARCH_WORKERS and index + len(pending) + 1 < len(chunks):
+                    next_start, _, next_end = chunks[index + len(pending) + 1]
+                    pending.append(executor.submit(self._read_chunk, next_start, next_end))
+
+                position = 0
+
+                while (match := regex.search(data, position)) and start + match.start() < end:
+                    address = start + match.start()
+                    position = match.start() + 1
+
+                    if address % align:
+                        continue
+
+                    matches.append(address)
+
+                    if limit is not None and len(matches) >= limit:
+                        for future in pending:
+                            future.cancel()
+
+                        return matches
+
+                if pending:
+                    data = pending.popleft().result()
+
+        return matches
+
+    def find(
+        self,
+        pattern: bytes | str | int | list[int | None],
+        maps: MemoryMaps | str | None = None,
+        align: int = 1,
+    ) -> int | None:
+        """Searches the first occurrence of a pattern in the memory of the target process.
+
+        Args:
+            pattern (bytes | str | int | list[int | None]): The bytes to search, a string to search encoded as UTF-8,
+                an integer to search as a 64-bit little-endian value, or a list of byte values where None matches any
+                byte.
+            maps (MemoryMaps | str, optional): The memory maps to search, or the backing file of the maps to search,
+                such as `libc` or `[heap]`. Defaults to every readable map.
+            align (int, optional): The alignment of the address of the match. Defaults to 1.
+
+        Returns:
+            int | None: The address of the first match, or None if the pattern was not found.
+        """
+        matches = self.find_all(pattern, maps, align, limit=1)
+
+        return matches[0] if matches else None
+
     def read(self, address: int, size: int) -> bytes:
         """Reads memory from the target process.
 
@@ -51,6 +440,12 @@ class MemoryView(MutableSequence):
         Returns:
             bytes: The read bytes.
         """
+        if self.file_backed_reads and size > 0:
+            data = self._read_from_file(address, size)
+
+            if data is not None:
+                return data
+
         if self.align_to == 1:
             data = b""
 
@@ -90,6 +485,14 @@ class MemoryView(MutableSequence):
         """
         size = len(data)
 
+        if size:
+            # These pages no longer match their backing file
+            self._sync_written_pages()
+            page_mask = ~(self._page_size - 1)
+            self._written_pages.update(
+                range(address & page_mask, address + size, self._page_size)
+            )
+
         if self.align_to == 1:
             remainder = size % self.unit_size
             base = address
@@ -0,0 +1,29 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A symbol of a file mapped in the target process.
+
+    Attributes:
+        name (str): The name of the symbol.
+        start (int): The start address of the symbol in the target process.
+        end (int): The end address of the symbol in the target process.
+        backing_file (str): The path of the file that defines the symbol.
+    """
+
+    name: str
+    start: int
+    end: int
+    backing_file: str
+
+    @property
+    def size(self) -> int:
+        """The size of the symbol."""
+        return self.end - self.start
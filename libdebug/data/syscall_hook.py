@@ -32,7 +32,7 @@ class SyscallHook:
     on_enter_user: Callable[[ThreadContext, int], None]
     on_exit_user: Callable[[ThreadContext, int], None]
     on_enter_pprint: Callable[[ThreadContext, int, Any], None]
-    on_exit_pprint: Callable[[int | Tuple[int, int]], None]
+    on_exit_pprint: Callable[[int | Tuple[int, int], Any], None]
     hook_hijack: bool = True
     enabled: bool = True
     hit_count: int = 0
@@ -0,0 +1,139 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from libdebug.utils.syscall_utils import resolve_syscall_name
+
+
+@dataclass(frozen=True)
+class SyscallStat:
+    """The statistics of a syscall.
+
+    Attributes:
+        number (int): The syscall number.
+        name (str | None): The syscall name, None if the number is unknown.
+        calls (int): The number of completed calls.
+        errors (int): The number of calls that returned an error.
+        total_time (int): The time spent in the syscall, in nanoseconds.
+    """
+
+    number: int
+    name: str | None
+    calls: int
+    errors: int
+    total_time: int
+
+    @property
+    def average_time(self) -> float:
+        """The average time of a call, in nanoseconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+def _build_stat(number: int, calls: int, errors: int, total_time: int) -> SyscallStat:
+    """Creates the statistics of a syscall, resolving its name."""
+    try:
+        name = resolve_syscall_name(number)
+    except ValueError:
+        name = None
+
+    return SyscallStat(number, name, calls, errors, total_time)
+
+
+class SyscallStats:
+    """The syscall statistics of the debugged process, in the style of `strace -c`.
+
+    Attributes:
+        syscalls (dict[int, SyscallStat]): The statistics of each syscall for the whole process, by number,
+            sorted by decreasing total time.
+        threads (dict[int, dict[int, SyscallStat]]): The statistics of each syscall, by thread id and number.
+    """
+
+    def __init__(self, stats: dict[int, dict[int, tuple[int, int, int]]]):
+        """Initializes the statistics.
+
+        Args:
+            stats (dict[int, dict[int, tuple[int, int, int]]]): The number of calls, of errors and the total time
+                in nanoseconds of each syscall number, by thread id.
+        """
+        totals: dict[int, list[int]] = {}
+
+        self.threads = {}
+
+        for tid, table in sorted(stats.items()):
+            self.threads[tid] = {
+                number: _build_stat(number, *entry) for number, entry in sorted(table.items())
+            }
+
+            for number, entry in table.items():
+                total = totals.setdefault(number, [0, 0, 0])
+                for i, value in enumerate(entry):
+                    total[i] += value
+
+        self.syscalls = {
+            number: _build_stat(number, *total)
+            for number, total in sorted(totals.items(), key=lambda item: (-item[1][2], item[0]))
+        }
+
+    @property
+    def calls(self) -> int:
+        """The number of syscalls completed by the process."""
+        return sum(stat.calls for stat in self.syscalls.values())
+
+    @property
+    def errors(self) -> int:
+        """The number of syscalls that returned an error."""
+        return sum(stat.errors for stat in self.syscalls.values())
+
+    @property
+    def total_time(self) -> int:
+        """The time spent in syscalls by the process, in nanoseconds."""
+        return sum(stat.total_time for stat in self.syscalls.values())
+
+    def __getitem__(self, syscall: int | str) -> SyscallStat:
+        """Returns the statistics of a syscall, by number or name."""
+        for stat in self.syscalls.values():
+            if syscall in (stat.number, stat.name):
+                return stat
+
+        raise KeyError(syscall)
+
+    def __contains__(self, syscall: int | str) -> bool:
+        return any(syscall in (stat.number, stat.name) for stat in self.syscalls.values())
+
+    def __len__(self) -> int:
+        return len(self.syscalls)
+
+    def __str__(self) -> str:
+        total_time = self.total_time
+
+        lines = [
+            f"{'% time':>6} {'seconds':>11} {'usecs/call':>11} {'calls':>9} {'errors':>9} syscall",
+            "------ ----------- ----------- --------- --------- ----------------",
+        ]
+
+        for stat in self.syscalls.values():
+            percentage = 100 * stat.total_time / total_time if total_time else 0.0
+            errors = str(stat.errors) if stat.errors else ""
+            name = stat.name or str(stat.number)
+
+            lines.append(
+                f"{percentage:6.2f} {stat.total_time / 1e9:11.6f} {stat.average_time / 1e3:11.0f} "
+                f"{stat.calls:9} {errors:>9} {name}"
+            )
+
+        lines.append(lines[1])
+        lines.append(
+            f"{100 if total_time else 0:6.2f} {total_time / 1e9:11.6f} {'':>11} "
+            f"{self.calls:9} {self.errors or '':>9} total"
+        )
+
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"SyscallStats({list(self.syscalls.values())})"
@@ -7,7 +7,8 @@
 from abc import ABC, abstractmethod
 
 from libdebug.data.breakpoint import Breakpoint
-from libdebug.data.memory_map import MemoryMap
+from libdebug.data.checkpoint import Checkpoint
+from libdebug.data.memory_maps import MemoryMaps
 from libdebug.data.register_holder import RegisterHolder
 from libdebug.data.syscall_hook import SyscallHook
 from libdebug.data.signal_hook import SignalHook
@@ -59,6 +60,34 @@ class DebuggingInterface(ABC):
         """Instantly terminates the process."""
         pass
 
+    @abstractmethod
+    def fork_run(self):
+        """Replaces the debugged process with a copy of the fork server template, stopped where the template is."""
+        pass
+
+    @abstractmethod
+    def checkpoint(self) -> Checkpoint:
+        """Parks a copy of the process, stopped where the process is, to which the process can be restored."""
+        pass
+
+    @abstractmethod
+    def restore(self, checkpoint: Checkpoint):
+        """Replaces the debugged process with a copy of a checkpoint.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to restore.
+        """
+        pass
+
+    @abstractmethod
+    def release_checkpoint(self, checkpoint: Checkpoint):
+        """Kills the parked copy of a checkpoint.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to release.
+        """
+        pass
+
     @abstractmethod
     def cont(self):
         """Continues the execution of the process."""
@@ -110,10 +139,34 @@ class DebuggingInterface(ABC):
         pass
 
     @abstractmethod
-    def maps(self) -> list[MemoryMap]:
+    def maps(self) -> MemoryMaps:
         """Returns the memory maps of the process."""
         pass
 
+    @abstractmethod
+    def enable_syscall_stats(self, enabled: bool):
+        """Enables or disables the collection of syscall statistics.
+
+        Args:
+            enabled (bool): Whether to collect the statistics.
+        """
+        pass
+
+    @abstractmethod
+    def syscall_stats(self) -> dict[int, dict[int, tuple[int, int, int]]]:
+        """Returns the syscall statistics collected so far.
+
+        Returns:
+            dict[int, dict[int, tuple[int, int, int]]]: The number of calls, of errors and the total time in
+                nanoseconds of each syscall number, by thread id.
+        """
+        pass
+
+    @abstractmethod
+    def reset_syscall_stats(self):
+        """Resets the syscall statistics collected so far."""
+        pass
+
     @abstractmethod
     def get_register_holder(self, thread_id: int) -> RegisterHolder:
         """Returns the current value of all the available registers for the specified thread.
@@ -187,6 +240,19 @@ class DebuggingInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def read_memory(self, address: int, size: int) -> bytes:
+        """Reads a block of memory at the specified address with a single access.
+
+        Args:
+            address (int): The address to read.
+            size (int): The number of bytes to read.
+
+        Returns:
+            bytes: The read bytes, fewer than requested if the block ends in unmapped memory.
+        """
+        pass
+
     @abstractmethod
     def poke_memory(self, address: int, data: int):
         """Writes the memory at the specified address.
@@ -6,7 +6,6 @@
 
 from libdebug.interfaces.debugging_interface import DebuggingInterface
 from libdebug.interfaces.interfaces import AvailableInterfaces
-from libdebug.interfaces.ptrace_interface import PtraceInterface
 
 
 def provide_debugging_interface(
@@ -15,6 +14,8 @@ def provide_debugging_interface(
     """Returns an instance of the debugging interface to be used by the `_InternalDebugger` class."""
     match interface:
         case AvailableInterfaces.PTRACE:
+            from libdebug.interfaces.ptrace_interface import PtraceInterface
+
             return PtraceInterface()
         case _:
             raise NotImplementedError(f"Interface {interface} not available.")
@@ -8,6 +8,7 @@ import errno
 import os
 import pty
 import tty
+from array import array
 from pathlib import Path
 
 from libdebug.architectures.ptrace_hardware_breakpoint_manager import (
@@ -19,7 +20,8 @@ from libdebug.architectures.ptrace_hardware_breakpoint_provider import (
 from libdebug.architectures.register_helper import register_holder_provider
 from libdebug.cffi import _ptrace_cffi
 from libdebug.data.breakpoint import Breakpoint
-from libdebug.data.memory_map import MemoryMap
+from libdebug.data.checkpoint import Checkpoint
+from libdebug.data.memory_maps import MemoryMaps
 from libdebug.data.register_holder import RegisterHolder
 from libdebug.data.syscall_hook import SyscallHook
 from libdebug.interfaces.debugging_interface import DebuggingInterface
@@ -40,6 +42,7 @@ from libdebug.utils.process_utils import (
     disable_self_aslr,
     get_process_maps,
     invalidate_process_cache,
+    notify_process_stopped,
 )
 from libdebug.state.resume_context import ResumeStatus
 
@@ -88,6 +91,19 @@ class PtraceInterface(DebuggingInterface):
         self.process_id = 0
         self.detached = False
 
+        # Whether the process was started by the debugger, which is then the parent of its copies
+        self.spawned = False
+
+        # Whether every syscall is reported to the status handler while the process runs
+        self._syscalls_traced = False
+
+        # The /proc/pid/mem file used for bulk reads, opened on first use
+        self._memory_file: int | None = None
+
+        # The parked copies of the process, and the one used as the template of fork_run
+        self._checkpoints: list[Checkpoint] = []
+        self._fork_template: Checkpoint | None = None
+
         self.hardware_bp_helpers = {}
 
         self.reset()
@@ -97,6 +113,16 @@ class PtraceInterface(DebuggingInterface):
         self.hardware_bp_helpers.clear()
         self.lib_trace.free_thread_list(self._global_state)
         self.lib_trace.free_breakpoints(self._global_state)
+        self.lib_trace.free_syscall_stats(self._global_state)
+        self.lib_trace.enable_syscall_stats(self._global_state, False)
+        self._close_memory_file()
+
+        for checkpoint in self._checkpoints:
+            self.lib_trace.free_thread_list(checkpoint._state)
+            checkpoint.released = True
+
+        self._checkpoints.clear()
+        self._fork_template = None
 
     def _set_options(self):
         """Sets the tracer options."""
@@ -151,6 +177,7 @@ class PtraceInterface(DebuggingInterface):
 
         self.process_id = child_pid
         self.detached = False
+        self.spawned = True
         self.context.process_id = child_pid
         self.register_new_thread(child_pid)
         continue_to_entry_point = self.context.autoreach_entrypoint
@@ -174,6 +201,7 @@ class PtraceInterface(DebuggingInterface):
 
         self.process_id = pid
         self.detached = False
+        self.spawned = False
         self.context.process_id = pid
         self.register_new_thread(pid)
         # If we are attaching to a process, we don't want to continue to the entry point
@@ -205,6 +233,163 @@ class PtraceInterface(DebuggingInterface):
             os.kill(self.process_id, 9)
             os.waitpid(self.process_id, 0)
 
+        for checkpoint in list(self._checkpoints):
+            self.release_checkpoint(checkpoint)
+
+    def _ensure_spawned(self):
+        """Ensures that the process was started by the debugger, as its copies are created as siblings of it and
+        only the debugger can reap them if it is their parent."""
+        if not self.spawned:
+            raise RuntimeError("Copying the process requires a process started by the debugger, not attached to.")
+
+    def fork_run(self):
+        """Replaces the debugged process with a copy of the fork server template, stopped where the template is.
+
+        On the first call, the stopped process becomes the template and leaves the debugger. On the following
+        calls, the previous copy is killed.
+        """
+        self._ensure_spawned()
+
+        if self._fork_template is None:
+            thread_id = self._get_single_thread_id()
+            thread = self.context.get_thread_by_id(thread_id)
+
+            # The process itself is parked, so its registers are copied as the user left them
+            self._fork_template = self._park(
+                self.process_id,
+                self.lib_trace.register_thread(self._global_state, thread_id),
+                thread.instruction_pointer,
+            )
+
+            # The template must not stop on the hardware breakpoints while it forks
+            helper = self.hardware_bp_helpers.pop(thread_id)
+            for bp in self.context.breakpoints.values():
+                if bp.hardware:
+                    helper.remove_breakpoint(bp)
+
+            self.lib_trace.unregister_thread(self._global_state, thread_id)
+            self.context.threads.clear()
+
+        self.restore(self._fork_template)
+
+    def checkpoint(self) -> Checkpoint:
+        """Parks a copy of the process, stopped where the process is, to which the process can be restored.
+
+        Returns:
+            Checkpoint: The checkpoint.
+        """
+        self._ensure_spawned()
+
+        thread_id = self._get_single_thread_id()
+        thread = self.context.get_thread_by_id(thread_id)
+        registers = self.lib_trace.register_thread(self._global_state, thread_id)
+
+        # The injected syscall must not stop on a hardware breakpoint
+        helper = self.hardware_bp_helpers[thread_id]
+        hardware_breakpoints = [bp for bp in self.context.breakpoints.values() if bp.hardware]
+
+        for bp in hardware_breakpoints:
+            helper.remove_breakpoint(bp)
+
+        try:
+            child_pid = self.lib_trace.fork_template(self.process_id, registers)
+        finally:
+            for bp in hardware_breakpoints:
+                helper.install_breakpoint(bp)
+
+        if child_pid == -1:
+            errno_val = self.ffi.errno
+            raise OSError(errno_val, errno.errorcode[errno_val])
+
+        liblog.debugger("Checkpoint of process %d parked as %d", self.process_id, child_pid)
+
+        return self._park(child_pid, registers, thread.instruction_pointer)
+
+    def restore(self, checkpoint: Checkpoint):
+        """Replaces the debugged process with a copy of a checkpoint. The checkpoint is kept, and can be restored
+        again.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to restore.
+        """
+        if checkpoint.released:
+            raise RuntimeError("The checkpoint has been released.")
+
+        if self._global_state.t_HEAD != self.ffi.NULL:
+            # The current process is replaced, it is killed unless it has already exited
+            self.lib_trace.ptrace_detach_for_kill(self._global_state, self.process_id)
+            self.lib_trace.free_thread_list(self._global_state)
+
+        self.hardware_bp_helpers.clear()
+        self.context.threads.clear()
+        self.context.forget_syscalls_in_progress()
+
+        child_pid = self.lib_trace.fork_template(checkpoint.process_id, checkpoint._registers)
+        if child_pid == -1:
+            errno_val = self.ffi.errno
+            raise OSError(errno_val, errno.errorcode[errno_val])
+
+        liblog.debugger("Restored process %d from checkpoint %d", child_pid, checkpoint.process_id)
+
+        checkpoint.restore_count += 1
+
+        self.process_id = child_pid
+        self.context.process_id = child_pid
+        self._close_memory_file()
+        invalidate_process_cache()
+
+        self.register_new_thread(child_pid)
+
+    def release_checkpoint(self, checkpoint: Checkpoint):
+        """Kills the parked copy of a checkpoint.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to release.
+        """
+        if checkpoint.released:
+            return
+
+        self.lib_trace.ptrace_detach_for_kill(checkpoint._state, checkpoint.process_id)
+        self.lib_trace.free_thread_list(checkpoint._state)
+        checkpoint.released = True
+
+        self._checkpoints.remove(checkpoint)
+
+        if checkpoint is self._fork_template:
+            self._fork_template = None
+
+    def _get_single_thread_id(self) -> int:
+        """Returns the ID of the only thread of the process, as a copy of the process only has the calling thread."""
+        threads = [thread for thread in self.context.threads if not thread.dead]
+
+        if len(threads) != 1:
+            raise RuntimeError("Copying the process requires a process with a single thread.")
+
+        return threads[0].thread_id
+
+    def _park(self, process_id: int, registers, instruction_pointer: int) -> Checkpoint:
+        """Tracks a stopped copy of the process with its own backend state.
+
+        Args:
+            process_id (int): The process ID of the copy.
+            registers: The registers of the copy, as the process will be restored.
+            instruction_pointer (int): The instruction pointer of the copy.
+        """
+        state = self.ffi.new("struct global_state*")
+
+        parked_registers = self.lib_trace.register_thread(state, process_id)
+        self.ffi.memmove(parked_registers, registers, self.ffi.sizeof("struct user_regs_struct"))
+
+        checkpoint = Checkpoint(
+            process_id,
+            instruction_pointer,
+            _state=state,
+            _registers=parked_registers,
+        )
+        self._checkpoints.append(checkpoint)
+
+        return checkpoint
+
     def cont(self):
         """Continues the execution of the process."""
         # Enable all breakpoints if they were disabled for a single step
@@ -222,12 +407,38 @@ class PtraceInterface(DebuggingInterface):
             else:
                 self.unset_breakpoint(bp, delete=False)
 
-        for hook in self.context.syscall_hooks.values():
-            if hook.enabled:
-                self._global_state.syscall_hooks_enabled = True
-                break
+        hooked = [
+            hook.syscall_number
+            for hook in self.context.syscall_hooks.values()
+            if hook.enabled
+        ]
+
+        # The syscall recorder and replayer need to see the syscalls they handle, even without hooks
+        if self.context._syscall_recorder is not None:
+            hooked.extend(self.context._syscall_recorder.syscalls)
+
+        # The syscall tracer needs to see every syscall, even without hooks
+        forward_all = self.context._syscall_tracer is not None
+        stats_enabled = self._global_state.syscall_stats_enabled
+
+        self._global_state.syscall_hooks_enabled = (
+            bool(hooked) or forward_all or stats_enabled
+        )
+
+        if stats_enabled:
+            # The backend only reports the syscalls with hooks, the others are just counted
+            self._global_state.syscall_forward_all = forward_all
+
+            forward = bytearray(self.lib_trace.SYSCALL_STATS_SIZE)
+            for number in hooked:
+                if number < len(forward):
+                    forward[number] = 1
+
+            self.ffi.memmove(self._global_state.syscall_forward, forward, len(forward))
+
+            self._syscalls_traced = forward_all
         else:
-            self._global_state.syscall_hooks_enabled = False
+            self._syscalls_traced = bool(self._global_state.syscall_hooks_enabled)
 
         result = self.lib_trace.cont_all_and_set_bps(
             self._global_state, self.process_id
@@ -242,6 +453,9 @@ class PtraceInterface(DebuggingInterface):
         for bp in self.context.breakpoints.values():
             bp._disabled_for_step = True
 
+        # Syscalls are not reported while single stepping
+        self._syscalls_traced = False
+
         result = self.lib_trace.singlestep(self._global_state, thread.thread_id)
         if result == -1:
             errno_val = self.ffi.errno
@@ -267,6 +481,8 @@ class PtraceInterface(DebuggingInterface):
         if result == -1:
             errno_val = self.ffi.errno
             raise OSError(errno_val, errno.errorcode[errno_val])
+
+        notify_process_stopped(self.process_id, syscalls_traced=False)
         
     def finish(self, thread: ThreadContext, exact: bool):
         """Executes instructions of the specified thread until the current function returns.
@@ -285,6 +501,8 @@ class PtraceInterface(DebuggingInterface):
             if result == -1:
                 errno_val = self.ffi.errno
                 raise OSError(errno_val, errno.errorcode[errno_val])
+
+            notify_process_stopped(self.process_id, syscalls_traced=False)
         else:
             # Breakpoint to return address
             last_saved_instruction_pointer = thread.current_return_address()
@@ -374,7 +592,8 @@ class PtraceInterface(DebuggingInterface):
         )
         cursor = result
 
-        invalidate_process_cache()
+        # With syscall tracing, the status handler reports the syscalls that change the memory maps
+        notify_process_stopped(self.process_id, self._syscalls_traced)
 
         results = []
 
@@ -580,6 +799,23 @@ class PtraceInterface(DebuggingInterface):
 
         return result
 
+    def read_memory(self, address: int, size: int) -> bytes:
+        """Reads a block of memory with a single access to /proc/pid/mem. Fewer bytes than requested are
+        returned if the block ends in unmapped memory."""
+        if self._memory_file is None:
+            self._memory_file = os.open(f"/proc/{self.process_id}/mem", os.O_RDONLY)
+
+        data = os.pread(self._memory_file, size, address)
+        liblog.debugger("Read %d bytes at address %x", len(data), address)
+
+        return data
+
+    def _close_memory_file(self):
+        """Closes the /proc/pid/mem file, which refers to the address space it was opened on."""
+        if self._memory_file is not None:
+            os.close(self._memory_file)
+            self._memory_file = None
+
     def poke_memory(self, address: int, value: int):
         """Writes the memory at the specified address."""
         result = self.lib_trace.ptrace_pokedata(self.process_id, address, value)
@@ -619,8 +855,35 @@ class PtraceInterface(DebuggingInterface):
         """Returns the event message."""
         return self.lib_trace.ptrace_geteventmsg(thread_id)
 
-    def maps(self) -> list[MemoryMap]:
+    def maps(self) -> MemoryMaps:
         """Returns the memory maps of the process."""
         assert self.process_id is not None
 
         return get_process_maps(self.process_id)
+
+    def enable_syscall_stats(self, enabled: bool):
+        """Enables or disables the collection of syscall statistics."""
+        self.lib_trace.enable_syscall_stats(self._global_state, enabled)
+
+    def syscall_stats(self) -> dict[int, dict[int, tuple[int, int, int]]]:
+        """Returns the syscall statistics collected so far."""
+        stats = {}
+        cursor = self._global_state.s_HEAD
+
+        while cursor != self.ffi.NULL:
+            # Each entry of the table is a (calls, errors, total_ns) triple
+            table = array("Q", bytes(self.ffi.buffer(cursor.table)))
+
+            stats[cursor.tid] = {
+                index // 3: tuple(table[index : index + 3])
+                for index in range(0, len(table), 3)
+                if table[index]
+            }
+
+            cursor = cursor.next
+
+        return stats
+
+    def reset_syscall_stats(self):
+        """Resets the syscall statistics collected so far."""
+        self.lib_trace.free_syscall_stats(self._global_state)
@@ -11,17 +11,19 @@ from pathlib import Path
 from queue import Queue
 from subprocess import Popen
 from threading import Thread, current_thread
-from typing import Callable
-
-import psutil
+from typing import IO, TYPE_CHECKING, Callable
 
 from libdebug.architectures.syscall_hijacking_provider import syscall_hijacking_provider
 from libdebug.builtin.antidebug_syscall_hook import on_enter_ptrace, on_exit_ptrace
 from libdebug.builtin.pretty_print_syscall_hook import pprint_on_enter, pprint_on_exit
 from libdebug.data.breakpoint import Breakpoint
+from libdebug.data.checkpoint import Checkpoint
+from libdebug.data.memory_maps import MemoryMaps
+from libdebug.data.memory_snapshot import MemorySnapshot
 from libdebug.data.memory_view import MemoryView
 from libdebug.data.signal_hook import SignalHook
 from libdebug.data.syscall_hook import SyscallHook
+from libdebug.data.syscall_stats import SyscallStats
 from libdebug.interfaces.debugging_interface import DebuggingInterface
 from libdebug.interfaces.interface_helper import provide_debugging_interface
 from libdebug.liblog import liblog
@@ -33,6 +35,7 @@ from libdebug.state.debugging_context import (
     provide_context,
 )
 from libdebug.state.resume_context import ResumeStatus
+from libdebug.state.symbol_index import SymbolIndex
 from libdebug.state.thread_context import ThreadContext
 from libdebug.utils.libcontext import libcontext
 from libdebug.utils.signal_utils import (
@@ -47,6 +50,10 @@ from libdebug.utils.syscall_utils import (
 )
 from libdebug.utils.debugger_wrappers import control_flow_function, background_alias
 
+if TYPE_CHECKING:
+    from libdebug.builtin.syscall_recorder import SyscallRecorder, SyscallReplayer
+    from libdebug.builtin.syscall_tracer import SyscallTracer
+
 THREAD_TERMINATE = -1
 GDB_GOBACK_LOCATION = str((Path(__file__).parent / "utils" / "gdb.py").resolve())
 
@@ -245,9 +252,85 @@ class _InternalDebugger:
 
         self._join_and_check_status()
 
+        self.memory.close_file_mappings()
+
         self.context.clear()
         self.interface.reset()
 
+    @background_alias(_background_invalid_call)
+    def fork_run(self):
+        """Starts a fresh copy of the process, stopped where the process was when this method was first called.
+
+        The first call turns the stopped process into the template of a fork server, which is then copied with a
+        fork each time this method is called, killing the previous copy. Compared to `run`, this skips the
+        creation, the dynamic linking and any code executed up to the fork point. Breakpoints, hooks and the pipes
+        of the process are shared by all the copies. The process must be single-threaded, started with `run` rather
+        than attached to, and stopped at a breakpoint or after a step rather than on a syscall.
+
+        Returns:
+            PipeManager: The pipe manager of the process, the same for every copy.
+        """
+        self._ensure_process_stopped()
+
+        self._polling_thread_command_queue.put((self.__threaded_fork_run, ()))
+
+        self._join_and_check_status()
+
+        return self.context.pipe_manager
+
+    @background_alias(_background_invalid_call)
+    def checkpoint(self) -> Checkpoint:
+        """Takes a checkpoint of the process, to which it can be restored with `restore`.
+
+        The checkpoint is a copy of the process, created with a fork and parked until it is released or the
+        process is killed. The process must be single-threaded, started with `run` rather than attached to, and
+        stopped at a breakpoint or after a step rather than on a syscall. Files, sockets and pipes are shared with the copy, not checkpointed.
+
+        Returns:
+            Checkpoint: The checkpoint.
+        """
+        self._ensure_process_stopped()
+
+        self._polling_thread_command_queue.put((self.__threaded_checkpoint, ()))
+
+        # We cannot call _join_and_check_status here, as we need the return value which might not be an exception
+        self._polling_thread_command_queue.join()
+
+        checkpoint = self._polling_thread_response_queue.get()
+        self._polling_thread_response_queue.task_done()
+
+        if isinstance(checkpoint, BaseException):
+            raise checkpoint
+
+        return checkpoint
+
+    @background_alias(_background_invalid_call)
+    def restore(self, checkpoint: Checkpoint):
+        """Restores the process to a checkpoint. The current process is killed and replaced by a copy of the
+        checkpoint, so the same checkpoint can be restored many times. Breakpoints and hooks are not rolled back.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to restore.
+        """
+        self._ensure_process_stopped()
+
+        self._polling_thread_command_queue.put((self.__threaded_restore, (checkpoint,)))
+
+        self._join_and_check_status()
+
+    @background_alias(_background_invalid_call)
+    def release_checkpoint(self, checkpoint: Checkpoint):
+        """Releases a checkpoint, killing its parked copy of the process.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to release.
+        """
+        self._ensure_process_stopped()
+
+        self._polling_thread_command_queue.put((self.interface.release_checkpoint, (checkpoint,)))
+
+        self._join_and_check_status()
+
     @background_alias(_background_invalid_call)
     @control_flow_function
     def cont(self, auto_wait: bool = True):
@@ -858,6 +941,209 @@ class _InternalDebugger:
         yield
         self.pprint_syscalls = old_value
 
+    @background_alias(_background_invalid_call)
+    def trace_syscalls(
+        self,
+        sink: str | os.PathLike | IO[bytes],
+        syscalls: list[int] | list[str] | None = None,
+        decode: bool = True,
+        compression: str | None = None,
+    ) -> SyscallTracer:
+        """Records the syscalls of the process into a trace, until `stop_tracing_syscalls` is called or the process
+        is killed. The trace is a JSON lines file that can be read lazily with
+        `libdebug.builtin.syscall_tracer.read_syscall_trace`.
+
+        Args:
+            sink (str | os.PathLike | IO[bytes]): The path of the trace file, or a binary file object.
+            syscalls (list[int] | list[str], optional): The syscalls to trace. Defaults to all of them.
+            decode (bool, optional): Whether to record the strings and buffers pointed to by the arguments.
+                Defaults to True.
+            compression (str, optional): The compression of the trace, "gzip" or "lzma". Inferred from the suffix
+                of the path if not specified. Defaults to None.
+
+        Returns:
+            SyscallTracer: The tracer.
+        """
+        from libdebug.builtin.syscall_tracer import SyscallTracer, SyscallTraceWriter
+
+        self._ensure_process_stopped()
+
+        if self.context._syscall_tracer is not None:
+            raise RuntimeError("Syscalls are already being traced.")
+
+        if syscalls is not None:
+            syscalls = {
+                v if isinstance(v, int) else resolve_syscall_number(v)
+                for v in syscalls
+            }
+
+        tracer = SyscallTracer(SyscallTraceWriter(sink, compression), syscalls, decode)
+        self.context._syscall_tracer = tracer
+
+        return tracer
+
+    @background_alias(_background_invalid_call)
+    def stop_tracing_syscalls(self):
+        """Stops recording the syscalls of the process and closes the trace."""
+        self._ensure_process_stopped()
+
+        tracer = self.context._syscall_tracer
+
+        if tracer is None:
+            raise RuntimeError("Syscalls are not being traced.")
+
+        self.context._syscall_tracer = None
+        tracer.close()
+
+    @background_alias(_background_invalid_call)
+    def record_syscalls(
+        self,
+        sink: str | os.PathLike | IO[bytes],
+        syscalls: list[int] | list[str] | None = None,
+        compression: str | None = None,
+    ) -> SyscallRecorder:
+        """Records the results of the syscalls of the process, until `stop_recording_syscalls` is called or the
+        process is killed. The recording can be replayed on a later run with `replay_syscalls`.
+
+        Args:
+            sink (str | os.PathLike | IO[bytes]): The path of the recording, or a binary file object.
+            syscalls (list[int] | list[str], optional): The syscalls to record. Defaults to those that depend on the
+                environment: reads from files and sockets and random numbers. Clocks are not included, as libc reads
+                them through the vDSO without a syscall, but they can be listed for processes that issue them.
+            compression (str, optional): The compression of the recording, "gzip" or "lzma". Inferred from the
+                suffix of the path if not specified. Defaults to None.
+
+        Returns:
+            SyscallRecorder: The recorder.
+        """
+        from libdebug.builtin.syscall_recorder import (
+            SyscallRecorder,
+            default_recorded_syscalls,
+        )
+        from libdebug.builtin.syscall_tracer import SyscallTraceWriter
+
+        self._ensure_process_stopped()
+
+        if self.context._syscall_recorder is not None:
+            raise RuntimeError("Syscalls are already being recorded or replayed.")
+
+        if syscalls is None:
+            syscalls = default_recorded_syscalls()
+        else:
+            syscalls = {
+                v if isinstance(v, int) else resolve_syscall_number(v)
+                for v in syscalls
+            }
+
+        recorder = SyscallRecorder(SyscallTraceWriter(sink, compression), syscalls)
+        self.context._syscall_recorder = recorder
+
+        return recorder
+
+    @background_alias(_background_invalid_call)
+    def stop_recording_syscalls(self):
+        """Stops recording the results of the syscalls of the process and closes the recording."""
+        from libdebug.builtin.syscall_recorder import SyscallRecorder
+
+        self._ensure_process_stopped()
+
+        recorder = self.context._syscall_recorder
+
+        if not isinstance(recorder, SyscallRecorder):
+            raise RuntimeError("Syscalls are not being recorded.")
+
+        self.context._syscall_recorder = None
+        recorder.close()
+
+    @background_alias(_background_invalid_call)
+    def replay_syscalls(
+        self,
+        source: str | os.PathLike | IO[bytes] | list[dict],
+        syscalls: list[int] | list[str] | None = None,
+    ) -> SyscallReplayer:
+        """Emulates the syscalls recorded by `record_syscalls`, until `stop_replaying_syscalls` is called or the
+        process is killed. The recorded syscalls are not executed: their return values and outputs are injected
+        in the order they were recorded. Once the results of a syscall run out, it is executed normally.
+
+        Args:
+            source (str | os.PathLike | IO[bytes] | list[dict]): The path of the recording, a binary file object,
+                or the records loaded with `libdebug.builtin.syscall_recorder.load_syscall_recording`, which can
+                be reused across runs.
+            syscalls (list[int] | list[str], optional): The syscalls to emulate. Defaults to all the recorded ones.
+
+        Returns:
+            SyscallReplayer: The replayer.
+        """
+        from libdebug.builtin.syscall_recorder import (
+            SyscallReplayer,
+            load_syscall_recording,
+        )
+
+        self._ensure_process_stopped()
+
+        if self.context._syscall_recorder is not None:
+            raise RuntimeError("Syscalls are already being recorded or replayed.")
+
+        if syscalls is not None:
+            syscalls = {
+                v if isinstance(v, int) else resolve_syscall_number(v)
+                for v in syscalls
+            }
+
+        records = source if isinstance(source, list) else load_syscall_recording(source)
+
+        replayer = SyscallReplayer(records, syscalls)
+        self.context._syscall_recorder = replayer
+
+        return replayer
+
+    @background_alias(_background_invalid_call)
+    def stop_replaying_syscalls(self):
+        """Stops emulating the recorded syscalls, which are executed normally from now on."""
+        from libdebug.builtin.syscall_recorder import SyscallReplayer
+
+        self._ensure_process_stopped()
+
+        replayer = self.context._syscall_recorder
+
+        if not isinstance(replayer, SyscallReplayer):
+            raise RuntimeError("Syscalls are not being replayed.")
+
+        self.context._syscall_recorder = None
+        replayer.close()
+
+    @background_alias(_background_invalid_call)
+    def enable_syscall_stats(self):
+        """Starts counting the calls, the errors and the time spent in each syscall, in the style of `strace -c`.
+
+        The statistics are collected by the debugging backend, without stopping the process on the syscalls that
+        are not hooked. They are kept until `reset_syscall_stats` is called or the process is killed.
+        """
+        self._ensure_process_stopped()
+        self.interface.enable_syscall_stats(True)
+
+    @background_alias(_background_invalid_call)
+    def disable_syscall_stats(self):
+        """Stops counting the syscalls. The statistics collected so far are kept."""
+        self._ensure_process_stopped()
+        self.interface.enable_syscall_stats(False)
+
+    @background_alias(_background_invalid_call)
+    def syscall_stats(self) -> SyscallStats:
+        """Get the syscall statistics collected since they were enabled or reset.
+
+        Returns:
+            SyscallStats: The statistics of each syscall, for the whole process and for each thread.
+        """
+        self._ensure_process_stopped()
+        return SyscallStats(self.interface.syscall_stats())
+
+    @background_alias(_background_invalid_call)
+    def reset_syscall_stats(self):
+        """Resets the syscall statistics collected so far."""
+        self._ensure_process_stopped()
+        self.interface.reset_syscall_stats()
+
     @property
     def syscalls_to_pprint(self):
         """Get the syscalls to pretty print.
@@ -952,6 +1238,67 @@ class _InternalDebugger:
 
         self.context._signal_to_pass = signals
 
+    @property
+    def maps(self) -> MemoryMaps:
+        """Get the memory maps of the process, which can be queried by address, permissions or backing file.
+
+        Returns:
+            MemoryMaps: The memory maps of the process.
+        """
+        self._ensure_process_stopped()
+        return self.interface.maps()
+
+    def snapshot_memory(self, maps: MemoryMaps | None = None) -> MemorySnapshot:
+        """Takes a snapshot of the memory of the process, reading each memory map with a single access.
+
+        Args:
+            maps (MemoryMaps, optional): The memory maps to include in the snapshot. Defaults to the writable maps,
+                such as the stack, the heap and the data sections.
+
+        Returns:
+            MemorySnapshot: The snapshot of the memory maps.
+        """
+        self._ensure_process_stopped()
+
+        if maps is None:
+            maps = self.interface.maps().filter("w")
+
+        return MemorySnapshot(
+            {vmap.start: self.interface.read_memory(vmap.start, vmap.size) for vmap in maps}
+        )
+
+    @property
+    def symbols(self) -> SymbolIndex:
+        """Get the symbol index of the process, which can be queried by name, pattern, file or address.
+
+        Returns:
+            SymbolIndex: The symbol index of the process.
+        """
+        return self.context.symbol_index
+
+    def resolve_line(self, address: int) -> tuple[str, int] | None:
+        """Returns the source file and line corresponding to the specified address.
+
+        Args:
+            address (int): The absolute address to look up.
+
+        Returns:
+            tuple[str, int] | None: The source file and line, or None if no line information covers the address.
+        """
+        return self.context.symbol_index.resolve_line(address)
+
+    def resolve_lines(self, addresses: list[int]) -> list[tuple[str, int] | None]:
+        """Returns the source file and line corresponding to each of the specified addresses.
+
+        Args:
+            addresses (list[int]): The absolute addresses to look up.
+
+        Returns:
+            list[tuple[str, int] | None]: The source file and line of each address, or None where no line
+            information covers the address.
+        """
+        return self.context.symbol_index.resolve_lines(addresses)
+
     @background_alias(_background_invalid_call)
     def migrate_to_gdb(self, open_in_new_process: bool = True):
         """Migrates the current debugging session to GDB."""
@@ -1057,6 +1404,8 @@ class _InternalDebugger:
 
     def _open_gdb_in_new_process(self):
         """Opens GDB in a new process following the configuration in libcontext.terminal."""
+        import psutil
+
         args = self._craft_gdb_migration_command()
 
         initial_pid = Popen(libcontext.terminal + args).pid
@@ -1223,6 +1572,22 @@ class _InternalDebugger:
 
         self.context.set_stopped()
 
+    def __threaded_fork_run(self):
+        liblog.debugger("Forking process %d.", self.context.process_id)
+        self.interface.fork_run()
+
+        self.context.set_stopped()
+
+    def __threaded_checkpoint(self):
+        liblog.debugger("Checkpointing process %d.", self.context.process_id)
+        return self.interface.checkpoint()
+
+    def __threaded_restore(self, checkpoint: Checkpoint):
+        liblog.debugger("Restoring checkpoint %d.", checkpoint.process_id)
+        self.interface.restore(checkpoint)
+
+        self.context.set_stopped()
+
     def __threaded_attach(self, pid: int):
         liblog.debugger("Attaching to process %d.", pid)
         self.interface.attach(pid)
@@ -0,0 +1,110 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any
+
+from libdebug.libdebug import _InternalDebugger, debugger
+
+_worker_debugger: _InternalDebugger | None = None
+"""The debugger owned by the current worker process."""
+
+
+def _initialize_worker(argv: str | list[str], debugger_options: dict[str, Any]):
+    """Creates the debugger of a worker process, which is reused for every candidate."""
+    global _worker_debugger
+
+    _worker_debugger = debugger(argv, **debugger_options)
+
+
+def _run_candidate(
+    script_fn: Callable[[_InternalDebugger, Any], Any], candidate: Any
+) -> Any:
+    """Runs the script on a candidate with the debugger of the worker process."""
+    d = _worker_debugger
+
+    try:
+        return script_fn(d, candidate)
+    finally:
+        # Leave the debugger ready for the next candidate
+        if d.instanced:
+            d.kill()
+
+
+def map(
+    argv: str | list[str],
+    candidates: Iterable[Any],
+    script_fn: Callable[[_InternalDebugger, Any], Any],
+    workers: int | None = None,
+    predicate: Callable[[Any], bool] | None = None,
+    **debugger_options: Any,
+) -> Iterator[tuple[Any, Any]]:
+    """Runs a script on each candidate, with independent debuggers in a pool of worker processes.
+
+    Every worker creates its debugger once and reuses it for all the candidates it is given. The script receives the
+    debugger and the candidate, is expected to call `run()` on the debugger, and its return value is the result of the
+    candidate. A process still running when the script returns is killed.
+
+    The script, the candidates, the results and the debugger options are sent across processes, so they must be
+    picklable. In particular, the script must be defined at the top level of a module. Since the workers are spawned
+    rather than forked, the calling script must be guarded by `if __name__ == "__main__":`.
+
+    Args:
+        argv (str | list[str]): The location of the binary to debug, and any additional arguments to pass to it.
+        candidates (Iterable[Any]): The candidates to try. They are consumed lazily.
+        script_fn (Callable[[_InternalDebugger, Any], Any]): The script to run on each candidate.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        predicate (Callable[[Any], bool], optional): If a result satisfies the predicate, no more results are produced
+            and the candidates not yet started are dropped. Defaults to None.
+        **debugger_options: The keyword arguments passed to `debugger` in each worker.
+
+    Yields:
+        tuple[Any, Any]: The candidate and its result, in completion order.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("The number of workers must be at least 1.")
+
+    candidates = iter(candidates)
+    pending: dict[Future, Any] = {}
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker,
+        initargs=(argv, debugger_options),
+    )
+
+    def submit(count: int):
+        for candidate in islice(candidates, count):
+            future = executor.submit(_run_candidate, script_fn, candidate)
+            pending[future] = candidate
+
+    try:
+        # Keep a few candidates queued so that the workers never wait for the caller
+        submit(2 * workers)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                candidate = pending.pop(future)
+                result = future.result()
+
+                yield candidate, result
+
+                if predicate is not None and predicate(result):
+                    return
+
+            submit(len(done))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
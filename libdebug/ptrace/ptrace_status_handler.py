@@ -17,6 +17,8 @@ from libdebug.liblog import liblog
 from libdebug.ptrace.ptrace_constants import SYSCALL_SIGTRAP, StopEvents
 from libdebug.state.debugging_context import provide_context
 from libdebug.state.thread_context import ThreadContext
+from libdebug.utils.libcontext import libcontext
+from libdebug.utils.process_utils import MAPS_CHANGING_SYSCALLS, notify_maps_changed
 from libdebug.utils.signal_utils import resolve_signal_name
 from libdebug.state.resume_context import ResumeStatus
 
@@ -130,6 +132,9 @@ class PtraceStatusHandler:
             ]
             hook.on_enter_user(thread, syscall_number)
 
+            # The hook may have changed the arguments
+            thread._syscall_decoded = None
+
             # Check if the syscall number has changed
             syscall_number_after_hook = thread.syscall_number
 
@@ -195,6 +200,33 @@ class PtraceStatusHandler:
 
         syscall_number = thread.syscall_number
 
+        if syscall_number in MAPS_CHANGING_SYSCALLS[libcontext.arch]:
+            notify_maps_changed(self.context.process_id)
+
+        observers = [
+            observer
+            for observer in (self.context._syscall_tracer, self.context._syscall_recorder)
+            if observer is not None
+        ]
+
+        if not observers:
+            self._handle_syscall_hooks(thread, syscall_number)
+        elif observers[0].is_entering(thread):
+            # The observers see the syscall as the hooks left it, which is what the kernel executes
+            self._handle_syscall_hooks(thread, syscall_number)
+            for observer in observers:
+                observer.on_enter(thread)
+        else:
+            # The observers see the return value before the hooks can change it. The replayer injects the
+            # recorded result first, so that the tracer records it too
+            for observer in reversed(observers):
+                observer.on_exit(thread)
+            self._handle_syscall_hooks(thread, thread.syscall_number)
+
+    def _handle_syscall_hooks(self, thread: ThreadContext, syscall_number: int):
+        """Run the hooks of the syscall the thread stopped on, if any."""
+        thread_id = thread.thread_id
+
         if syscall_number not in self.context.syscall_hooks:
             # This is a syscall we don't care about
             # Resume the execution
@@ -203,6 +235,10 @@ class PtraceStatusHandler:
 
         hook = self.context.syscall_hooks[syscall_number]
 
+        # The hooks decode the arguments on demand
+        thread._syscall_exiting = hook._has_entered
+        thread._syscall_decoded = None
+
         if not hook._has_entered:
             # The syscall is being entered
             liblog.debugger(
@@ -231,17 +267,21 @@ class PtraceStatusHandler:
                     return_value_after_hook = thread.syscall_return
                     if return_value_after_hook != return_value_before_hook:
                         hook.on_exit_pprint(
-                            (return_value_before_hook, return_value_after_hook)
+                            (return_value_before_hook, return_value_after_hook),
+                            thread=thread,
                         )
                     else:
-                        hook.on_exit_pprint(return_value_after_hook)
+                        hook.on_exit_pprint(return_value_after_hook, thread=thread)
             elif hook.on_exit_pprint:
                 # Pretty print the return value
-                hook.on_exit_pprint(thread.syscall_return)
+                hook.on_exit_pprint(thread.syscall_return, thread=thread)
 
             hook._has_entered = False
             hook._skip_exit = False
 
+        thread._syscall_exiting = None
+        thread._syscall_decoded = None
+
         self.context._resume_context.resume = ResumeStatus.RESUME
 
     def _manage_signal_callback(
@@ -332,6 +372,11 @@ class PtraceStatusHandler:
                     )
                     self._handle_clone(message, results)
                     self.context._resume_context.resume = ResumeStatus.RESUME
+                case StopEvents.EXEC_EVENT:
+                    # The process has a brand new address space
+                    liblog.debugger("Process {} executed a new program".format(pid))
+                    notify_maps_changed(self.context.process_id)
+                    self.ptrace_interface._close_memory_file()
                 case StopEvents.SECCOMP_EVENT:
                     # The process has installed a seccomp
                     liblog.debugger("Process {} installed a seccomp".format(pid))
@@ -16,14 +16,14 @@ from weakref import WeakKeyDictionary
 from libdebug.data.breakpoint import Breakpoint
 from libdebug.data.syscall_hook import SyscallHook
 from libdebug.data.signal_hook import SignalHook
-from libdebug.utils.debugging_utils import (
-    normalize_and_validate_address,
-    resolve_symbol_in_maps,
-)
+from libdebug.utils.debugging_utils import normalize_and_validate_address
 from libdebug.utils.pipe_manager import PipeManager
 from libdebug.state.resume_context import ResumeContext
+from libdebug.state.symbol_index import SymbolIndex
 
 if TYPE_CHECKING:
+    from libdebug.builtin.syscall_recorder import SyscallRecorder, SyscallReplayer
+    from libdebug.builtin.syscall_tracer import SyscallTracer
     from libdebug.data.memory_view import MemoryView
     from libdebug.interfaces.debugging_interface import DebuggingInterface
     from libdebug.state.thread_context import ThreadContext
@@ -102,6 +102,15 @@ class DebuggingContext:
     _resume_context: ResumeContext
     """Context that indicates if the debugger should resume the debugged process."""
 
+    symbol_index: SymbolIndex
+    """The index of the symbols of the files mapped in the debugged process."""
+
+    _syscall_tracer: "SyscallTracer | None"
+    """The tracer recording the syscalls of the debugged process, if any."""
+
+    _syscall_recorder: "SyscallRecorder | SyscallReplayer | None"
+    """The recorder or the replayer of the syscall results of the debugged process, if any."""
+
     def __init__(self):
         """Initialize the context"""
 
@@ -120,6 +129,9 @@ class DebuggingContext:
         self._threads = []
         self._pprint_syscalls = False
         self._resume_context = ResumeContext()
+        self.symbol_index = SymbolIndex(lambda: self.debugging_interface.maps())
+        self._syscall_tracer = None
+        self._syscall_recorder = None
         self.clear()
 
     def clear(self):
@@ -136,7 +148,15 @@ class DebuggingContext:
         self._syscalls_to_not_pprint = None
         self._signal_to_pass.clear()
         self.process_id = 0
+
+        if self._syscall_tracer is not None:
+            self._syscall_tracer.close()
+            self._syscall_tracer = None
+        if self._syscall_recorder is not None:
+            self._syscall_recorder.close()
+            self._syscall_recorder = None
         self._resume_context = ResumeContext()
+        self.symbol_index.clear()
 
     @property
     def breakpoints(self) -> dict[int, Breakpoint]:
@@ -255,6 +275,16 @@ class DebuggingContext:
 
         return None
 
+    def forget_syscalls_in_progress(self):
+        """Forget the syscalls entered by threads that no longer exist, such as those of a killed process."""
+        for hook in self._syscall_hooks.values():
+            hook._has_entered = False
+            hook._skip_exit = False
+
+        for observer in (self._syscall_tracer, self._syscall_recorder):
+            if observer is not None:
+                observer._pending.clear()
+
     def get_thread_by_id(self, thread_id: int) -> "ThreadContext":
         """Get a thread by its ID.
 
@@ -319,8 +349,8 @@ class DebuggingContext:
         Returns:
             int: The address of the symbol.
         """
+        address = self.symbol_index.resolve_symbol(symbol)
         maps = self.debugging_interface.maps()
-        address = resolve_symbol_in_maps(symbol, maps)
         normalized_address = normalize_and_validate_address(address, maps)
         return normalized_address
 
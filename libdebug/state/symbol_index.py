@@ -0,0 +1,596 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from fnmatch import translate
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from libdebug.data.symbol import Symbol
+from libdebug.liblog import liblog
+from libdebug.utils.dwarf_utils import get_line_table
+from libdebug.utils.elf_utils import get_all_symbols, get_debuginfod_symbols, is_pie
+from libdebug.utils.libcontext import libcontext
+
+if TYPE_CHECKING:
+    from libdebug.data.memory_maps import MemoryMaps
+
+
+@dataclass
+class _IndexedFile:
+    """A file mapped in the target process, as tracked by the symbol index.
+
+    Attributes:
+        path (str): The path of the backing file.
+        base (int): The start address of the first memory map backed by the file.
+        top (int): The end address of the last memory map backed by the file.
+        loaded (bool): Whether the symbols of the file have been merged into the index.
+        symbols (list[tuple[int, int, str]]): The (start, end, name) entries of the file, with the load base applied.
+        remote_symbols (dict[str, tuple[int, int]] | None): The symbols of the file downloaded through debuginfod,
+            with the load base applied, or None if they have not been needed yet.
+    """
+
+    path: str
+    base: int
+    top: int
+    loaded: bool = False
+    symbols: list[tuple[int, int, str]] = field(default_factory=list)
+    remote_symbols: dict[str, tuple[int, int]] | None = None
+
+
+class SymbolIndex:
+    """A process-wide index of the symbols of all the files mapped in the target process.
+
+    The files are discovered from the memory maps of the process and their symbols are loaded lazily, on first use.
+    The symbols downloaded through debuginfod are only fetched when a lookup misses all the local ones.
+    The index is updated incrementally when a file is mapped or unmapped, so that both name and address lookups
+    do not have to walk every mapped file.
+    """
+
+    def __init__(self, maps_provider: Callable[[], MemoryMaps]):
+        """Initializes the symbol index.
+
+        Args:
+            maps_provider (Callable[[], MemoryMaps]): A function that returns the memory maps of the target process.
+        """
+        self._maps_provider = maps_provider
+        self.clear()
+
+    def clear(self):
+        """Drops every file and symbol from the index."""
+        self._maps: MemoryMaps | None = None
+        self._sym_lvl = libcontext.sym_lvl
+
+        self._files: dict[str, _IndexedFile] = {}
+        """The mapped files, keyed by path."""
+
+        self._ordered_files: list[_IndexedFile] = []
+        """The mapped files, sorted by base address (i.e. in memory map order)."""
+
+        self._bases: list[int] = []
+        """The base addresses of `_ordered_files`, used for bisection."""
+
+        self._names: dict[str, tuple[int, int, int, str]] = {}
+        """Name -> (base of the owning file, start, end, path). The file mapped first wins."""
+
+        self._names_dirty = False
+
+        self._sorted_names: list[str] = []
+        """The keys of `_names` in lexicographic order, used for prefix range scans."""
+
+        self._sorted_names_dirty = False
+
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._reach: list[int] = []
+        self._labels: list[str] = []
+        self._owners: list[str] = []
+        self._table_dirty = False
+
+    def _refresh(self):
+        """Synchronizes the index with the current memory maps of the process."""
+        if self._sym_lvl != libcontext.sym_lvl:
+            # The available symbols depend on the symbol level, reload everything
+            self._sym_lvl = libcontext.sym_lvl
+            for file in self._files.values():
+                file.loaded = False
+                file.symbols = []
+                file.remote_symbols = None
+            self._names.clear()
+            self._sorted_names_dirty = True
+            self._table_dirty = True
+
+        maps = self._maps_provider()
+
+        if maps is self._maps:
+            # The memory maps have not been reloaded since the last lookup
+            return
+
+        self._maps = maps
+
+        mapped_files = {}
+
+        for vmap in maps:
+            file = vmap.backing_file
+            if not file or file[0] == "[":
+                continue
+
+            if file not in mapped_files:
+                mapped_files[file] = [vmap.start, vmap.end]
+            else:
+                mapped_files[file][1] = vmap.end
+
+        changed = False
+
+        for path, file in list(self._files.items()):
+            if path not in mapped_files or mapped_files[path][0] != file.base:
+                # The file has been unmapped, or mapped somewhere else
+                liblog.debugger("Dropping symbols of %s from the index", path)
+                del self._files[path]
+                changed = True
+
+                if file.loaded:
+                    self._names_dirty = True
+                    self._table_dirty = True
+
+        for path, (base, top) in mapped_files.items():
+            if path in self._files:
+                self._files[path].top = top
+            else:
+                self._files[path] = _IndexedFile(path, base, top)
+                changed = True
+
+        if changed:
+            self._ordered_files = sorted(self._files.values(), key=lambda f: f.base)
+            self._bases = [file.base for file in self._ordered_files]
+
+    def _load(self, file: _IndexedFile):
+        """Merges the symbols of the specified file into the index.
+
+        Args:
+            file (_IndexedFile): The file to load.
+        """
+        file.loaded = True
+
+        try:
+            symbols = get_all_symbols(file.path)
+            load_base = file.base if is_pie(file.path) else 0
+        except OSError as e:
+            liblog.debugger(f"Error while loading the symbols of {file.path}: {e}")
+            return
+
+        file.symbols = sorted(
+            (start + load_base, end + load_base, name)
+            for name, (start, end) in symbols.items()
+        )
+
+        if not self._names_dirty:
+            names = self._names
+            for start, end, name in file.symbols:
+                if name not in names or names[name][0] > file.base:
+                    names[name] = (file.base, start, end, file.path)
+
+        self._sorted_names_dirty = True
+        self._table_dirty = True
+
+    def _remote_symbols(self, file: _IndexedFile) -> dict[str, tuple[int, int]]:
+        """Returns the symbols of the specified file downloaded through debuginfod, fetching them on first use.
+
+        Args:
+            file (_IndexedFile): The file whose symbols should be returned.
+        """
+        if file.remote_symbols is None:
+            try:
+                symbols = get_debuginfod_symbols(file.path)
+                load_base = file.base if symbols and is_pie(file.path) else 0
+            except OSError as e:
+                liblog.debugger(f"Error while loading the debuginfod symbols of {file.path}: {e}")
+                symbols, load_base = {}, 0
+
+            file.remote_symbols = {
+                name: (start + load_base, end + load_base)
+                for name, (start, end) in symbols.items()
+            }
+
+        return file.remote_symbols
+
+    def _load_all(self):
+        """Merges the symbols of every mapped file into the index."""
+        for file in self._ordered_files:
+            if not file.loaded:
+                self._load(file)
+
+        if self._names_dirty:
+            self._rebuild_names()
+
+        if self._sorted_names_dirty:
+            self._sorted_names = sorted(self._names)
+            self._sorted_names_dirty = False
+
+    def _rebuild_names(self):
+        """Rebuilds the name lookup table from the loaded files."""
+        self._names.clear()
+
+        # Iterate in reverse map order, so that files mapped first overwrite the others
+        for file in reversed(self._ordered_files):
+            for start, end, name in file.symbols:
+                self._names[name] = (file.base, start, end, file.path)
+
+        self._names_dirty = False
+        self._sorted_names_dirty = True
+
+    def _rebuild_table(self):
+        """Rebuilds the merged address table from the loaded files."""
+        entries = sorted(
+            (start, end, name, file.path)
+            for file in self._ordered_files
+            for start, end, name in file.symbols
+        )
+
+        self._starts = [entry[0] for entry in entries]
+        self._ends = [entry[1] for entry in entries]
+        self._labels = [entry[2] for entry in entries]
+        self._owners = [entry[3] for entry in entries]
+
+        # _reach[i] is the highest end address among the first i + 1 entries.
+        # It bounds the backward walk needed to find an enclosing symbol.
+        self._reach = []
+        reach = 0
+        for end in self._ends:
+            reach = max(reach, end)
+            self._reach.append(reach)
+
+        self._table_dirty = False
+
+    def _lookup_name(self, name: str) -> tuple[int, int, int, str] | None:
+        """Looks up a symbol by name, loading the mapped files in map order until it is found."""
+        if self._names_dirty:
+            self._rebuild_names()
+
+        for file in self._ordered_files:
+            entry = self._names.get(name)
+
+            if entry is not None and entry[0] <= file.base:
+                # No file mapped before this one can define the symbol
+                return entry
+
+            if not file.loaded:
+                self._load(file)
+
+        entry = self._names.get(name)
+
+        if entry is None and libcontext.sym_lvl > 4:
+            # Only now is it worth downloading the symbols of the mapped files, in map order
+            for file in self._ordered_files:
+                symbols = self._remote_symbols(file)
+
+                if name in symbols:
+                    start, end = symbols[name]
+                    return (file.base, start, end, file.path)
+
+        return entry
+
+    def _lookup_address(self, address: int) -> tuple[int, int, str, str] | None:
+        """Looks up the symbol that contains the specified address."""
+        index = bisect_right(self._bases, address) - 1
+
+        if index >= 0:
+            file = self._ordered_files[index]
+            if address < file.top and not file.loaded:
+                self._load(file)
+
+        if self._table_dirty:
+            self._rebuild_table()
+
+        index = bisect_right(self._starts, address) - 1
+
+        while index >= 0 and self._reach[index] > address:
+            if self._ends[index] > address:
+                return (
+                    self._starts[index],
+                    self._ends[index],
+                    self._labels[index],
+                    self._owners[index],
+                )
+            index -= 1
+
+        file = self._file_at(address)
+
+        if file is not None and libcontext.sym_lvl > 4:
+            # Only now is it worth downloading the symbols of the file
+            for name, (start, end) in self._remote_symbols(file).items():
+                if start <= address < end:
+                    return (start, end, name, file.path)
+
+        return None
+
+    def resolve_symbol(self, symbol: str) -> int:
+        """Returns the address of the specified symbol in the memory maps of the process.
+
+        Args:
+            symbol (str): The symbol whose address should be returned, optionally followed by a `+offset` in hex,
+                or a source location in the `file.c:123` form.
+
+        Returns:
+            int: The address of the specified symbol.
+
+        Throws:
+            ValueError: If the specified symbol does not belong to any mapped file.
+        """
+        if libcontext.sym_lvl == 0:
+            raise Exception(
+                """Symbol resolution is disabled. Please enable it by setting the sym_lvl libcontext parameter to a
+                value greater than 0."""
+            )
+
+        self._refresh()
+
+        source_line = re.fullmatch(r"([^:]+):(\d+)", symbol)
+
+        if source_line:
+            return self._resolve_source_line(
+                source_line.group(1), int(source_line.group(2))
+            )
+
+        name, offset = symbol, 0
+
+        if "+" in symbol:
+            base_name, offset_str = symbol.rsplit("+", 1)
+            try:
+                offset = int(offset_str, 16)
+                name = base_name
+            except ValueError:
+                # The "+" is part of the symbol name
+                pass
+
+        entry = self._lookup_name(name)
+
+        if entry is None:
+            raise ValueError(
+                f"Symbol {name} not found in any mapped file. Please specify a valid symbol."
+            )
+
+        return entry[1] + offset
+
+    def resolve_address(self, address: int) -> str:
+        """Returns the symbol corresponding to the specified address in the memory maps of the process.
+
+        Args:
+            address (int): The address whose symbol should be returned.
+
+        Returns:
+            str: The symbol corresponding to the specified address, or its hex representation if none is found.
+        """
+        if libcontext.sym_lvl == 0:
+            return hex(address)
+
+        self._refresh()
+
+        entry = self._lookup_address(address)
+
+        if entry is None:
+            return hex(address)
+
+        start, _, name, _ = entry
+        return f"{name}+{str(address - start)}"
+
+    def find(
+        self,
+        prefix: str | None = None,
+        glob: str | None = None,
+        regex: str | re.Pattern | None = None,
+    ) -> list[Symbol]:
+        """Returns the symbols of the mapped files whose name matches all the specified filters.
+
+        When a name is defined by more than one file, only the definition of the file mapped first is returned.
+
+        Args:
+            prefix (str, optional): The prefix of the symbol names. Defaults to None.
+            glob (str, optional): A shell-style pattern that the symbol names must match, such as `handle_*`. Defaults to None.
+            regex (str | re.Pattern, optional): A regular expression searched in the symbol names. Defaults to None.
+
+        Returns:
+            list[Symbol]: The matching symbols, sorted by name.
+        """
+        if libcontext.sym_lvl == 0:
+            raise Exception(
+                """Symbol resolution is disabled. Please enable it by setting the sym_lvl libcontext parameter to a
+                value greater than 0."""
+            )
+
+        self._refresh()
+        self._load_all()
+
+        key = prefix or ""
+        filters = []
+
+        if glob is not None:
+            # The literal part of the pattern is a prefix that can bound the range scan as well
+            literal = re.split(r"[*?\[]", glob, maxsplit=1)[0]
+
+            if literal.startswith(key):
+                key = literal
+            elif not key.startswith(literal):
+                # The prefix and the pattern are incompatible
+                return []
+
+            filters.append(re.compile(translate(glob)).match)
+
+        if regex is not None:
+            filters.append(re.compile(regex).search)
+
+        names = self._sorted_names
+        index = bisect_left(names, key)
+
+        symbols = []
+
+        while index < len(names) and names[index].startswith(key):
+            name = names[index]
+            index += 1
+
+            if all(match(name) for match in filters):
+                _, start, end, path = self._names[name]
+                symbols.append(Symbol(name, start, end, path))
+
+        return symbols
+
+    def in_file(self, file: str) -> list[Symbol]:
+        """Returns all the symbols defined by the specified mapped file.
+
+        Args:
+            file (str): The path of the file, or a substring of its name, such as `libcrypto`.
+
+        Returns:
+            list[Symbol]: The symbols of the matching files, sorted by address.
+        """
+        if libcontext.sym_lvl == 0:
+            raise Exception(
+                """Symbol resolution is disabled. Please enable it by setting the sym_lvl libcontext parameter to a
+                value greater than 0."""
+            )
+
+        self._refresh()
+
+        if file in self._files:
+            matches = [self._files[file]]
+        else:
+            matches = [f for f in self._ordered_files if file in Path(f.path).name]
+
+        if not matches:
+            raise ValueError(f"File {file} is not mapped in the target process.")
+
+        symbols = []
+
+        for indexed_file in matches:
+            if not indexed_file.loaded:
+                self._load(indexed_file)
+
+            symbols.extend(
+                Symbol(name, start, end, indexed_file.path)
+                for start, end, name in indexed_file.symbols
+            )
+
+        return symbols
+
+    def near(self, address: int) -> Symbol | None:
+        """Returns the symbol that contains the specified address or, if none does, the closest symbol of the same
+        mapped file that precedes it.
+
+        Args:
+            address (int): The address to look up.
+
+        Returns:
+            Symbol | None: The symbol, or None if the address does not follow any symbol of a mapped file.
+        """
+        if libcontext.sym_lvl == 0:
+            return None
+
+        self._refresh()
+
+        entry = self._lookup_address(address)
+
+        if entry is not None:
+            start, end, name, path = entry
+            return Symbol(name, start, end, path)
+
+        index = bisect_right(self._bases, address) - 1
+
+        if index < 0 or address >= self._ordered_files[index].top:
+            return None
+
+        file = self._ordered_files[index]
+        index = bisect_right(file.symbols, address, key=lambda entry: entry[0]) - 1
+
+        if index < 0:
+            return None
+
+        start, end, name = file.symbols[index]
+        return Symbol(name, start, end, file.path)
+
+    def _file_at(self, address: int) -> _IndexedFile | None:
+        """Returns the mapped file that contains the specified address."""
+        index = bisect_right(self._bases, address) - 1
+
+        if index < 0 or address >= self._ordered_files[index].top:
+            return None
+
+        return self._ordered_files[index]
+
+    def _resolve_source_line(self, file: str, line: int) -> int:
+        """Returns the first address of the code generated for the specified source line."""
+        for indexed_file in self._ordered_files:
+            table = get_line_table(indexed_file.path)
+
+            if table is None:
+                continue
+
+            addresses = table.addresses_of(file, line)
+
+            if addresses:
+                load_base = indexed_file.base if is_pie(indexed_file.path) else 0
+                return addresses[0] + load_base
+
+        raise ValueError(
+            f"No code found for line {line} of {file} in any mapped file. Please specify a valid source location."
+        )
+
+    def resolve_line(self, address: int) -> tuple[str, int] | None:
+        """Returns the source file and line corresponding to the specified address, using the DWARF line tables.
+
+        Args:
+            address (int): The address to look up.
+
+        Returns:
+            tuple[str, int] | None: The source file and line, or None if no line information covers the address.
+        """
+        return self.resolve_lines([address])[0]
+
+    def resolve_lines(self, addresses: list[int]) -> list[tuple[str, int] | None]:
+        """Returns the source file and line corresponding to each of the specified addresses.
+
+        This is faster than calling `resolve_line` for each address, as the memory maps are only synchronized once.
+
+        Args:
+            addresses (list[int]): The addresses to look up.
+
+        Returns:
+            list[tuple[str, int] | None]: The source file and line of each address, or None where no line
+            information covers the address.
+        """
+        if libcontext.sym_lvl == 0:
+            return [None] * len(addresses)
+
+        self._refresh()
+
+        # The line table and load base of each file, looked up once per batch
+        files = {}
+        results = []
+
+        for address in addresses:
+            indexed_file = self._file_at(address)
+
+            if indexed_file is None:
+                results.append(None)
+                continue
+
+            if indexed_file.path not in files:
+                table = get_line_table(indexed_file.path)
+                load_base = (
+                    indexed_file.base
+                    if table is not None and is_pie(indexed_file.path)
+                    else 0
+                )
+                files[indexed_file.path] = (table, load_base)
+
+            table, load_base = files[indexed_file.path]
+
+            results.append(table.lookup(address - load_base) if table else None)
+
+        return results
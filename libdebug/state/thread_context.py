@@ -4,13 +4,13 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from libdebug.architectures.stack_unwinding_provider import stack_unwinding_provider
 from libdebug.data.register_holder import RegisterHolder
 from libdebug.liblog import liblog
 from libdebug.state.debugging_context import debugging_context
-from libdebug.utils.debugging_utils import resolve_address_in_maps
+from libdebug.utils.syscall_decoders import decode_syscall_arguments
 
 if TYPE_CHECKING:
     from libdebug.state.debugging_context import DebuggingContext
@@ -51,6 +51,12 @@ class ThreadContext:
     _needs_sigcont: bool = False
     """Whether the thread needs to be continued after a signal stop."""
 
+    _syscall_exiting: bool | None = None
+    """Whether the syscall hooks run on the exit of a syscall, None outside of syscall hooks."""
+
+    _syscall_decoded: dict[str, Any] | None = None
+    """The decoded syscall arguments, once they have been decoded."""
+
     def __init__(self, thread_id: int):
         self.thread_id = thread_id
 
@@ -86,6 +92,39 @@ class ThreadContext:
         """The process ID of the thread."""
         return self.context.process_id
 
+    @property
+    def syscall_decoded_args(self) -> dict[str, Any]:
+        """The strings, buffers and structures pointed to by the arguments of the syscall the thread is stopped
+        on, by argument name. They are decoded on first access, and output arguments are only available when the
+        syscall is exited. Only available in syscall hooks."""
+        if self._syscall_exiting is None:
+            raise RuntimeError("The decoded syscall arguments are only available in syscall hooks.")
+
+        if self._syscall_decoded is None:
+            values = [
+                self.syscall_arg0,
+                self.syscall_arg1,
+                self.syscall_arg2,
+                self.syscall_arg3,
+                self.syscall_arg4,
+                self.syscall_arg5,
+            ]
+
+            return_value = None
+            if self._syscall_exiting:
+                return_value = self.syscall_return
+                if return_value >= 1 << 63:
+                    return_value -= 1 << 64
+
+            self._syscall_decoded = decode_syscall_arguments(
+                self.context.debugging_interface.read_memory,
+                self.syscall_number,
+                values,
+                return_value,
+            )
+
+        return self._syscall_decoded
+
     def _poll_registers(self):
         """Updates the register values."""
         if not self._needs_register_poll:
@@ -108,14 +147,7 @@ class ThreadContext:
         """Returns the current backtrace of the thread."""
         stack_unwinder = stack_unwinding_provider()
         backtrace = stack_unwinder.unwind(self)
-        return list(
-            map(
-                lambda x: resolve_address_in_maps(
-                    x, self.context.debugging_interface.maps()
-                ),
-                backtrace,
-            )
-        )
+        return [self.context.symbol_index.resolve_address(x) for x in backtrace]
 
     def current_return_address(self):
         """Returns the return address of the current function."""
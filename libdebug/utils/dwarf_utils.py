@@ -0,0 +1,750 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import functools
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+
+from libdebug.liblog import liblog
+from libdebug.utils.elf_utils import LOCAL_DEBUG_PATH, get_elf_reader
+from libdebug.utils.libcontext import libcontext
+
+DW_AT_stmt_list = 0x10
+
+DW_LNCT_path = 0x1
+DW_LNCT_directory_index = 0x2
+
+DW_LNS_copy = 0x1
+DW_LNS_advance_pc = 0x2
+DW_LNS_advance_line = 0x3
+DW_LNS_set_file = 0x4
+DW_LNS_negate_stmt = 0x6
+DW_LNS_const_add_pc = 0x8
+DW_LNS_fixed_advance_pc = 0x9
+
+DW_LNE_end_sequence = 0x1
+DW_LNE_set_address = 0x2
+DW_LNE_define_file = 0x3
+
+DW_FORM_strp = 0x0E
+DW_FORM_line_strp = 0x1F
+DW_FORM_implicit_const = 0x21
+
+# Sizes of the attribute forms whose values have a fixed length
+_FIXED_FORM_SIZES = {
+    0x0B: 1, 0x0C: 1, 0x11: 1, 0x25: 1, 0x29: 1,  # data1, flag, ref1, strx1, addrx1
+    0x05: 2, 0x12: 2, 0x26: 2, 0x2A: 2,  # data2, ref2, strx2, addrx2
+    0x27: 3, 0x2B: 3,  # strx3, addrx3
+    0x06: 4, 0x13: 4, 0x1C: 4, 0x28: 4, 0x2C: 4,  # data4, ref4, ref_sup4, strx4, addrx4
+    0x07: 8, 0x14: 8, 0x20: 8, 0x24: 8,  # data8, ref8, ref_sig8, ref_sup8
+}
+
+
+def _read_uleb(data: bytes, position: int) -> tuple[int, int]:
+    """Reads an unsigned LEB128 value, returning it together with the position that follows it."""
+    result = shift = 0
+
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+
+        if byte < 0x80:
+            return result, position
+
+
+def _read_sleb(data: bytes, position: int) -> tuple[int, int]:
+    """Reads a signed LEB128 value, returning it together with the position that follows it."""
+    result = shift = 0
+
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+
+        if byte < 0x80:
+            if byte & 0x40:
+                result -= 1 << shift
+            return result, position
+
+
+def _read_cstring(data: bytes, position: int) -> tuple[str, int]:
+    """Reads a NUL-terminated string, returning it together with the position that follows it."""
+    end = data.index(b"\x00", position)
+    return data[position:end].decode(errors="replace"), end + 1
+
+
+def _read_unit_length(data: bytes, position: int) -> tuple[int, int, int]:
+    """Reads the length of a DWARF unit, returning it with the offset size (4 or 8) and the following position."""
+    (length,) = struct.unpack_from("<I", data, position)
+
+    if length == 0xFFFFFFFF:
+        (length,) = struct.unpack_from("<Q", data, position + 4)
+        return length, 8, position + 12
+
+    return length, 4, position + 4
+
+
+def _form_value(
+    form: int,
+    data: bytes,
+    position: int,
+    offset_size: int,
+    address_size: int,
+) -> tuple[int | bytes | str | None, int]:
+    """Reads the value of an attribute of the specified form.
+
+    Integer-like forms are returned as int, strings as str and blocks as bytes.
+
+    Returns:
+        tuple: The value, or None for forms without a value, and the position that follows it.
+    """
+    if form in _FIXED_FORM_SIZES:
+        size = _FIXED_FORM_SIZES[form]
+        return int.from_bytes(data[position : position + size], "little"), position + size
+
+    match form:
+        case 0x01:  # addr
+            value = int.from_bytes(data[position : position + address_size], "little")
+            return value, position + address_size
+        case 0x0E | 0x10 | 0x17 | 0x1D | 0x1F | 0x1F20 | 0x1F21:
+            # strp, ref_addr, sec_offset, strp_sup, line_strp, GNU_ref_alt, GNU_strp_alt
+            value = int.from_bytes(data[position : position + offset_size], "little")
+            return value, position + offset_size
+        case 0x0F | 0x15 | 0x1A | 0x1B | 0x22 | 0x23 | 0x1F01 | 0x1F02:
+            # udata, ref_udata, strx, addrx, loclistx, rnglistx, GNU_addr_index, GNU_str_index
+            return _read_uleb(data, position)
+        case 0x0D:  # sdata
+            return _read_sleb(data, position)
+        case 0x08:  # string
+            return _read_cstring(data, position)
+        case 0x1E:  # data16
+            return data[position : position + 16], position + 16
+        case 0x0A:  # block1
+            size = data[position]
+            return data[position + 1 : position + 1 + size], position + 1 + size
+        case 0x03:  # block2
+            (size,) = struct.unpack_from("<H", data, position)
+            return data[position + 2 : position + 2 + size], position + 2 + size
+        case 0x04:  # block4
+            (size,) = struct.unpack_from("<I", data, position)
+            return data[position + 4 : position + 4 + size], position + 4 + size
+        case 0x09 | 0x18:  # block, exprloc
+            size, position = _read_uleb(data, position)
+            return data[position : position + size], position + size
+        case 0x19 | 0x21:  # flag_present, implicit_const
+            return None, position
+        case 0x16:  # indirect
+            form, position = _read_uleb(data, position)
+            return _form_value(form, data, position, offset_size, address_size)
+        case _:
+            raise ValueError(f"Unsupported DWARF form {hex(form)}")
+
+
+@dataclass
+class _LineProgram:
+    """The line number program of a compilation unit.
+
+    The fields up to `program_end` come from the header of the program, the remaining ones are filled in when the
+    program is decoded.
+
+    Attributes:
+        files (list[str]): The file table of the program, indexed as the program expects.
+        program_start (int): The offset of the first opcode in the line section.
+        program_end (int): The offset that follows the last opcode in the line section.
+        addresses (array | None): The sorted addresses of the rows, once the program has been decoded.
+        file_indexes (array | None): The file index of each row.
+        lines (array | None): The line of each row, or 0 for the end of a sequence.
+        statements (array | None): Whether each row is a recommended breakpoint location.
+        ranges (list[tuple[int, int]]): The address ranges covered by the sequences of the program.
+    """
+
+    version: int
+    address_size: int
+    minimum_instruction_length: int
+    default_is_stmt: bool
+    line_base: int
+    line_range: int
+    opcode_base: int
+    standard_opcode_lengths: bytes
+    files: list[str]
+    program_start: int
+    program_end: int
+    addresses: array | None = None
+    file_indexes: array | None = None
+    lines: array | None = None
+    statements: array | None = None
+    ranges: list[tuple[int, int]] = field(default_factory=list)
+
+
+class LineTable:
+    """The DWARF line table of an ELF file, mapping addresses to source lines and back.
+
+    Only the headers of the line programs are parsed eagerly, while the programs themselves are decoded on first use,
+    one compilation unit at a time, into compact sorted arrays.
+    """
+
+    def __init__(self, path: str, debug_path: str):
+        """Initializes the line table.
+
+        Args:
+            path (str): The path of the ELF file.
+            debug_path (str): The path of the ELF file holding the debug sections, which might be an external debug file.
+        """
+        self.path = path
+        self.debug_path = debug_path
+
+        reader = get_elf_reader(debug_path)
+
+        self._sections = {}
+
+        for name in [
+            ".debug_line",
+            ".debug_line_str",
+            ".debug_str",
+            ".debug_aranges",
+            ".debug_info",
+            ".debug_abbrev",
+        ]:
+            section = reader.section(name)
+            self._sections[name] = (
+                reader.read(section.sh_offset, section.sh_size) if section else b""
+            )
+
+        self._programs: dict[int, _LineProgram] = {}
+        self._parse_headers()
+
+        self._range_starts: list[int] | None = None
+        self._range_ends: list[int] = []
+        self._range_programs: list[int] = []
+
+    def _string_at(self, section: str, offset: int) -> str:
+        """Returns the NUL-terminated string at the specified offset of a string section."""
+        return _read_cstring(self._sections[section], offset)[0]
+
+    def _parse_headers(self):
+        """Parses the headers of all the line programs."""
+        data = self._sections[".debug_line"]
+        position = 0
+
+        while position < len(data):
+            offset = position
+
+            try:
+                length, offset_size, position = _read_unit_length(data, position)
+                end = position + length
+                self._programs[offset] = self._parse_header(
+                    data, position, end, offset_size
+                )
+            except (ValueError, IndexError, struct.error) as e:
+                liblog.debugger(
+                    f"Invalid line program at {hex(offset)} in {self.debug_path}: {e}"
+                )
+                return
+
+            position = end
+
+    def _parse_header(
+        self, data: bytes, position: int, end: int, offset_size: int
+    ) -> _LineProgram:
+        """Parses the header of a line program."""
+        (version,) = struct.unpack_from("<H", data, position)
+        position += 2
+
+        if not 2 <= version <= 5:
+            raise ValueError(f"unsupported version {version}")
+
+        address_size = 8
+
+        if version >= 5:
+            address_size = data[position]
+            position += 2
+
+        header_length = int.from_bytes(data[position : position + offset_size], "little")
+        position += offset_size
+        program_start = position + header_length
+
+        minimum_instruction_length = data[position]
+        position += 1
+
+        if version >= 4:
+            # maximum_operations_per_instruction, only meaningful for VLIW architectures
+            position += 1
+
+        default_is_stmt = bool(data[position])
+        line_base = struct.unpack_from("<b", data, position + 1)[0]
+        line_range = data[position + 2]
+        opcode_base = data[position + 3]
+        position += 4
+
+        standard_opcode_lengths = data[position : position + opcode_base - 1]
+        position += opcode_base - 1
+
+        if version >= 5:
+            directories, position = self._parse_entries(
+                data, position, offset_size, address_size, []
+            )
+            # Relative directories are relative to the compilation directory, entry 0
+            directories[1:] = [
+                self._join(directories, 0, directory) for directory in directories[1:]
+            ]
+            files, position = self._parse_entries(
+                data, position, offset_size, address_size, directories
+            )
+        else:
+            directories = [""]
+
+            while data[position]:
+                directory, position = _read_cstring(data, position)
+                directories.append(directory)
+            position += 1
+
+            # File indexes start from 1 before DWARF 5
+            files = [""]
+
+            while data[position]:
+                name, position = _read_cstring(data, position)
+                directory_index, position = _read_uleb(data, position)
+                _, position = _read_uleb(data, position)
+                _, position = _read_uleb(data, position)
+                files.append(self._join(directories, directory_index, name))
+
+        return _LineProgram(
+            version=version,
+            address_size=address_size,
+            minimum_instruction_length=minimum_instruction_length,
+            default_is_stmt=default_is_stmt,
+            line_base=line_base,
+            line_range=line_range,
+            opcode_base=opcode_base,
+            standard_opcode_lengths=standard_opcode_lengths,
+            files=files,
+            program_start=program_start,
+            program_end=end,
+        )
+
+    def _parse_entries(
+        self,
+        data: bytes,
+        position: int,
+        offset_size: int,
+        address_size: int,
+        directories: list[str],
+    ) -> tuple[list[str], int]:
+        """Parses a DWARF 5 directory or file name table."""
+        format_count = data[position]
+        position += 1
+
+        entry_format = []
+
+        for _ in range(format_count):
+            content_type, position = _read_uleb(data, position)
+            form, position = _read_uleb(data, position)
+            entry_format.append((content_type, form))
+
+        count, position = _read_uleb(data, position)
+
+        entries = []
+
+        for _ in range(count):
+            name, directory_index = "", 0
+
+            for content_type, form in entry_format:
+                value, position = _form_value(
+                    form, data, position, offset_size, address_size
+                )
+
+                if content_type == DW_LNCT_path:
+                    if form == DW_FORM_line_strp:
+                        name = self._string_at(".debug_line_str", value)
+                    elif form == DW_FORM_strp:
+                        name = self._string_at(".debug_str", value)
+                    elif isinstance(value, str):
+                        name = value
+                elif content_type == DW_LNCT_directory_index:
+                    directory_index = value
+
+            entries.append(self._join(directories, directory_index, name))
+
+        return entries, position
+
+    @staticmethod
+    def _join(directories: list[str], index: int, name: str) -> str:
+        """Joins a file name with its directory, if the directory is known."""
+        if name.startswith("/") or not 0 <= index < len(directories):
+            return name
+
+        return os.path.join(directories[index], name)
+
+    def _decode(self, program: _LineProgram):
+        """Runs the line number program of a compilation unit, storing its rows in sorted arrays."""
+        data = self._sections[".debug_line"]
+        position = program.program_start
+
+        rows = []
+        ranges = []
+
+        def reset():
+            return 0, 1, 1, program.default_is_stmt
+
+        address, file, line, is_stmt = reset()
+        sequence_start = None
+
+        while position < program.program_end:
+            opcode = data[position]
+            position += 1
+
+            if opcode >= program.opcode_base:
+                adjusted = opcode - program.opcode_base
+                address += (
+                    adjusted // program.line_range
+                ) * program.minimum_instruction_length
+                line += program.line_base + adjusted % program.line_range
+                rows.append((address, 1, len(rows), file, line, is_stmt))
+                if sequence_start is None:
+                    sequence_start = address
+            elif opcode == 0:
+                length, position = _read_uleb(data, position)
+                sub_opcode = data[position]
+                next_position = position + length
+
+                if sub_opcode == DW_LNE_end_sequence:
+                    # End markers sort before rows starting at the same address
+                    rows.append((address, 0, len(rows), 0, 0, False))
+                    if sequence_start is not None:
+                        ranges.append((sequence_start, address))
+                    address, file, line, is_stmt = reset()
+                    sequence_start = None
+                elif sub_opcode == DW_LNE_set_address:
+                    address = int.from_bytes(
+                        data[position + 1 : next_position], "little"
+                    )
+                elif sub_opcode == DW_LNE_define_file:
+                    name, _ = _read_cstring(data, position + 1)
+                    program.files.append(name)
+
+                position = next_position
+            elif opcode == DW_LNS_copy:
+                rows.append((address, 1, len(rows), file, line, is_stmt))
+                if sequence_start is None:
+                    sequence_start = address
+            elif opcode == DW_LNS_advance_pc:
+                advance, position = _read_uleb(data, position)
+                address += advance * program.minimum_instruction_length
+            elif opcode == DW_LNS_advance_line:
+                advance, position = _read_sleb(data, position)
+                line += advance
+            elif opcode == DW_LNS_set_file:
+                file, position = _read_uleb(data, position)
+            elif opcode == DW_LNS_negate_stmt:
+                is_stmt = not is_stmt
+            elif opcode == DW_LNS_const_add_pc:
+                address += (
+                    (255 - program.opcode_base) // program.line_range
+                ) * program.minimum_instruction_length
+            elif opcode == DW_LNS_fixed_advance_pc:
+                (advance,) = struct.unpack_from("<H", data, position)
+                address += advance
+                position += 2
+            else:
+                # Skip the operands of any other standard opcode
+                for _ in range(program.standard_opcode_lengths[opcode - 1]):
+                    _, position = _read_uleb(data, position)
+
+        rows.sort()
+
+        program.addresses = array("Q", (row[0] for row in rows))
+        program.file_indexes = array("I", (row[3] for row in rows))
+        program.lines = array("I", (row[4] for row in rows))
+        program.statements = array("B", (row[5] for row in rows))
+        program.ranges = ranges
+
+    def _ensure_decoded(self, program: _LineProgram):
+        """Decodes the specified line program, if it has not been decoded yet."""
+        if program.addresses is None:
+            try:
+                self._decode(program)
+            except (ValueError, IndexError, struct.error) as e:
+                liblog.debugger(f"Invalid line program in {self.debug_path}: {e}")
+                program.addresses = array("Q")
+                program.file_indexes = array("I")
+                program.lines = array("I")
+                program.statements = array("B")
+
+    def _build_ranges(self):
+        """Builds the table that maps address ranges to line programs."""
+        ranges = self._ranges_from_aranges()
+
+        if ranges is None:
+            # No usable .debug_aranges, every program must be decoded to learn what it covers
+            ranges = []
+            for offset, program in self._programs.items():
+                self._ensure_decoded(program)
+                ranges.extend((start, end, offset) for start, end in program.ranges)
+
+        ranges.sort()
+
+        self._range_starts = [entry[0] for entry in ranges]
+        self._range_ends = [entry[1] for entry in ranges]
+        self._range_programs = [entry[2] for entry in ranges]
+
+    def _ranges_from_aranges(self) -> list[tuple[int, int, int]] | None:
+        """Returns the (start, end, line program offset) ranges described by .debug_aranges, if present."""
+        data = self._sections[".debug_aranges"]
+
+        if not data or not self._sections[".debug_info"]:
+            return None
+
+        ranges = []
+        position = 0
+
+        try:
+            while position < len(data):
+                unit_start = position
+                length, offset_size, position = _read_unit_length(data, position)
+                end = position + length
+
+                # version
+                position += 2
+                info_offset = int.from_bytes(
+                    data[position : position + offset_size], "little"
+                )
+                position += offset_size
+                address_size = data[position]
+                position += 2
+
+                # Tuples are aligned to twice the address size, from the start of the unit
+                tuple_size = 2 * address_size
+                position += (-(position - unit_start)) % tuple_size
+
+                line_offset = self._stmt_list(info_offset)
+
+                while position + tuple_size <= end:
+                    start = int.from_bytes(
+                        data[position : position + address_size], "little"
+                    )
+                    size = int.from_bytes(
+                        data[position + address_size : position + tuple_size], "little"
+                    )
+                    position += tuple_size
+
+                    if start == 0 and size == 0:
+                        break
+
+                    if line_offset is not None:
+                        ranges.append((start, start + size, line_offset))
+
+                position = end
+        except (ValueError, IndexError, struct.error) as e:
+            liblog.debugger(f"Invalid .debug_aranges in {self.debug_path}: {e}")
+            return None
+
+        return ranges
+
+    def _stmt_list(self, info_offset: int) -> int | None:
+        """Returns the line program offset of the compilation unit at the specified .debug_info offset."""
+        data = self._sections[".debug_info"]
+
+        _, offset_size, position = _read_unit_length(data, info_offset)
+        (version,) = struct.unpack_from("<H", data, position)
+        position += 2
+
+        if version >= 5:
+            unit_type = data[position]
+            address_size = data[position + 1]
+            position += 2
+            abbrev_offset = int.from_bytes(
+                data[position : position + offset_size], "little"
+            )
+            position += offset_size
+
+            if unit_type in (0x4, 0x5):
+                # Skeleton and split units carry a dwo id
+                position += 8
+            elif unit_type in (0x2, 0x6):
+                # Type units carry a signature and a type offset
+                position += 8 + offset_size
+        else:
+            abbrev_offset = int.from_bytes(
+                data[position : position + offset_size], "little"
+            )
+            position += offset_size
+            address_size = data[position]
+            position += 1
+
+        code, position = _read_uleb(data, position)
+
+        for attribute, form in self._abbreviation(abbrev_offset, code):
+            if attribute == DW_AT_stmt_list:
+                value, _ = _form_value(form, data, position, offset_size, address_size)
+                return value
+
+            _, position = _form_value(form, data, position, offset_size, address_size)
+
+        return None
+
+    def _abbreviation(self, abbrev_offset: int, code: int) -> list[tuple[int, int]]:
+        """Returns the (attribute, form) pairs of the specified abbreviation."""
+        data = self._sections[".debug_abbrev"]
+        position = abbrev_offset
+
+        while True:
+            current, position = _read_uleb(data, position)
+
+            if current == 0:
+                return []
+
+            # tag
+            _, position = _read_uleb(data, position)
+            # children flag
+            position += 1
+
+            specification = []
+
+            while True:
+                attribute, position = _read_uleb(data, position)
+                form, position = _read_uleb(data, position)
+
+                if attribute == 0 and form == 0:
+                    break
+
+                if form == DW_FORM_implicit_const:
+                    _, position = _read_sleb(data, position)
+
+                specification.append((attribute, form))
+
+            if current == code:
+                return specification
+
+    def lookup(self, address: int) -> tuple[str, int] | None:
+        """Returns the source file and line of the specified address.
+
+        Args:
+            address (int): The address, relative to the load base of the file.
+
+        Returns:
+            tuple[str, int] | None: The source file and line, or None if the address is not covered by the table.
+        """
+        if self._range_starts is None:
+            self._build_ranges()
+
+        # Compilation units do not overlap, only the closest range can contain the address
+        index = bisect_right(self._range_starts, address) - 1
+
+        if index < 0 or address >= self._range_ends[index]:
+            return None
+
+        program = self._programs.get(self._range_programs[index])
+
+        if program is None:
+            return None
+
+        self._ensure_decoded(program)
+
+        row = bisect_right(program.addresses, address) - 1
+
+        if row < 0 or program.lines[row] == 0:
+            # The address falls in a hole between two sequences
+            return None
+
+        file_index = program.file_indexes[row]
+        file = program.files[file_index] if file_index < len(program.files) else "??"
+
+        return file, program.lines[row]
+
+    def addresses_of(self, file: str, line: int) -> list[int]:
+        """Returns the addresses of the code generated for the specified source line.
+
+        If no code was generated for the line, the closest following line with code in the same file is used.
+
+        Args:
+            file (str): The path of the source file, or a suffix of it, such as `main.c`.
+            line (int): The line in the source file.
+
+        Returns:
+            list[int]: The sorted addresses that start a statement of the line, relative to the load base of the file.
+        """
+        best_line = None
+        addresses = set()
+
+        for program in self._programs.values():
+            indexes = {
+                index
+                for index, path in enumerate(program.files)
+                if path and (path == file or path.endswith("/" + file))
+            }
+
+            if not indexes:
+                continue
+
+            self._ensure_decoded(program)
+
+            for row in range(len(program.addresses)):
+                row_line = program.lines[row]
+
+                if (
+                    row_line < line
+                    or not program.statements[row]
+                    or program.file_indexes[row] not in indexes
+                ):
+                    continue
+
+                if best_line is None or row_line < best_line:
+                    best_line = row_line
+                    addresses = set()
+
+                if row_line == best_line:
+                    addresses.add(program.addresses[row])
+
+        return sorted(addresses)
+
+
+@functools.cache
+def _load_line_table(path: str, debug_info_level: int) -> LineTable | None:
+    """Returns the line table of the specified ELF file, looking for it in the file itself and in its external debug
+    file, or None if neither has one."""
+    candidates = [path]
+
+    try:
+        build_id = get_elf_reader(path).build_id
+    except (OSError, ValueError):
+        return None
+
+    if build_id and debug_info_level > 2:
+        candidates.append(
+            os.path.join(LOCAL_DEBUG_PATH, build_id[:2], build_id[2:] + ".debug")
+        )
+
+    for candidate in candidates:
+        try:
+            if get_elf_reader(candidate).section(".debug_line") is not None:
+                return LineTable(path, candidate)
+        except (OSError, ValueError):
+            continue
+
+    return None
+
+
+def get_line_table(path: str) -> LineTable | None:
+    """Returns the DWARF line table of the specified ELF file, if available at the current symbol level.
+
+    Args:
+        path (str): The path to the ELF file.
+
+    Returns:
+        LineTable | None: The line table, or None if the file has no line information.
+    """
+    if libcontext.sym_lvl < 2:
+        return None
+
+    return _load_line_table(path, libcontext.sym_lvl)
@@ -0,0 +1,367 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from functools import cached_property
+
+ELF_MAGIC = b"\x7fELF"
+
+ELFCLASS32 = 1
+ELFCLASS64 = 2
+ELFDATA2LSB = 1
+ELFDATA2MSB = 2
+
+ET_EXEC = 2
+ET_DYN = 3
+
+PT_LOAD = 1
+PT_DYNAMIC = 2
+PT_INTERP = 3
+PT_NOTE = 4
+PT_GNU_RELRO = 0x6474E552
+
+DT_NULL = 0
+DT_TEXTREL = 22
+DT_FLAGS = 30
+
+DF_TEXTREL = 0x4
+
+NT_GNU_BUILD_ID = 3
+
+# Layouts of the ELF structures, after the 16 bytes of e_ident, indexed by ELF class
+_HEADER_FORMATS = {ELFCLASS32: "HHIIIIIHHHHHH", ELFCLASS64: "HHIQQQIHHHHHH"}
+_PROGRAM_HEADER_FORMATS = {ELFCLASS32: "IIIIIIII", ELFCLASS64: "IIQQQQQQ"}
+_SECTION_HEADER_FORMATS = {ELFCLASS32: "IIIIIIIIII", ELFCLASS64: "IIQQQQIIQQ"}
+_DYNAMIC_FORMATS = {ELFCLASS32: "iI", ELFCLASS64: "qQ"}
+
+
+@dataclass(frozen=True)
+class ElfHeader:
+    """The header of an ELF file.
+
+    Attributes:
+        elf_class (int): The class of the file, ELFCLASS32 or ELFCLASS64.
+        little_endian (bool): Whether the file is little endian.
+        e_type (int): The type of the file, such as ET_EXEC or ET_DYN.
+        e_machine (int): The architecture of the file.
+        e_entry (int): The entry point of the file.
+        e_phoff (int): The file offset of the program header table.
+        e_shoff (int): The file offset of the section header table.
+        e_phentsize (int): The size of a program header.
+        e_phnum (int): The number of program headers.
+        e_shentsize (int): The size of a section header.
+        e_shnum (int): The number of section headers.
+        e_shstrndx (int): The index of the section containing the section names.
+    """
+
+    elf_class: int
+    little_endian: bool
+    e_type: int
+    e_machine: int
+    e_entry: int
+    e_phoff: int
+    e_shoff: int
+    e_phentsize: int
+    e_phnum: int
+    e_shentsize: int
+    e_shnum: int
+    e_shstrndx: int
+
+
+@dataclass(frozen=True)
+class ElfProgramHeader:
+    """A program header (segment) of an ELF file.
+
+    Attributes:
+        p_type (int): The type of the segment.
+        p_flags (int): The permission flags of the segment.
+        p_offset (int): The file offset of the segment.
+        p_vaddr (int): The virtual address of the segment.
+        p_filesz (int): The size of the segment in the file.
+        p_memsz (int): The size of the segment in memory.
+        p_align (int): The alignment of the segment.
+    """
+
+    p_type: int
+    p_flags: int
+    p_offset: int
+    p_vaddr: int
+    p_filesz: int
+    p_memsz: int
+    p_align: int
+
+
+@dataclass(frozen=True)
+class ElfSection:
+    """A section header of an ELF file.
+
+    Attributes:
+        name (str): The name of the section.
+        sh_type (int): The type of the section.
+        sh_flags (int): The flags of the section.
+        sh_addr (int): The virtual address of the section.
+        sh_offset (int): The file offset of the section.
+        sh_size (int): The size of the section.
+    """
+
+    name: str
+    sh_type: int
+    sh_flags: int
+    sh_addr: int
+    sh_offset: int
+    sh_size: int
+
+
+class ElfReader:
+    """A minimal reader of ELF files, which only parses the structures needed by libdebug.
+
+    The ELF header and the program headers are read eagerly, every other structure is read lazily on first access.
+
+    Attributes:
+        path (str): The path of the ELF file.
+        header (ElfHeader): The ELF header.
+        program_headers (list[ElfProgramHeader]): The program headers.
+    """
+
+    def __init__(self, path: str):
+        """Reads the headers of the specified ELF file.
+
+        Args:
+            path (str): The path of the ELF file.
+
+        Raises:
+            ValueError: If the file is not a valid ELF file.
+        """
+        self.path = path
+
+        with open(path, "rb") as elf_file:
+            ident = elf_file.read(16)
+
+            if len(ident) < 16 or ident[:4] != ELF_MAGIC:
+                raise ValueError(f"{path} is not an ELF file.")
+
+            elf_class, data = ident[4], ident[5]
+
+            if elf_class not in _HEADER_FORMATS or data not in (
+                ELFDATA2LSB,
+                ELFDATA2MSB,
+            ):
+                raise ValueError(f"{path} has an unsupported ELF class or encoding.")
+
+            self._endian = "<" if data == ELFDATA2LSB else ">"
+            self._class = elf_class
+
+            fields = self._unpack_from_file(elf_file, _HEADER_FORMATS[elf_class])
+
+            # fields: e_type, e_machine, e_version, e_entry, e_phoff, e_shoff, e_flags,
+            # e_ehsize, e_phentsize, e_phnum, e_shentsize, e_shnum, e_shstrndx
+            self.header = ElfHeader(
+                elf_class=elf_class,
+                little_endian=data == ELFDATA2LSB,
+                e_type=fields[0],
+                e_machine=fields[1],
+                e_entry=fields[3],
+                e_phoff=fields[4],
+                e_shoff=fields[5],
+                e_phentsize=fields[8],
+                e_phnum=fields[9],
+                e_shentsize=fields[10],
+                e_shnum=fields[11],
+                e_shstrndx=fields[12],
+            )
+
+            self.program_headers = []
+
+            fmt = self._endian + _PROGRAM_HEADER_FORMATS[elf_class]
+
+            elf_file.seek(self.header.e_phoff)
+            raw = elf_file.read(self.header.e_phnum * self.header.e_phentsize)
+
+            for i in range(self.header.e_phnum):
+                try:
+                    fields = struct.unpack_from(fmt, raw, i * self.header.e_phentsize)
+                except struct.error as e:
+                    raise ValueError(f"{path} is truncated.") from e
+
+                if elf_class == ELFCLASS64:
+                    p_type, p_flags, p_offset, p_vaddr, _, p_filesz, p_memsz, p_align = (
+                        fields
+                    )
+                else:
+                    p_type, p_offset, p_vaddr, _, p_filesz, p_memsz, p_flags, p_align = (
+                        fields
+                    )
+
+                self.program_headers.append(
+                    ElfProgramHeader(
+                        p_type, p_flags, p_offset, p_vaddr, p_filesz, p_memsz, p_align
+                    )
+                )
+
+    def _unpack_from_file(self, elf_file, fmt: str) -> tuple:
+        """Reads and unpacks a structure from the current position of the file."""
+        fmt = self._endian + fmt
+        raw = elf_file.read(struct.calcsize(fmt))
+
+        try:
+            return struct.unpack(fmt, raw)
+        except struct.error as e:
+            raise ValueError(f"{self.path} is truncated.") from e
+
+    def read(self, offset: int, size: int) -> bytes:
+        """Reads the specified range of the ELF file.
+
+        Args:
+            offset (int): The file offset to read from.
+            size (int): The number of bytes to read.
+
+        Returns:
+            bytes: The read bytes.
+        """
+        with open(self.path, "rb") as elf_file:
+            elf_file.seek(offset)
+            return elf_file.read(size)
+
+    @property
+    def is_pie(self) -> bool:
+        """Whether the file is position independent."""
+        return self.header.e_type == ET_DYN
+
+    @property
+    def entry_point(self) -> int:
+        """The entry point of the file."""
+        return self.header.e_entry
+
+    def segments(self, p_type: int) -> list[ElfProgramHeader]:
+        """Returns the program headers of the specified type.
+
+        Args:
+            p_type (int): The type of the program headers, such as PT_LOAD.
+
+        Returns:
+            list[ElfProgramHeader]: The matching program headers, in file order.
+        """
+        return [ph for ph in self.program_headers if ph.p_type == p_type]
+
+    @cached_property
+    def interpreter(self) -> str | None:
+        """The program interpreter requested by the file (PT_INTERP), if any."""
+        segments = self.segments(PT_INTERP)
+
+        if not segments:
+            return None
+
+        raw = self.read(segments[0].p_offset, segments[0].p_filesz)
+        return raw.split(b"\x00", 1)[0].decode()
+
+    @cached_property
+    def dynamic(self) -> list[tuple[int, int]]:
+        """The (d_tag, d_val) entries of the dynamic segment (PT_DYNAMIC), up to DT_NULL."""
+        segments = self.segments(PT_DYNAMIC)
+
+        if not segments:
+            return []
+
+        fmt = self._endian + _DYNAMIC_FORMATS[self._class]
+        entry_size = struct.calcsize(fmt)
+        raw = self.read(segments[0].p_offset, segments[0].p_filesz)
+
+        entries = []
+
+        for tag, value in struct.iter_unpack(fmt, raw[: len(raw) - len(raw) % entry_size]):
+            if tag == DT_NULL:
+                break
+            entries.append((tag, value))
+
+        return entries
+
+    @cached_property
+    def has_textrel(self) -> bool:
+        """Whether the file needs relocations in non-writable segments (DT_TEXTREL)."""
+        for tag, value in self.dynamic:
+            if tag == DT_TEXTREL or (tag == DT_FLAGS and value & DF_TEXTREL):
+                return True
+
+        return False
+
+    @cached_property
+    def build_id(self) -> str | None:
+        """The GNU build id of the file as a hex string, if any."""
+        for segment in self.segments(PT_NOTE):
+            raw = self.read(segment.p_offset, segment.p_filesz)
+            # Notes are 4-byte aligned in both ELF classes for GNU notes
+            position = 0
+
+            while position + 12 <= len(raw):
+                namesz, descsz, note_type = struct.unpack_from(
+                    self._endian + "III", raw, position
+                )
+                position += 12
+
+                name = raw[position : position + namesz]
+                position += (namesz + 3) & ~3
+
+                desc = raw[position : position + descsz]
+                position += (descsz + 3) & ~3
+
+                if note_type == NT_GNU_BUILD_ID and name == b"GNU\x00":
+                    return desc.hex()
+
+        return None
+
+    @cached_property
+    def sections(self) -> dict[str, ElfSection]:
+        """The sections of the file, keyed by name."""
+        header = self.header
+
+        if not header.e_shoff or not header.e_shnum:
+            return {}
+
+        fmt = self._endian + _SECTION_HEADER_FORMATS[self._class]
+        raw = self.read(header.e_shoff, header.e_shnum * header.e_shentsize)
+
+        raw_sections = []
+
+        for i in range(header.e_shnum):
+            try:
+                fields = struct.unpack_from(fmt, raw, i * header.e_shentsize)
+            except struct.error as e:
+                raise ValueError(f"{self.path} is truncated.") from e
+
+            # fields: sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size, ...
+            raw_sections.append(fields[:6])
+
+        if header.e_shstrndx >= len(raw_sections):
+            return {}
+
+        _, _, _, _, strtab_offset, strtab_size = raw_sections[header.e_shstrndx]
+        strtab = self.read(strtab_offset, strtab_size)
+
+        sections = {}
+
+        for sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size in raw_sections:
+            name = strtab[sh_name : strtab.find(b"\x00", sh_name)].decode(
+                errors="replace"
+            )
+            sections.setdefault(
+                name, ElfSection(name, sh_type, sh_flags, sh_addr, sh_offset, sh_size)
+            )
+
+        return sections
+
+    def section(self, name: str) -> ElfSection | None:
+        """Returns the section with the specified name.
+
+        Args:
+            name (str): The name of the section, such as `.text`.
+
+        Returns:
+            ElfSection | None: The section, or None if the file has no such section.
+        """
+        return self.sections.get(name)
@@ -4,18 +4,19 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
+from __future__ import annotations
+
 import functools
 import os
 from pathlib import Path
-from typing import Tuple
-
-import requests
-from elftools.elf.elffile import ELFFile
+from typing import TYPE_CHECKING, Tuple
 
-from libdebug.cffi.debug_sym_cffi import ffi
-from libdebug.cffi.debug_sym_cffi import lib as lib_sym
+from libdebug.liblog import liblog
 from libdebug.utils.libcontext import libcontext
 
+if TYPE_CHECKING:
+    from libdebug.utils.elf_reader import ElfReader
+
 DEBUGINFOD_PATH: Path = Path.home() / ".cache" / "debuginfod_client"
 LOCAL_DEBUG_PATH: str = "/usr/lib/debug/.build-id/"
 URL_BASE: str = "https://debuginfod.elfutils.org/buildid/{}/debuginfo"
@@ -29,6 +30,9 @@ def _download_debuginfod(buildid: str, debuginfod_path: Path):
         debuginfod_path (Path): The output directory.
     """
 
+    # requests is only needed when debuginfod is actually used
+    import requests
+
     try:
         url = URL_BASE.format(buildid)
         r = requests.get(url, allow_redirects=True)
@@ -73,6 +77,8 @@ def _collect_external_info(path: str) -> dict[str, tuple[int, int]]:
     Returns:
         symbols (dict): A dictionary containing the symbols of the specified external debuginfo file.
     """
+    from libdebug.cffi.debug_sym_cffi import ffi
+    from libdebug.cffi.debug_sym_cffi import lib as lib_sym
 
     symbols = {}
 
@@ -108,6 +114,9 @@ def _parse_elf_file(
         buildid (str): The buildid of the specified ELF file.
         debug_file_path (str): The path to the external debuginfo file corresponding.
     """
+    # The symbol parser pulls in libelf and libdwarf, only load it on first symbol use
+    from libdebug.cffi.debug_sym_cffi import ffi
+    from libdebug.cffi.debug_sym_cffi import lib as lib_sym
 
     symbols = {}
     buildid = None
@@ -143,6 +152,78 @@ def _parse_elf_file(
 
 
 @functools.cache
+def _collect_all_symbols(
+    path: str, debug_info_level: int
+) -> dict[str, Tuple[int, int]]:
+    """Returns a dictionary containing the symbols available locally for the specified ELF file, merging
+    the symbols of the ELF file itself with the ones found in the external debuginfo file.
+
+    Args:
+        path (str): The path to the ELF file.
+        debug_info_level (int): The debug info level.
+
+    Returns:
+        symbols (dict): A dictionary mapping each symbol to its (low_pc, high_pc) range.
+    """
+    symbols, buildid, debug_file = _parse_elf_file(path, debug_info_level)
+
+    # Symbols coming from the ELF file itself come first and take precedence over the external ones
+    collected = dict(symbols)
+
+    # Retrieve the symbols from the external debuginfo file
+    if buildid and debug_file and debug_info_level > 2:
+        folder = buildid[:2]
+        absolute_debug_path_str = os.path.join(LOCAL_DEBUG_PATH, folder, debug_file)
+
+        for symbol, symbol_range in _collect_external_info(absolute_debug_path_str).items():
+            collected.setdefault(symbol, symbol_range)
+
+    return collected
+
+
+def get_all_symbols(path: str) -> dict[str, Tuple[int, int]]:
+    """Returns the symbols of the specified ELF file available locally at the current symbol level.
+
+    The symbols downloaded through debuginfod are not included, see `get_debuginfod_symbols`.
+
+    Args:
+        path (str): The path to the ELF file.
+
+    Returns:
+        dict[str, tuple[int, int]]: A dictionary mapping each symbol to its (low_pc, high_pc) range.
+    """
+    if libcontext.sym_lvl == 0:
+        return {}
+
+    return _collect_all_symbols(path, libcontext.sym_lvl)
+
+
+def get_debuginfod_symbols(path: str) -> dict[str, Tuple[int, int]]:
+    """Returns the symbols of the specified ELF file downloaded through debuginfod, if the current symbol level
+    allows it. As this may require a download, it should only be called when a lookup in the local symbols fails.
+
+    Args:
+        path (str): The path to the ELF file.
+
+    Returns:
+        dict[str, tuple[int, int]]: A dictionary mapping each symbol to its (low_pc, high_pc) range.
+    """
+    if libcontext.sym_lvl <= 4:
+        return {}
+
+    _, buildid, _ = _parse_elf_file(path, libcontext.sym_lvl)
+
+    if not buildid:
+        return {}
+
+    absolute_debug_path = _debuginfod(buildid)
+
+    if not absolute_debug_path.exists():
+        return {}
+
+    return _collect_external_info(str(absolute_debug_path))
+
+
 def resolve_symbol(path: str, symbol: str) -> int:
     """Returns the address of the specified symbol in the specified ELF file.
 
@@ -159,26 +240,14 @@ def resolve_symbol(path: str, symbol: str) -> int:
             value greater than 0."""
         )
 
-    # Retrieve the symbols from the SymbolTableSection
-    symbols, buildid, debug_file = _parse_elf_file(path, libcontext.sym_lvl)
+    symbols = get_all_symbols(path)
     if symbol in symbols:
         return symbols[symbol][0]
 
-    # Retrieve the symbols from the external debuginfo file
-    if buildid and debug_file and libcontext.sym_lvl > 2:
-        folder = buildid[:2]
-        absolute_debug_path_str = os.path.join(LOCAL_DEBUG_PATH, folder, debug_file)
-        symbols = _collect_external_info(absolute_debug_path_str)
-        if symbol in symbols:
-            return symbols[symbol][0]
-
     # Retrieve the symbols from debuginfod
-    if buildid and libcontext.sym_lvl > 4:
-        absolute_debug_path = _debuginfod(buildid)
-        if absolute_debug_path.exists():
-            symbols = _collect_external_info(str(absolute_debug_path))
-            if symbol in symbols:
-                return symbols[symbol][0]
+    symbols = get_debuginfod_symbols(path)
+    if symbol in symbols:
+        return symbols[symbol][0]
 
     # Symbol not found
     raise ValueError(
@@ -186,7 +255,6 @@ def resolve_symbol(path: str, symbol: str) -> int:
     )
 
 
-@functools.cache
 def resolve_address(path: str, address: int) -> str:
     """Returns the symbol corresponding to the specified address in the specified ELF file.
 
@@ -201,29 +269,14 @@ def resolve_address(path: str, address: int) -> str:
     if libcontext.sym_lvl == 0:
         return hex(address)
 
-    # Retrieve the symbols from the SymbolTableSection
-    symbols, buildid, debug_file = _parse_elf_file(path, libcontext.sym_lvl)
-    for symbol, (symbol_start, symbol_end) in symbols.items():
+    for symbol, (symbol_start, symbol_end) in get_all_symbols(path).items():
         if symbol_start <= address < symbol_end:
             return f"{symbol}+{str(address-symbol_start)}"
 
-    # Retrieve the symbols from the external debuginfo file
-    if buildid and debug_file and libcontext.sym_lvl > 2:
-        folder = buildid[:2]
-        absolute_debug_path_str = os.path.join(LOCAL_DEBUG_PATH, folder, debug_file)
-        symbols = _collect_external_info(absolute_debug_path_str)
-        for symbol, (symbol_start, symbol_end) in symbols.items():
-            if symbol_start <= address < symbol_end:
-                return f"{symbol}+{str(address-symbol_start)}"
-
     # Retrieve the symbols from debuginfod
-    if buildid and libcontext.sym_lvl > 4:
-        absolute_debug_path = _debuginfod(buildid)
-        if absolute_debug_path.exists():
-            symbols = _collect_external_info(str(absolute_debug_path))
-            for symbol, (symbol_start, symbol_end) in symbols.items():
-                if symbol_start <= address < symbol_end:
-                    return f"{symbol}+{str(address-symbol_start)}"
+    for symbol, (symbol_start, symbol_end) in get_debuginfod_symbols(path).items():
+        if symbol_start <= address < symbol_end:
+            return f"{symbol}+{str(address-symbol_start)}"
 
     # Address not found
     raise ValueError(
@@ -231,6 +284,37 @@ def resolve_address(path: str, address: int) -> str:
     )
 
 
+@functools.cache
+def get_elf_reader(path: str) -> ElfReader:
+    """Returns a reader of the headers of the specified ELF file.
+
+    Args:
+        path (str): The path to the ELF file.
+
+    Returns:
+        ElfReader: The reader of the specified ELF file.
+    """
+    from libdebug.utils.elf_reader import ElfReader
+
+    return ElfReader(path)
+
+
+def _read_header_with_pyelftools(path: str):
+    """Returns the header of the specified ELF file, as parsed by pyelftools.
+
+    Args:
+        path (str): The path to the ELF file.
+
+    Returns:
+        Container: The header of the specified ELF file.
+    """
+    # pyelftools is slow to import, only pay for it when the builtin reader fails
+    from elftools.elf.elffile import ELFFile
+
+    with open(path, "rb") as elf_file:
+        return ELFFile(elf_file).header
+
+
 @functools.cache
 def is_pie(path: str) -> bool:
     """Returns True if the specified ELF file is position independent, False otherwise.
@@ -241,10 +325,12 @@ def is_pie(path: str) -> bool:
     Returns:
         bool: True if the specified ELF file is position independent, False otherwise.
     """
-    with open(path, "rb") as elf_file:
-        elf = ELFFile(elf_file)
+    try:
+        return get_elf_reader(path).is_pie
+    except ValueError as e:
+        liblog.debugger(f"Falling back to pyelftools for {path}: {e}")
 
-    return elf.header.e_type == "ET_DYN"
+    return _read_header_with_pyelftools(path).e_type == "ET_DYN"
 
 
 @functools.cache
@@ -257,7 +343,42 @@ def get_entry_point(path: str) -> int:
     Returns:
         int: The entry point of the specified ELF file.
     """
-    with open(path, "rb") as elf_file:
-        elf = ELFFile(elf_file)
+    try:
+        return get_elf_reader(path).entry_point
+    except ValueError as e:
+        liblog.debugger(f"Falling back to pyelftools for {path}: {e}")
+
+    return _read_header_with_pyelftools(path).e_entry
+
+
+@functools.cache
+def get_relocated_ranges(path: str) -> list[tuple[int, int]] | None:
+    """Returns the ranges of the specified file that the dynamic loader may modify after mapping it, as
+    page-aligned (start, end) file offsets.
+
+    Args:
+        path (str): The path to the ELF file.
+
+    Returns:
+        list[tuple[int, int]] | None: The ranges, or None if any page of the file may be modified (DT_TEXTREL).
+    """
+    from libdebug.utils.elf_reader import PT_GNU_RELRO
+
+    try:
+        reader = get_elf_reader(path)
+    except ValueError:
+        # Not an ELF file, the loader never touches it
+        return []
 
-    return elf.header.e_entry
+    if reader.has_textrel:
+        return None
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+
+    return [
+        (
+            segment.p_offset & ~(page_size - 1),
+            (segment.p_offset + segment.p_memsz + page_size - 1) & ~(page_size - 1),
+        )
+        for segment in reader.segments(PT_GNU_RELRO)
+    ]
@@ -4,13 +4,81 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
+import errno
+import logging
 import os
+import re
 import time
+from collections import deque
 from select import select
-from typing import Tuple
+from threading import Condition, Thread
+from typing import BinaryIO, Tuple
 
 from libdebug.liblog import liblog
 
+# The maximum number of bytes read from a pipe at once, which is the default capacity of a pipe
+RECV_CHUNK_SIZE = 65536
+
+# The maximum number of buffers written to a pipe at once
+SEND_IOV_MAX = os.sysconf("SC_IOV_MAX")
+
+# How often the background threads check whether the pipes were closed while waiting on them
+PIPE_POLL_INTERVAL = 0.1
+
+# The default maximum size of the data retained for each stream while capturing the output
+CAPTURE_BUFFER_SIZE = 16 * 1024 * 1024
+
+# The size of the buffer of the files the captured output is copied to
+CAPTURE_TEE_BUFFER_SIZE = 1024 * 1024
+
+# The initial size of the buffer preallocated to receive a whole stream, doubled whenever it fills up
+RECVALL_CHUNK_SIZE = 1024 * 1024
+
+
+def _has_assertions(pattern) -> bool:
+    """Returns whether a parsed regular expression looks at data outside of its matches, except for the
+    beginning of a line."""
+    if isinstance(pattern, (list, tuple)):
+        return any(_has_assertions(item) for item in pattern)
+
+    if not hasattr(pattern, "data"):
+        return False
+
+    for op, av in pattern:
+        if str(op) in ("ASSERT", "ASSERT_NOT"):
+            return True
+
+        if str(op) == "AT" and not str(av).startswith("AT_BEGINNING"):
+            return True
+
+        if _has_assertions(av):
+            return True
+
+    return False
+
+
+def _max_match_length(regex: re.Pattern[bytes]) -> int | None:
+    """Returns the maximum length of the matches of a regular expression, or None if it is unbounded or unknown.
+
+    Lookarounds, word boundaries and end anchors are zero-width, yet they depend on the data around the match, so
+    the regular expressions that use them are reported as unbounded.
+    """
+    try:
+        from re import _parser
+    except ImportError:
+        import sre_parse as _parser
+
+    try:
+        parsed = _parser.parse(regex.pattern, regex.flags)
+        _, maximum = parsed.getwidth()
+    except Exception:
+        return None
+
+    if maximum >= _parser.MAXREPEAT or _has_assertions(parsed):
+        return None
+
+    return maximum
+
 
 class PipeManager:
     """Class for managing pipes of the child process"""
@@ -31,6 +99,143 @@ class PipeManager:
         self.stdout_read: int = stdout_read
         self.stderr_read: int = stderr_read
 
+        # The data received from each stream and not yet returned
+        self._stdout_buffer = bytearray()
+        self._stderr_buffer = bytearray()
+
+        # The data sent to stdin and not yet written to the pipe, written by a background thread when the pipe is full
+        self._send_queue: deque[memoryview] = deque()
+        self._send_pending = 0
+        self._send_condition = Condition()
+        self._send_thread: Thread | None = None
+        self._send_error: OSError | None = None
+        self._closed = False
+
+        # The output drained in the background by the capture thread, for each pipe, and its bookkeeping
+        self._captured: dict[int, bytearray] = {}
+        self._capture_eof: set[int] = set()
+        self._capture_dropped: dict[int, int] = {}
+        self._capture_tees: dict[int, BinaryIO] = {}
+        self._capture_owned_files: list[BinaryIO] = []
+        self._capture_max_size = CAPTURE_BUFFER_SIZE
+        self._capture_condition = Condition()
+        self._capture_thread: Thread | None = None
+
+        if stdin_write:
+            # Writes must never block, the child process may be stopped and not reading
+            os.set_blocking(stdin_write, False)
+
+    def _stream(self, stderr: bool) -> tuple[int, bytearray]:
+        """Returns the pipe and the receive buffer of a stream of the child process.
+
+        Args:
+            stderr (bool): whether to return the stderr stream instead of the stdout one.
+
+        Returns:
+            int: the file descriptor of the pipe.
+            bytearray: the receive buffer.
+
+        Raises:
+            RuntimeError: no pipe of the child process.
+        """
+
+        if stderr:
+            pipe_read, buffer = self.stderr_read, self._stderr_buffer
+        else:
+            pipe_read, buffer = self.stdout_read, self._stdout_buffer
+
+        if not pipe_read:
+            raise RuntimeError("No pipe of the child process")
+
+        return pipe_read, buffer
+
+    def _wait_readable(self, pipe_read: int, timeout: float | None) -> bool:
+        """Waits until data or the end of the stream can be read from a pipe.
+
+        Args:
+            pipe_read (int): file descriptor of the pipe.
+            timeout (float): timeout in seconds, None to wait indefinitely.
+
+        Returns:
+            bool: whether the pipe can be read, False on timeout.
+        """
+
+        if pipe_read not in self._captured:
+            ready, _, _ = select(
+                [pipe_read], [], [], None if timeout is None else max(0, timeout)
+            )
+            return bool(ready)
+
+        with self._capture_condition:
+            return self._capture_condition.wait_for(
+                lambda: self._captured[pipe_read] or pipe_read in self._capture_eof,
+                timeout,
+            )
+
+    def _take_captured(self, pipe_read: int, size: int | None) -> bytes:
+        """Takes the oldest data drained from a pipe by the capture thread.
+
+        Args:
+            pipe_read (int): file descriptor of the pipe.
+            size (int): maximum number of bytes to take, None to take all of them.
+
+        Returns:
+            bytes: the data, empty at the end of the stream.
+        """
+
+        with self._capture_condition:
+            captured = self._captured[pipe_read]
+            size = len(captured) if size is None else min(size, len(captured))
+
+            data = bytes(captured[:size])
+            del captured[:size]
+
+        return data
+
+    def _fill(self, pipe_read: int, buffer: bytearray, timeout: float) -> int:
+        """Appends to the receive buffer all the data available in the pipe, waiting for it up to timeout.
+
+        While the output is captured, the oldest data of the receive buffer is dropped to keep it within the maximum
+        buffer size, so that the data waiting for a delimiter is bounded too.
+
+        Args:
+            pipe_read (int): file descriptor of the pipe.
+            buffer (bytearray): receive buffer of the pipe.
+            timeout (float): timeout in seconds.
+
+        Returns:
+            int: number of bytes received, 0 on timeout and at the end of the stream.
+
+        Raises:
+            RuntimeError: the pipe is broken.
+        """
+
+        if not self._wait_readable(pipe_read, timeout):
+            return 0
+
+        if pipe_read in self._captured:
+            data = self._take_captured(pipe_read, None)
+        else:
+            try:
+                data = os.read(pipe_read, RECV_CHUNK_SIZE)
+            except OSError:
+                raise RuntimeError("Broken pipe. Is the child process still running?")
+
+        liblog.pipe("Received %d bytes from the child process: %r", len(data), data)
+
+        buffer += data
+
+        if pipe_read in self._captured:
+            overflow = len(buffer) - self._capture_max_size
+
+            if overflow > 0:
+                del buffer[:overflow]
+
+                with self._capture_condition:
+                    self._capture_dropped[pipe_read] += overflow
+
+        return len(data)
+
     def _recv(
         self,
         numb: int | None = None,
@@ -52,18 +257,7 @@ class PipeManager:
             RuntimeError: no stdout pipe of the child process.
         """
 
-        pipe_read: int
-
-        if stderr:
-            pipe_read = self.stderr_read
-        else:
-            pipe_read = self.stdout_read
-
-        if not pipe_read:
-            raise RuntimeError("No pipe of the child process")
-
-        # Buffer for the received data
-        data_buffer = b""
+        pipe_read, buffer = self._stream(stderr)
 
         if numb:
             # Checking the numb
@@ -72,49 +266,143 @@ class PipeManager:
 
             # Setting the alarm
             end_time = time.time() + timeout
-            while numb > 0:
-                if end_time is not None and time.time() > end_time:
-                    # Timeout reached
+            while len(buffer) < numb:
+                if not self._fill(pipe_read, buffer, end_time - time.time()):
+                    # Timeout or end of the stream reached
                     break
+        elif not buffer:
+            self._fill(pipe_read, buffer, timeout)
 
-                # Adjust the timeout for select to the remaining time
-                remaining_time = (
-                    None if end_time is None else max(0, end_time - time.time())
-                )
-                ready, _, _ = select([pipe_read], [], [], remaining_time)
+        size = numb or len(buffer)
+        data_buffer = bytes(buffer[:size])
+        del buffer[:size]
 
-                if not ready:
-                    # No data ready within the remaining timeout
-                    break
+        return data_buffer
 
-                try:
-                    data = os.read(pipe_read, numb)
-                except OSError:
-                    raise RuntimeError(
-                        "Broken pipe. Is the child process still running?"
-                    )
+    def _capture_thread_function(self):
+        """Drains the output pipes as soon as data is available, until they are closed or reach the end."""
+        pipes = list(self._captured)
 
-                if not data:
-                    # No more data available
+        while pipes:
+            try:
+                ready, _, _ = select(pipes, [], [], PIPE_POLL_INTERVAL)
+            except (OSError, ValueError):
+                # The pipes were closed, the condition below tells
+                ready = []
+
+            chunks = []
+
+            with self._capture_condition:
+                if self._closed:
                     break
 
-                numb -= len(data)
-                data_buffer += data
-        else:
-            ready, _, _ = select([pipe_read], [], [], timeout)
+                for pipe_read in ready:
+                    try:
+                        data = os.read(pipe_read, RECV_CHUNK_SIZE)
+                    except OSError:
+                        # The master side of a terminal reports the end of the stream as an I/O error
+                        data = b""
+
+                    if not data:
+                        self._capture_eof.add(pipe_read)
+                        pipes.remove(pipe_read)
+                        continue
+
+                    captured = self._captured[pipe_read]
+                    captured += data
+
+                    # Only the most recent data is retained
+                    overflow = len(captured) - self._capture_max_size
+
+                    if overflow > 0:
+                        del captured[:overflow]
+                        self._capture_dropped[pipe_read] += overflow
+
+                    chunks.append((pipe_read, data))
 
-            if ready:
-                # Read all available bytes up to 4096
-                data = os.read(pipe_read, 4096)
-                data_buffer += data
+                self._capture_condition.notify_all()
 
-        liblog.pipe(
-            f"Received {len(data_buffer)} bytes from the child process: {data_buffer!r}"
+            for pipe_read, data in chunks:
+                if pipe_read in self._capture_tees:
+                    self._capture_tees[pipe_read].write(data)
+
+        for tee in self._capture_tees.values():
+            tee.flush()
+
+    def capture(
+        self,
+        max_buffer_size: int = CAPTURE_BUFFER_SIZE,
+        tee: str | BinaryIO | None = None,
+        tee_err: str | BinaryIO | None = None,
+    ):
+        """Starts draining the child process stdout and stderr in the background, so that the child process never
+        blocks on a full pipe. The received data is retained for the recv methods up to max_buffer_size bytes for each
+        stream, dropping the oldest data, and can be copied to a file as it arrives.
+
+        Args:
+            max_buffer_size (int, optional): maximum number of bytes retained for each stream. Defaults to 16 MiB.
+            tee (str | BinaryIO, optional): path or binary file to copy stdout to. Defaults to None.
+            tee_err (str | BinaryIO, optional): path or binary file to copy stderr to. Defaults to None.
+
+        Raises:
+            RuntimeError: the output is already being captured.
+        """
+
+        if self._capture_thread is not None:
+            raise RuntimeError("The output is already being captured")
+
+        if max_buffer_size <= 0:
+            raise ValueError("The maximum buffer size must be positive")
+
+        self._capture_max_size = max_buffer_size
+
+        for pipe_read, target in ((self.stdout_read, tee), (self.stderr_read, tee_err)):
+            if not pipe_read:
+                continue
+
+            self._captured[pipe_read] = bytearray()
+            self._capture_dropped[pipe_read] = 0
+
+            if isinstance(target, str):
+                target = open(target, "wb", buffering=CAPTURE_TEE_BUFFER_SIZE)
+                self._capture_owned_files.append(target)
+
+            if target is not None:
+                self._capture_tees[pipe_read] = target
+
+        self._capture_thread = Thread(
+            target=self._capture_thread_function,
+            name="libdebug_pipe_capture",
+            daemon=True,
         )
-        return data_buffer
+        self._capture_thread.start()
+
+    @property
+    def dropped_bytes(self) -> int:
+        """The number of bytes of stdout dropped while capturing the output, because they were not received in time."""
+        with self._capture_condition:
+            return self._capture_dropped.get(self.stdout_read, 0)
+
+    @property
+    def dropped_err_bytes(self) -> int:
+        """The number of bytes of stderr dropped while capturing the output, because they were not received in time."""
+        with self._capture_condition:
+            return self._capture_dropped.get(self.stderr_read, 0)
 
     def close(self):
-        """Closes all the pipes of the child process."""
+        """Closes all the pipes of the child process. The data not yet written to stdin is dropped."""
+        with self._send_condition:
+            self._closed = True
+            self._send_queue.clear()
+            self._send_pending = 0
+            self._send_condition.notify_all()
+
+        if self._capture_thread is not None:
+            self._capture_thread.join()
+
+        for tee in self._capture_owned_files:
+            tee.close()
+
         os.close(self.stdin_write)
         os.close(self.stdout_read)
         os.close(self.stderr_read)
@@ -145,6 +433,156 @@ class PipeManager:
 
         return self._recv(numb=numb, timeout=timeout, stderr=True)
 
+    def _readv(self, pipe_read: int, view: memoryview) -> int:
+        """Reads from a pipe directly into a buffer.
+
+        Args:
+            pipe_read (int): file descriptor of the pipe.
+            view (memoryview): the free part of the buffer.
+
+        Returns:
+            int: number of bytes read, 0 at the end of the stream.
+
+        Raises:
+            RuntimeError: the pipe is broken.
+        """
+
+        if pipe_read in self._captured:
+            data = self._take_captured(pipe_read, len(view))
+            view[: len(data)] = data
+            size = len(data)
+        else:
+            try:
+                size = os.readv(pipe_read, [view])
+            except OSError as e:
+                # The master side of a terminal reports the end of the stream as an I/O error
+                if e.errno == errno.EIO:
+                    return 0
+
+                raise RuntimeError("Broken pipe. Is the child process still running?")
+
+        # The data is only copied out of the buffer if it is going to be logged
+        if liblog.pipe_logger.isEnabledFor(logging.DEBUG):
+            liblog.pipe(
+                "Received %d bytes from the child process: %r", size, bytes(view[:size])
+            )
+
+        return size
+
+    def _recvn(
+        self, numb: int, timeout: float = timeout_default, stderr: bool = False
+    ) -> memoryview:
+        """Receives exactly numb bytes from the child process.
+
+        Args:
+            numb (int): number of bytes to receive.
+            timeout (float, optional): timeout in seconds. Defaults to timeout_default.
+            stderr (bool, optional): receive from stderr. Defaults to False.
+
+        Returns:
+            memoryview: received bytes, without copying them out of the buffer they were read into.
+
+        Raises:
+            ValueError: numb is negative.
+            RuntimeError: no pipe of the child process.
+            TimeoutError: timeout reached, the data received so far stays buffered.
+        """
+
+        if numb < 0:
+            raise ValueError("The number of bytes to receive must be positive")
+
+        pipe_read, buffer = self._stream(stderr)
+
+        if len(buffer) >= numb:
+            data = memoryview(bytes(buffer[:numb]))
+            del buffer[:numb]
+            return data
+
+        # The bytes are read straight into their final place
+        data = bytearray(numb)
+        data[: len(buffer)] = buffer
+        filled = len(buffer)
+        buffer.clear()
+
+        end_time = time.time() + timeout
+
+        with memoryview(data) as view:
+            while filled < numb:
+                ready = self._wait_readable(pipe_read, end_time - time.time())
+
+                size = self._readv(pipe_read, view[filled:]) if ready else 0
+
+                if not size:
+                    # Timeout or end of the stream reached
+                    buffer += view[:filled]
+                    raise TimeoutError("Timeout reached")
+
+                filled += size
+
+        return memoryview(data)
+
+    def _recvall(
+        self,
+        until_eof: bool = True,
+        timeout: float | None = None,
+        stderr: bool = False,
+    ) -> memoryview:
+        """Receives all the data sent by the child process.
+
+        Args:
+            until_eof (bool, optional): wait for the end of the stream, instead of only receiving the data already
+                available. Defaults to True.
+            timeout (float, optional): timeout in seconds when waiting for the end of the stream. Defaults to None.
+            stderr (bool, optional): receive from stderr. Defaults to False.
+
+        Returns:
+            memoryview: received bytes, without copying them out of the buffer they were read into.
+
+        Raises:
+            RuntimeError: no pipe of the child process.
+            TimeoutError: timeout reached, the data received so far stays buffered.
+        """
+
+        pipe_read, buffer = self._stream(stderr)
+
+        data = bytearray(max(RECVALL_CHUNK_SIZE, 2 * len(buffer)))
+        data[: len(buffer)] = buffer
+        filled = len(buffer)
+        buffer.clear()
+
+        end_time = None if timeout is None else time.time() + timeout
+
+        while True:
+            if not until_eof:
+                remaining_time = 0
+            elif end_time is not None:
+                remaining_time = max(0, end_time - time.time())
+            else:
+                remaining_time = None
+
+            if not self._wait_readable(pipe_read, remaining_time):
+                if until_eof:
+                    buffer += data[:filled]
+                    raise TimeoutError("Timeout reached")
+                break
+
+            if filled == len(data):
+                data.extend(bytes(len(data)))
+
+            with memoryview(data) as view:
+                size = self._readv(pipe_read, view[filled:])
+
+            if not size:
+                # End of the stream reached
+                break
+
+            filled += size
+
+        # The unused space is given back, rather than being kept alive by the returned view
+        del data[filled:]
+
+        return memoryview(data)
+
     def _recvonceuntil(
         self,
         delims: bytes,
@@ -172,32 +610,86 @@ class PipeManager:
             liblog.warning("The delimiters are a string, converting to bytes")
             delims = delims.encode()
 
-        # Buffer for the received data
-        data_buffer = b""
+        pipe_read, buffer = self._stream(stderr)
+
+        # The position from which the buffer has not been searched yet
+        searched = 0
 
         # Setting the alarm
         end_time = time.time() + timeout
-        while True:
-            if end_time is not None and time.time() > end_time:
-                # Timeout reached
+        while (index := buffer.find(delims, searched)) < 0:
+            # The delimiters may begin in the last bytes already searched
+            searched = max(0, len(buffer) - len(delims) + 1)
+            size = len(buffer)
+
+            if not (received := self._fill(pipe_read, buffer, end_time - time.time())):
+                # Timeout or end of the stream reached, the data stays in the buffer
                 raise TimeoutError("Timeout reached")
 
-            # Adjust the timeout for select to the remaining time
-            remaining_time = (
-                None if end_time is None else max(0, end_time - time.time())
-            )
+            # The oldest data may have been dropped while capturing the output
+            searched = max(0, searched - (size + received - len(buffer)))
 
-            data = self._recv(numb=1, timeout=remaining_time, stderr=stderr)
+        end = index + len(delims)
+        data_buffer = bytes(buffer[: index if drop else end])
+        del buffer[:end]
 
-            data_buffer += data
+        return data_buffer
 
-            if delims in data_buffer:
-                # Delims reached
-                if drop:
-                    data_buffer = data_buffer[: -len(delims)]
-                break
+    def _recvonceregex(
+        self,
+        regex: re.Pattern[bytes],
+        drop: bool = False,
+        timeout: float = timeout_default,
+        stderr: bool = False,
+    ) -> tuple[bytes, re.Match[bytes]]:
+        """Receives data from the child process until the regular expression matches.
 
-        return data_buffer
+        The data already searched is not searched again, except for the last bytes that can still be part of a match
+        when the length of the matches is bounded.
+
+        Args:
+            regex (re.Pattern[bytes]): regular expression to search.
+            drop (bool, optional): drop the matched data. Defaults to False.
+            timeout (float, optional): timeout in seconds. Defaults to timeout_default.
+            stderr (bool, optional): receive from stderr. Defaults to False.
+
+        Returns:
+            bytes: received data from the child process.
+            re.Match[bytes]: the match.
+
+        Raises:
+            RuntimeError: no pipe of the child process.
+            TimeoutError: timeout reached.
+        """
+
+        pipe_read, buffer = self._stream(stderr)
+        width = _max_match_length(regex)
+
+        # The position from which the buffer has not been searched yet
+        searched = 0
+
+        # Setting the alarm
+        end_time = time.time() + timeout
+        while (match := regex.search(buffer, searched)) is None:
+            if width is not None:
+                searched = max(0, len(buffer) - width + 1)
+
+            size = len(buffer)
+
+            if not (received := self._fill(pipe_read, buffer, end_time - time.time())):
+                # Timeout or end of the stream reached, the data stays in the buffer
+                raise TimeoutError("Timeout reached")
+
+            # The oldest data may have been dropped while capturing the output
+            searched = max(0, searched - (size + received - len(buffer)))
+
+        # The match must not refer to the buffer, which is about to change
+        match = regex.search(bytes(buffer), match.start())
+
+        data_buffer = bytes(buffer[: match.start() if drop else match.end()])
+        del buffer[: match.end()]
+
+        return data_buffer, match
 
     def _recvuntil(
         self,
@@ -241,6 +733,60 @@ class PipeManager:
 
         return data_buffer
 
+    def recvn(self, numb: int, timeout: int = timeout_default) -> memoryview:
+        """Receives exactly numb bytes from the child process stdout.
+
+        Args:
+            numb (int): number of bytes to receive.
+            timeout (int, optional): timeout in seconds. Defaults to timeout_default.
+
+        Returns:
+            memoryview: received bytes from the child process stdout.
+        """
+
+        return self._recvn(numb=numb, timeout=timeout, stderr=False)
+
+    def recverrn(self, numb: int, timeout: int = timeout_default) -> memoryview:
+        """Receives exactly numb bytes from the child process stderr.
+
+        Args:
+            numb (int): number of bytes to receive.
+            timeout (int, optional): timeout in seconds. Defaults to timeout_default.
+
+        Returns:
+            memoryview: received bytes from the child process stderr.
+        """
+
+        return self._recvn(numb=numb, timeout=timeout, stderr=True)
+
+    def recvall(self, until_eof: bool = True, timeout: int | None = None) -> memoryview:
+        """Receives all the data from the child process stdout.
+
+        Args:
+            until_eof (bool, optional): wait for the end of the stream, instead of only receiving the data already
+                available. Defaults to True.
+            timeout (int, optional): timeout in seconds when waiting for the end of the stream. Defaults to None.
+
+        Returns:
+            memoryview: received bytes from the child process stdout.
+        """
+
+        return self._recvall(until_eof=until_eof, timeout=timeout, stderr=False)
+
+    def recverrall(self, until_eof: bool = True, timeout: int | None = None) -> memoryview:
+        """Receives all the data from the child process stderr.
+
+        Args:
+            until_eof (bool, optional): wait for the end of the stream, instead of only receiving the data already
+                available. Defaults to True.
+            timeout (int, optional): timeout in seconds when waiting for the end of the stream. Defaults to None.
+
+        Returns:
+            memoryview: received bytes from the child process stderr.
+        """
+
+        return self._recvall(until_eof=until_eof, timeout=timeout, stderr=True)
+
     def recvuntil(
         self,
         delims: bytes,
@@ -299,6 +845,132 @@ class PipeManager:
 
         return received
 
+    def _recvuntil_any(
+        self,
+        delims: list[bytes],
+        drop: bool = False,
+        timeout: float = timeout_default,
+        stderr: bool = False,
+    ) -> tuple[bytes, bytes]:
+        """Receives data from the child process until any of the delimiters is found.
+
+        Args:
+            delims (list[bytes]): delimiters where to stop.
+            drop (bool, optional): drop the delimiter. Defaults to False.
+            timeout (float, optional): timeout in seconds. Defaults to timeout_default.
+            stderr (bool, optional): receive from stderr. Defaults to False.
+
+        Returns:
+            bytes: received data from the child process.
+            bytes: the delimiter that was found.
+        """
+
+        if not delims:
+            raise ValueError("At least one delimiter must be specified")
+
+        delims = [
+            delim.encode() if isinstance(delim, str) else delim for delim in delims
+        ]
+
+        # All the delimiters are searched in a single pass, the longest one wins when several start at the same byte
+        regex = re.compile(
+            b"|".join(re.escape(delim) for delim in sorted(delims, key=len, reverse=True))
+        )
+
+        data_buffer, match = self._recvonceregex(
+            regex, drop=drop, timeout=timeout, stderr=stderr
+        )
+
+        return data_buffer, match.group()
+
+    def recvuntil_any(
+        self,
+        delims: list[bytes],
+        drop: bool = False,
+        timeout: int = timeout_default,
+    ) -> tuple[bytes, bytes]:
+        """Receives data from the child process stdout until any of the delimiters is found.
+
+        Args:
+            delims (list[bytes]): delimiters where to stop.
+            drop (bool, optional): drop the delimiter. Defaults to False.
+            timeout (int, optional): timeout in seconds. Defaults to timeout_default.
+
+        Returns:
+            bytes: received data from the child process stdout.
+            bytes: the delimiter that was found.
+        """
+
+        return self._recvuntil_any(
+            delims=delims, drop=drop, timeout=timeout, stderr=False
+        )
+
+    def recverruntil_any(
+        self,
+        delims: list[bytes],
+        drop: bool = False,
+        timeout: int = timeout_default,
+    ) -> tuple[bytes, bytes]:
+        """Receives data from the child process stderr until any of the delimiters is found.
+
+        Args:
+            delims (list[bytes]): delimiters where to stop.
+            drop (bool, optional): drop the delimiter. Defaults to False.
+            timeout (int, optional): timeout in seconds. Defaults to timeout_default.
+
+        Returns:
+            bytes: received data from the child process stderr.
+            bytes: the delimiter that was found.
+        """
+
+        return self._recvuntil_any(
+            delims=delims, drop=drop, timeout=timeout, stderr=True
+        )
+
+    def recvregex(
+        self,
+        pattern: bytes | re.Pattern[bytes],
+        drop: bool = False,
+        timeout: int = timeout_default,
+    ) -> tuple[bytes, re.Match[bytes]]:
+        """Receives data from the child process stdout until the regular expression matches.
+
+        Args:
+            pattern (bytes | re.Pattern[bytes]): regular expression to search.
+            drop (bool, optional): drop the matched data. Defaults to False.
+            timeout (int, optional): timeout in seconds. Defaults to timeout_default.
+
+        Returns:
+            bytes: received data from the child process stdout.
+            re.Match[bytes]: the match, whose groups hold the matched data.
+        """
+
+        return self._recvonceregex(
+            re.compile(pattern), drop=drop, timeout=timeout, stderr=False
+        )
+
+    def recverrregex(
+        self,
+        pattern: bytes | re.Pattern[bytes],
+        drop: bool = False,
+        timeout: int = timeout_default,
+    ) -> tuple[bytes, re.Match[bytes]]:
+        """Receives data from the child process stderr until the regular expression matches.
+
+        Args:
+            pattern (bytes | re.Pattern[bytes]): regular expression to search.
+            drop (bool, optional): drop the matched data. Defaults to False.
+            timeout (int, optional): timeout in seconds. Defaults to timeout_default.
+
+        Returns:
+            bytes: received data from the child process stderr.
+            re.Match[bytes]: the match, whose groups hold the matched data.
+        """
+
+        return self._recvonceregex(
+            re.compile(pattern), drop=drop, timeout=timeout, stderr=True
+        )
+
     def recvline(
         self, numlines: int = 1, drop: bool = True, timeout: int = timeout_default
     ) -> bytes:
@@ -335,9 +1007,137 @@ class PipeManager:
             delims=b"\n", occurences=numlines, drop=drop, timeout=timeout
         )
 
+    def _write_pending(self):
+        """Writes as much of the queued data as the stdin pipe can take without blocking. Must be called with the
+        send condition held."""
+
+        while self._send_queue and not self._closed:
+            buffers = [
+                self._send_queue[i]
+                for i in range(min(len(self._send_queue), SEND_IOV_MAX))
+            ]
+
+            try:
+                written = os.writev(self.stdin_write, buffers)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                # The data can never be delivered
+                self._send_error = e
+                self._send_queue.clear()
+                self._send_pending = 0
+                break
+
+            self._send_pending -= written
+
+            while written:
+                if written >= len(self._send_queue[0]):
+                    written -= len(self._send_queue.popleft())
+                else:
+                    self._send_queue[0] = self._send_queue[0][written:]
+                    written = 0
+
+        if not self._send_queue:
+            self._send_condition.notify_all()
+
+    def _send_thread_function(self):
+        """Writes the queued data to the stdin pipe whenever it becomes writable, until the queue is empty."""
+        while True:
+            try:
+                select([], [self.stdin_write], [], PIPE_POLL_INTERVAL)
+            except (OSError, ValueError):
+                # The pipe was closed, the condition below tells
+                pass
+
+            with self._send_condition:
+                self._write_pending()
+
+                if not self._send_queue or self._closed:
+                    self._send_thread = None
+                    return
+
+    def _check_send_error(self):
+        """Raises the error that prevented the queued data from being written, if any."""
+        if self._send_error is not None:
+            self._send_error = None
+            raise RuntimeError("Broken pipe. Is the child process still running?")
+
+    def _enqueue(self, *buffers: bytes) -> int:
+        """Queues data to be sent to the child process stdin and writes what the pipe can take right away.
+
+        Args:
+            *buffers (bytes): data to send, written with a single vectored write when possible.
+
+        Returns:
+            int: number of bytes queued.
+
+        Raises:
+            RuntimeError: no stdin pipe of the child process, or the pipe is broken.
+        """
+
+        if not self.stdin_write:
+            raise RuntimeError("No stdin pipe of the child process")
+
+        size = 0
+
+        with self._send_condition:
+            self._check_send_error()
+
+            for buffer in buffers:
+                if buffer:
+                    # Mutable buffers are copied, the caller may change them before they are written
+                    if not isinstance(buffer, bytes):
+                        buffer = bytes(buffer)
+
+                    self._send_queue.append(memoryview(buffer))
+                    size += len(buffer)
+
+            self._send_pending += size
+            self._write_pending()
+            self._check_send_error()
+
+            if self._send_queue and self._send_thread is None:
+                # The pipe is full, the rest is written in the background as the child process reads
+                self._send_thread = Thread(
+                    target=self._send_thread_function,
+                    name="libdebug_pipe_writer",
+                    daemon=True,
+                )
+                self._send_thread.start()
+
+        return size
+
+    @property
+    def pending_bytes(self) -> int:
+        """The number of bytes sent to the child process stdin and not yet written to the pipe."""
+        with self._send_condition:
+            return self._send_pending
+
+    def flush(self, timeout: float | None = None):
+        """Waits until all the data sent to the child process stdin has been written to the pipe.
+
+        Args:
+            timeout (float, optional): timeout in seconds. Defaults to None.
+
+        Raises:
+            RuntimeError: the pipe is broken.
+            TimeoutError: timeout reached.
+        """
+
+        with self._send_condition:
+            if not self._send_condition.wait_for(
+                lambda: not self._send_queue, timeout
+            ):
+                raise TimeoutError("Timeout reached")
+
+            self._check_send_error()
+
     def send(self, data: bytes) -> int:
         """Sends data to the child process stdin.
 
+        The data is written right away as far as the pipe can take it, the rest is written in the background while
+        the child process reads, so that sending never blocks.
+
         Args:
             data (bytes): data to send.
 
@@ -348,16 +1148,14 @@ class PipeManager:
             RuntimeError: no stdin pipe of the child process.
         """
 
-        if not self.stdin_write:
-            raise RuntimeError("No stdin pipe of the child process")
-
-        liblog.pipe(f"Sending {len(data)} bytes to the child process: {data!r}")
-
         if isinstance(data, str):
             liblog.warning("The input data is a string, converting to bytes")
             data = data.encode()
 
-        return os.write(self.stdin_write, data)
+        if liblog.pipe_logger.isEnabledFor(logging.DEBUG):
+            liblog.pipe("Sending %d bytes to the child process: %r", len(data), data)
+
+        return self._enqueue(data)
 
     def sendline(self, data: bytes) -> int:
         """Sends data to the child process stdin and append a newline.
@@ -373,7 +1171,12 @@ class PipeManager:
             liblog.warning("The input data is a string, converting to bytes")
             data = data.encode()
 
-        return self.send(data=data + b"\n")
+        # The data is only joined with the newline if it is going to be logged
+        if liblog.pipe_logger.isEnabledFor(logging.DEBUG):
+            liblog.pipe("Sending %d bytes to the child process: %r", len(data) + 1, data + b"\n")
+
+        # The data and the newline are written together, without joining them
+        return self._enqueue(data, b"\n")
 
     def sendafter(
         self,
@@ -4,29 +4,143 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
+import ctypes
 import functools
 import os
 
-from libdebug.cffi._personality_cffi import lib as lib_personality
-from libdebug.data.memory_map import MemoryMap
+from libdebug.data.memory_maps import MemoryMaps
 
+# The syscalls that can change the memory maps of a process, by architecture, including those that split or
+# create maps without changing the size of the address space
+# mmap, mprotect, munmap, brk, mremap, madvise, shmat, execve, shmdt, mlock, munlock, mlockall, munlockall, prctl,
+# io_setup, io_destroy, remap_file_pages, mbind, execveat, mlock2, pkey_mprotect, process_madvise, map_shadow_stack,
+# mseal
+MAPS_CHANGING_SYSCALLS = {
+    "amd64": frozenset(
+        {9, 10, 11, 12, 25, 28, 30, 59, 67, 149, 150, 151, 152, 157, 206, 207, 216, 237, 322, 325, 329, 440, 453, 462}
+    ),
+}
 
-@functools.cache
-def get_process_maps(process_id) -> list[MemoryMap]:
+# The bits of the entries of /proc/pid/pagemap
+_PAGEMAP_SOFT_DIRTY = 1 << 55
+_PAGEMAP_FILE_PAGE = 1 << 61
+_PAGEMAP_SWAPPED = 1 << 62
+_PAGEMAP_PRESENT = 1 << 63
+
+# The value written to /proc/pid/clear_refs to reset the soft-dirty bits of a process
+_CLEAR_REFS_SOFT_DIRTY = b"4"
+
+# How much work must be done to know whether the cached maps of a process are still valid
+_MAPS_VALID = 0
+_MAPS_CHECK_STATM = 1
+_MAPS_CHECK_RAW = 2
+_MAPS_STALE = 3
+
+
+class _MapsTracker:
+    """The cached memory maps of a process, together with what is needed to tell whether they changed."""
+
+    __slots__ = ("generation", "maps", "pending", "raw", "statm")
+
+    def __init__(self):
+        self.maps: MemoryMaps | None = None
+        self.raw: bytes = b""
+        self.statm: bytes = b""
+        self.generation: int = 0
+        self.pending: int = _MAPS_STALE
+
+
+_maps_trackers: dict[int, _MapsTracker] = {}
+
+
+def _read_proc_file(process_id: int, name: str) -> bytes:
+    with open(f"/proc/{process_id}/{name}", "rb") as proc_file:
+        return proc_file.read()
+
+
+def get_process_maps(process_id) -> MemoryMaps:
     """Returns the memory maps of the specified process.
 
+    The maps are parsed again only if they might have changed since the last call, and the same collection is
+    returned as long as they did not.
+
     Args:
         process_id (int): The PID of the process whose memory maps should be returned.
 
     Returns:
-        list: A list of `MemoryMap` objects, each representing a memory map of the specified process.
+        MemoryMaps: The memory maps of the specified process.
     """
-    with open(f"/proc/{process_id}/maps", "r") as maps_file:
-        maps = maps_file.readlines()
+    tracker = _maps_trackers.get(process_id)
+
+    if tracker is None:
+        tracker = _maps_trackers[process_id] = _MapsTracker()
+
+    if tracker.pending == _MAPS_VALID:
+        return tracker.maps
+
+    if tracker.pending == _MAPS_CHECK_STATM:
+        # Every syscall was traced, so only the implicit growth of the stack can have changed the maps,
+        # and it always changes the size of the address space
+        statm = _read_proc_file(process_id, "statm")
+
+        if statm == tracker.statm:
+            tracker.pending = _MAPS_VALID
+            return tracker.maps
+
+    raw = _read_proc_file(process_id, "maps")
+    tracker.statm = _read_proc_file(process_id, "statm")
+
+    if tracker.maps is None or raw != tracker.raw:
+        tracker.raw = raw
+        tracker.maps = MemoryMaps.parse(raw.decode())
+        tracker.generation += 1
+
+    tracker.pending = _MAPS_VALID
+
+    return tracker.maps
+
+
+def get_process_maps_generation(process_id) -> int:
+    """Returns the generation of the memory maps of the specified process.
+
+    The generation is incremented every time the maps are found to be different from the previous ones.
+
+    Args:
+        process_id (int): The PID of the process.
+
+    Returns:
+        int: The generation of the memory maps.
+    """
+    get_process_maps(process_id)
+    return _maps_trackers[process_id].generation
+
+
+def notify_process_stopped(process_id: int, syscalls_traced: bool):
+    """Records that the process executed code and is now stopped.
+
+    Args:
+        process_id (int): The PID of the process.
+        syscalls_traced (bool): Whether every syscall executed by the process since it was last stopped was traced.
+    """
+    get_open_fds.cache_clear()
+
+    tracker = _maps_trackers.get(process_id)
 
-    parsed_maps = [MemoryMap.parse(map) for map in maps]
+    if tracker is not None:
+        check = _MAPS_CHECK_STATM if syscalls_traced else _MAPS_CHECK_RAW
+        tracker.pending = max(tracker.pending, check)
 
-    return parsed_maps
+
+def notify_maps_changed(process_id: int):
+    """Records that the process executed a syscall that can change its memory maps.
+
+    Args:
+        process_id (int): The PID of the process.
+    """
+    tracker = _maps_trackers.get(process_id)
+
+    if tracker is not None:
+        tracker.pending = _MAPS_STALE
 
 
 @functools.cache
@@ -46,13 +160,101 @@ def get_open_fds(process_id) -> list[str]:
 
 
 def invalidate_process_cache():
-    """Invalidates the cache of the functions in this module. Must be executed any time the process executes code."""
-    get_process_maps.cache_clear()
+    """Invalidates the cache of the functions in this module. Must be executed any time the process executes code
+    without being traced, after which nothing can be assumed about its state."""
+    _maps_trackers.clear()
+
     get_open_fds.cache_clear()
 
 
+@functools.cache
+def soft_dirty_supported() -> bool:
+    """Returns whether the running kernel tracks the soft-dirty bit of the pages."""
+    page_size = os.sysconf("SC_PAGE_SIZE")
+
+    buffer = bytearray(2 * page_size)
+    address = ctypes.addressof((ctypes.c_char * len(buffer)).from_buffer(buffer))
+    page = (address + page_size - 1) & ~(page_size - 1)
+
+    # A page written after the soft-dirty bits were last reset is always soft-dirty
+    buffer[page - address] = 1
+
+    return bool(get_soft_dirty_pages(os.getpid(), [(page, page + page_size)]))
+
+
+def clear_soft_dirty(process_id: int):
+    """Resets the soft-dirty bit of every page of the specified process.
+
+    Args:
+        process_id (int): The PID of the process.
+    """
+    with open(f"/proc/{process_id}/clear_refs", "wb") as clear_refs:
+        clear_refs.write(_CLEAR_REFS_SOFT_DIRTY)
+
+
+def get_soft_dirty_pages(
+    process_id: int, ranges: list[tuple[int, int]]
+) -> list[int]:
+    """Returns the pages of the specified process written since its soft-dirty bits were last reset.
+
+    Args:
+        process_id (int): The PID of the process.
+        ranges (list[tuple[int, int]]): The page-aligned address ranges to inspect, as (start, end) tuples.
+
+    Returns:
+        list[int]: The addresses of the soft-dirty pages.
+    """
+    return [page for page, entry in _read_pagemap(process_id, ranges) if entry & _PAGEMAP_SOFT_DIRTY]
+
+
+def get_anonymous_pages(
+    process_id: int, ranges: list[tuple[int, int]]
+) -> list[int]:
+    """Returns the pages of the specified process backed by anonymous memory rather than by a file, such as the
+    private copies of the file pages the process wrote to.
+
+    Args:
+        process_id (int): The PID of the process.
+        ranges (list[tuple[int, int]]): The page-aligned address ranges to inspect, as (start, end) tuples.
+
+    Returns:
+        list[int]: The addresses of the anonymous pages.
+    """
+    return [
+        page
+        for page, entry in _read_pagemap(process_id, ranges)
+        if entry & (_PAGEMAP_PRESENT | _PAGEMAP_SWAPPED) and not entry & _PAGEMAP_FILE_PAGE
+    ]
+
+
+def _read_pagemap(
+    process_id: int, ranges: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """Returns the /proc/pid/pagemap entry of every page in the specified ranges, as (address, entry) tuples."""
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    pages = []
+
+    with open(f"/proc/{process_id}/pagemap", "rb", buffering=0) as pagemap:
+        for start, end in ranges:
+            # Every page is described by a 64-bit entry
+            entries = os.pread(
+                pagemap.fileno(),
+                (end - start) // page_size * 8,
+                start // page_size * 8,
+            )
+
+            pages.extend(
+                (start + index * page_size, entry)
+                for index, entry in enumerate(memoryview(entries).cast("Q"))
+            )
+
+    return pages
+
+
 def disable_self_aslr():
     """Disables ASLR for the current process."""
+    from libdebug.cffi._personality_cffi import lib as lib_personality
+
     retval = lib_personality.disable_aslr()
 
     if retval == -1:
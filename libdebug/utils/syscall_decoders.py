@@ -0,0 +1,313 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import functools
+import re
+import socket
+import struct
+from enum import Enum
+from typing import Any, Callable
+
+from libdebug.liblog import liblog
+from libdebug.utils.libcontext import libcontext
+from libdebug.utils.syscall_utils import resolve_syscall_arguments, resolve_syscall_name
+
+# The maximum number of bytes read for each string or buffer
+DEFAULT_MAX_SIZE = 256
+
+# The maximum number of entries read from an array of strings or iovecs
+MAX_ARRAY_ENTRIES = 32
+
+
+class ArgumentKind(Enum):
+    """The kinds of syscall arguments that can be decoded."""
+
+    STRING = "string"
+    STRING_ARRAY = "string_array"
+    BUFFER = "buffer"
+    IOVEC = "iovec"
+    SOCKADDR = "sockaddr"
+    STAT = "stat"
+    STRUCT = "struct"
+
+
+# The layout of struct stat, whose fields are named as in os.stat_result
+STAT_LAYOUTS = {
+    "amd64": struct.Struct("<QQQIII4xQqqqqqqqqq24x"),
+}
+
+STAT_FIELDS = (
+    "st_dev",
+    "st_ino",
+    "st_nlink",
+    "st_mode",
+    "st_uid",
+    "st_gid",
+    "st_rdev",
+    "st_size",
+    "st_blksize",
+    "st_blocks",
+)
+
+# The sizes of the fixed-size structures filled by syscalls, which are decoded as raw bytes
+STRUCT_SIZES = {
+    "__kernel_old_time_t": 8,
+    "struct __kernel_old_timeval": 16,
+    "struct __kernel_timespec": 16,
+    "struct timezone": 8,
+}
+
+# Pointers that refer to the memory of another process
+REMOTE_ARGUMENTS = {("process_vm_readv", "rvec"), ("process_vm_writev", "rvec")}
+
+_DECLARATION = re.compile(r"^(const )?(.*?) ?(\*+)(?:const \*)?(\w+)$")
+_SIZE_HINTS = ("size_t", "len", "count", "siz")
+
+ReadMemory = Callable[[int, int], bytes]
+
+
+@functools.cache
+def get_syscall_decoders(
+    arch: str, number: int
+) -> tuple[tuple[int, str, ArgumentKind, bool], ...]:
+    """Returns the decoders of the arguments of a syscall, derived from its signature.
+
+    Args:
+        arch (str): The architecture, such as amd64.
+        number (int): The syscall number.
+
+    Returns:
+        tuple[tuple[int, str, ArgumentKind, bool], ...]: The index, name, kind and direction of each argument
+            that can be decoded. The direction is True for input arguments, read on entry, and False for output
+            arguments, read on exit.
+    """
+    try:
+        name = resolve_syscall_name(number)
+        signature = resolve_syscall_arguments(number)
+    except ValueError:
+        return ()
+
+    decoders = []
+
+    for index, declaration in enumerate(signature):
+        parsed = _DECLARATION.match(declaration)
+
+        if parsed is None:
+            continue
+
+        is_const, pointee, stars, argument = parsed.groups()
+        is_const = bool(is_const)
+        following = signature[index + 1] if index + 1 < len(signature) else ""
+        sized = any(hint in following for hint in _SIZE_HINTS)
+
+        if (name, argument) in REMOTE_ARGUMENTS:
+            continue
+
+        if declaration.endswith("*const *" + argument) or (stars == "**" and pointee == "char"):
+            if is_const:
+                decoders.append((index, argument, ArgumentKind.STRING_ARRAY, True))
+        elif stars != "*":
+            continue
+        elif pointee in ("char", "void", "unsigned char"):
+            if sized:
+                decoders.append((index, argument, ArgumentKind.BUFFER, is_const))
+            elif is_const and pointee == "char":
+                decoders.append((index, argument, ArgumentKind.STRING, True))
+        elif pointee == "struct iovec" and sized:
+            # Both the buffers of readv and those of writev are meaningful after the syscall
+            decoders.append((index, argument, ArgumentKind.IOVEC, False))
+        elif pointee == "struct sockaddr":
+            # The length follows the address, as a value for inputs and as a pointer for outputs
+            decoders.append((index, argument, ArgumentKind.SOCKADDR, "*" not in following))
+        elif pointee == "struct stat":
+            decoders.append((index, argument, ArgumentKind.STAT, False))
+        elif pointee in STRUCT_SIZES and not is_const:
+            decoders.append((index, argument, ArgumentKind.STRUCT, False))
+
+    return tuple(decoders)
+
+
+@functools.cache
+def get_struct_size(number: int, index: int) -> int:
+    """Returns the size of the fixed-size structure pointed to by an argument of a syscall."""
+    parsed = _DECLARATION.match(resolve_syscall_arguments(number)[index])
+
+    return STRUCT_SIZES[parsed.group(2)]
+
+
+def _read_string(read_memory: ReadMemory, address: int, max_size: int) -> bytes:
+    """Reads a NUL-terminated string of at most `max_size` bytes with a single read."""
+    data = read_memory(address, max_size)
+    terminator = data.find(b"\x00")
+
+    return data if terminator == -1 else data[:terminator]
+
+
+def _read_pointers(read_memory: ReadMemory, address: int, count: int) -> list[int]:
+    """Reads an array of pointers, stopping at the first NULL one."""
+    data = read_memory(address, count * 8)
+    pointers = []
+
+    for (pointer,) in struct.iter_unpack("<Q", data[: len(data) // 8 * 8]):
+        if not pointer:
+            break
+        pointers.append(pointer)
+
+    return pointers
+
+
+def _decode_sockaddr(data: bytes) -> dict[str, Any]:
+    """Decodes a socket address of the AF_UNIX, AF_INET and AF_INET6 families."""
+    if len(data) < 2:
+        return {"family": None, "data": data}
+
+    (family,) = struct.unpack_from("<H", data)
+
+    match family:
+        case socket.AF_UNIX:
+            path = data[2:]
+            # Abstract socket addresses start with a NUL byte
+            if not path.startswith(b"\x00"):
+                path = path.split(b"\x00", 1)[0]
+            return {"family": "AF_UNIX", "path": path}
+        case socket.AF_INET if len(data) >= 8:
+            return {
+                "family": "AF_INET",
+                "address": socket.inet_ntop(socket.AF_INET, data[4:8]),
+                "port": struct.unpack_from(">H", data, 2)[0],
+            }
+        case socket.AF_INET6 if len(data) >= 24:
+            return {
+                "family": "AF_INET6",
+                "address": socket.inet_ntop(socket.AF_INET6, data[8:24]),
+                "port": struct.unpack_from(">H", data, 2)[0],
+            }
+        case _:
+            return {"family": family, "data": data[2:]}
+
+
+def _decode_stat(data: bytes) -> dict[str, int]:
+    """Decodes a struct stat."""
+    layout = STAT_LAYOUTS[libcontext.arch]
+    values = layout.unpack(data[: layout.size])
+
+    decoded = dict(zip(STAT_FIELDS, values))
+
+    for i, field in enumerate(("st_atime_ns", "st_mtime_ns", "st_ctime_ns")):
+        seconds, nanoseconds = values[len(STAT_FIELDS) + 2 * i : len(STAT_FIELDS) + 2 * i + 2]
+        decoded[field] = seconds * 1_000_000_000 + nanoseconds
+
+    return decoded
+
+
+def _decode_argument(
+    read_memory: ReadMemory,
+    syscall_number: int,
+    kind: ArgumentKind,
+    values: list[int],
+    index: int,
+    return_value: int | None,
+    max_size: int,
+    raw: bool,
+) -> Any:
+    """Decodes a single argument, returning None if there is nothing to decode."""
+    address = values[index]
+    following = values[index + 1] if index + 1 < len(values) else 0
+
+    match kind:
+        case ArgumentKind.STRING:
+            return _read_string(read_memory, address, max_size)
+        case ArgumentKind.STRING_ARRAY:
+            return [
+                _read_string(read_memory, pointer, max_size)
+                for pointer in _read_pointers(read_memory, address, MAX_ARRAY_ENTRIES)
+            ]
+        case ArgumentKind.BUFFER:
+            # Inputs are sized by the following argument, outputs by the return value
+            size = following if return_value is None else return_value
+            return read_memory(address, min(size, max_size)) if size > 0 else None
+        case ArgumentKind.IOVEC:
+            remaining = min(return_value, max_size)
+            data = read_memory(address, min(following, MAX_ARRAY_ENTRIES) * 16)
+            buffers = []
+
+            for base, length in struct.iter_unpack("<QQ", data[: len(data) // 16 * 16]):
+                if remaining <= 0:
+                    break
+                buffers.append(read_memory(base, min(length, remaining)) if length else b"")
+                remaining -= length
+
+            return buffers
+        case ArgumentKind.SOCKADDR:
+            if return_value is not None:
+                # The kernel stores the length of the address in the following argument
+                following = struct.unpack("<i", read_memory(following, 4))[0]
+            if following <= 0:
+                return None
+            data = read_memory(address, min(following, 128))
+            return data if raw else _decode_sockaddr(data)
+        case ArgumentKind.STAT:
+            data = read_memory(address, STAT_LAYOUTS[libcontext.arch].size)
+            return data if raw else _decode_stat(data)
+        case ArgumentKind.STRUCT:
+            return read_memory(address, get_struct_size(syscall_number, index))
+
+
+def decode_syscall_arguments(
+    read_memory: ReadMemory,
+    syscall_number: int,
+    values: list[int],
+    return_value: int | None = None,
+    max_size: int = DEFAULT_MAX_SIZE,
+    inputs: bool = True,
+    raw: bool = False,
+) -> dict[str, Any]:
+    """Decodes the strings, buffers and structures pointed to by the arguments of a syscall.
+
+    C strings, arrays of strings, buffers and fixed-size structures are bytes, iovec arrays are lists of bytes,
+    socket addresses and stat structures are dicts. Output arguments are only decoded if the syscall succeeded.
+
+    Args:
+        read_memory (Callable[[int, int], bytes]): Reads a block of memory of the process with a single access.
+        syscall_number (int): The syscall number.
+        values (list[int]): The values of the arguments.
+        return_value (int, optional): The signed return value, if the syscall has been exited. Output arguments
+            are only decoded if it is specified. Defaults to None.
+        max_size (int, optional): The maximum number of bytes to read for each string or buffer.
+            Defaults to 256.
+        inputs (bool, optional): Whether to decode the input arguments. Defaults to True.
+        raw (bool, optional): Whether to return socket addresses and stat structures as bytes, exactly as they are
+            stored in memory. Defaults to False.
+
+    Returns:
+        dict[str, Any]: The decoded values, by argument name.
+    """
+    decoded = {}
+
+    for index, name, kind, is_input in get_syscall_decoders(libcontext.arch, syscall_number):
+        if is_input and not inputs:
+            continue
+
+        if not is_input and (return_value is None or return_value < 0):
+            continue
+
+        if not values[index]:
+            continue
+
+        try:
+            value = _decode_argument(
+                read_memory, syscall_number, kind, values, index, None if is_input else return_value, max_size, raw
+            )
+        except (OSError, OverflowError, ValueError, struct.error):
+            liblog.debugger("Could not decode argument %s at 0x%x", name, values[index])
+            continue
+
+        if value is not None:
+            decoded[name] = value
+
+    return decoded
@@ -0,0 +1,955 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+# Generated by libdebug/utils/syscall_tables/generate.py from the syscall table of https://syscalls.mebeim.net
+# Do not edit by hand, regenerate it instead.
+
+# The names of the syscalls, indexed by number
+SYSCALL_NAMES: tuple[str | None, ...] = (
+    "read",  # 0
+    "write",  # 1
+    "open",  # 2
+    "close",  # 3
+    "newstat",  # 4
+    "newfstat",  # 5
+    "newlstat",  # 6
+    "poll",  # 7
+    "lseek",  # 8
+    "mmap",  # 9
+    "mprotect",  # 10
+    "munmap",  # 11
+    "brk",  # 12
+    "rt_sigaction",  # 13
+    "rt_sigprocmask",  # 14
+    "rt_sigreturn",  # 15
+    "ioctl",  # 16
+    "pread64",  # 17
+    "pwrite64",  # 18
+    "readv",  # 19
+    "writev",  # 20
+    "access",  # 21
+    "pipe",  # 22
+    "select",  # 23
+    "sched_yield",  # 24
+    "mremap",  # 25
+    "msync",  # 26
+    "mincore",  # 27
+    "madvise",  # 28
+    "shmget",  # 29
+    "shmat",  # 30
+    "shmctl",  # 31
+    "dup",  # 32
+    "dup2",  # 33
+    "pause",  # 34
+    "nanosleep",  # 35
+    "getitimer",  # 36
+    "alarm",  # 37
+    "setitimer",  # 38
+    "getpid",  # 39
+    "sendfile64",  # 40
+    "socket",  # 41
+    "connect",  # 42
+    "accept",  # 43
+    "sendto",  # 44
+    "recvfrom",  # 45
+    "sendmsg",  # 46
+    "recvmsg",  # 47
+    "shutdown",  # 48
+    "bind",  # 49
+    "listen",  # 50
+    "getsockname",  # 51
+    "getpeername",  # 52
+    "socketpair",  # 53
+    "setsockopt",  # 54
+    "getsockopt",  # 55
+    "clone",  # 56
+    "fork",  # 57
+    "vfork",  # 58
+    "execve",  # 59
+    "exit",  # 60
+    "wait4",  # 61
+    "kill",  # 62
+    "newuname",  # 63
+    "semget",  # 64
+    "semop",  # 65
+    "semctl",  # 66
+    "shmdt",  # 67
+    "msgget",  # 68
+    "msgsnd",  # 69
+    "msgrcv",  # 70
+    "msgctl",  # 71
+    "fcntl",  # 72
+    "flock",  # 73
+    "fsync",  # 74
+    "fdatasync",  # 75
+    "truncate",  # 76
+    "ftruncate",  # 77
+    "getdents",  # 78
+    "getcwd",  # 79
+    "chdir",  # 80
+    "fchdir",  # 81
+    "rename",  # 82
+    "mkdir",  # 83
+    "rmdir",  # 84
+    "creat",  # 85
+    "link",  # 86
+    "unlink",  # 87
+    "symlink",  # 88
+    "readlink",  # 89
+    "chmod",  # 90
+    "fchmod",  # 91
+    "chown",  # 92
+    "fchown",  # 93
+    "lchown",  # 94
+    "umask",  # 95
+    "gettimeofday",  # 96
+    "getrlimit",  # 97
+    "getrusage",  # 98
+    "sysinfo",  # 99
+    "times",  # 100
+    "ptrace",  # 101
+    "getuid",  # 102
+    "syslog",  # 103
+    "getgid",  # 104
+    "setuid",  # 105
+    "setgid",  # 106
+    "geteuid",  # 107
+    "getegid",  # 108
+    "setpgid",  # 109
+    "getppid",  # 110
+    "getpgrp",  # 111
+    "setsid",  # 112
+    "setreuid",  # 113
+    "setregid",  # 114
+    "getgroups",  # 115
+    "setgroups",  # 116
+    "setresuid",  # 117
+    "getresuid",  # 118
+    "setresgid",  # 119
+    "getresgid",  # 120
+    "getpgid",  # 121
+    "setfsuid",  # 122
+    "setfsgid",  # 123
+    "getsid",  # 124
+    "capget",  # 125
+    "capset",  # 126
+    "rt_sigpending",  # 127
+    "rt_sigtimedwait",  # 128
+    "rt_sigqueueinfo",  # 129
+    "rt_sigsuspend",  # 130
+    "sigaltstack",  # 131
+    "utime",  # 132
+    "mknod",  # 133
+    None,  # 134
+    "personality",  # 135
+    "ustat",  # 136
+    "statfs",  # 137
+    "fstatfs",  # 138
+    "sysfs",  # 139
+    "getpriority",  # 140
+    "setpriority",  # 141
+    "sched_setparam",  # 142
+    "sched_getparam",  # 143
+    "sched_setscheduler",  # 144
+    "sched_getscheduler",  # 145
+    "sched_get_priority_max",  # 146
+    "sched_get_priority_min",  # 147
+    "sched_rr_get_interval",  # 148
+    "mlock",  # 149
+    "munlock",  # 150
+    "mlockall",  # 151
+    "munlockall",  # 152
+    "vhangup",  # 153
+    "modify_ldt",  # 154
+    "pivot_root",  # 155
+    None,  # 156
+    "prctl",  # 157
+    "arch_prctl",  # 158
+    "adjtimex",  # 159
+    "setrlimit",  # 160
+    "chroot",  # 161
+    "sync",  # 162
+    "acct",  # 163
+    "settimeofday",  # 164
+    "mount",  # 165
+    "umount",  # 166
+    "swapon",  # 167
+    "swapoff",  # 168
+    "reboot",  # 169
+    "sethostname",  # 170
+    "setdomainname",  # 171
+    "iopl",  # 172
+    "ioperm",  # 173
+    None,  # 174
+    "init_module",  # 175
+    "delete_module",  # 176
+    None,  # 177
+    None,  # 178
+    "quotactl",  # 179
+    None,  # 180
+    None,  # 181
+    None,  # 182
+    None,  # 183
+    None,  # 184
+    None,  # 185
+    "gettid",  # 186
+    "readahead",  # 187
+    "setxattr",  # 188
+    "lsetxattr",  # 189
+    "fsetxattr",  # 190
+    "getxattr",  # 191
+    "lgetxattr",  # 192
+    "fgetxattr",  # 193
+    "listxattr",  # 194
+    "llistxattr",  # 195
+    "flistxattr",  # 196
+    "removexattr",  # 197
+    "lremovexattr",  # 198
+    "fremovexattr",  # 199
+    "tkill",  # 200
+    "time",  # 201
+    "futex",  # 202
+    "sched_setaffinity",  # 203
+    "sched_getaffinity",  # 204
+    None,  # 205
+    "io_setup",  # 206
+    "io_destroy",  # 207
+    "io_getevents",  # 208
+    "io_submit",  # 209
+    "io_cancel",  # 210
+    None,  # 211
+    None,  # 212
+    "epoll_create",  # 213
+    None,  # 214
+    None,  # 215
+    "remap_file_pages",  # 216
+    "getdents64",  # 217
+    "set_tid_address",  # 218
+    "restart_syscall",  # 219
+    "semtimedop",  # 220
+    "fadvise64",  # 221
+    "timer_create",  # 222
+    "timer_settime",  # 223
+    "timer_gettime",  # 224
+    "timer_getoverrun",  # 225
+    "timer_delete",  # 226
+    "clock_settime",  # 227
+    "clock_gettime",  # 228
+    "clock_getres",  # 229
+    "clock_nanosleep",  # 230
+    "exit_group",  # 231
+    "epoll_wait",  # 232
+    "epoll_ctl",  # 233
+    "tgkill",  # 234
+    "utimes",  # 235
+    None,  # 236
+    "mbind",  # 237
+    "set_mempolicy",  # 238
+    "get_mempolicy",  # 239
+    "mq_open",  # 240
+    "mq_unlink",  # 241
+    "mq_timedsend",  # 242
+    "mq_timedreceive",  # 243
+    "mq_notify",  # 244
+    "mq_getsetattr",  # 245
+    "kexec_load",  # 246
+    "waitid",  # 247
+    "add_key",  # 248
+    "request_key",  # 249
+    "keyctl",  # 250
+    "ioprio_set",  # 251
+    "ioprio_get",  # 252
+    "inotify_init",  # 253
+    "inotify_add_watch",  # 254
+    "inotify_rm_watch",  # 255
+    "migrate_pages",  # 256
+    "openat",  # 257
+    "mkdirat",  # 258
+    "mknodat",  # 259
+    "fchownat",  # 260
+    "futimesat",  # 261
+    "newfstatat",  # 262
+    "unlinkat",  # 263
+    "renameat",  # 264
+    "linkat",  # 265
+    "symlinkat",  # 266
+    "readlinkat",  # 267
+    "fchmodat",  # 268
+    "faccessat",  # 269
+    "pselect6",  # 270
+    "ppoll",  # 271
+    "unshare",  # 272
+    "set_robust_list",  # 273
+    "get_robust_list",  # 274
+    "splice",  # 275
+    "tee",  # 276
+    "sync_file_range",  # 277
+    "vmsplice",  # 278
+    "move_pages",  # 279
+    "utimensat",  # 280
+    "epoll_pwait",  # 281
+    "signalfd",  # 282
+    "timerfd_create",  # 283
+    "eventfd",  # 284
+    "fallocate",  # 285
+    "timerfd_settime",  # 286
+    "timerfd_gettime",  # 287
+    "accept4",  # 288
+    "signalfd4",  # 289
+    "eventfd2",  # 290
+    "epoll_create1",  # 291
+    "dup3",  # 292
+    "pipe2",  # 293
+    "inotify_init1",  # 294
+    "preadv",  # 295
+    "pwritev",  # 296
+    "rt_tgsigqueueinfo",  # 297
+    "perf_event_open",  # 298
+    "recvmmsg",  # 299
+    "fanotify_init",  # 300
+    "fanotify_mark",  # 301
+    "prlimit64",  # 302
+    "name_to_handle_at",  # 303
+    "open_by_handle_at",  # 304
+    "clock_adjtime",  # 305
+    "syncfs",  # 306
+    "sendmmsg",  # 307
+    "setns",  # 308
+    "getcpu",  # 309
+    "process_vm_readv",  # 310
+    "process_vm_writev",  # 311
+    "kcmp",  # 312
+    "finit_module",  # 313
+    "sched_setattr",  # 314
+    "sched_getattr",  # 315
+    "renameat2",  # 316
+    "seccomp",  # 317
+    "getrandom",  # 318
+    "memfd_create",  # 319
+    "kexec_file_load",  # 320
+    "bpf",  # 321
+    "execveat",  # 322
+    "userfaultfd",  # 323
+    "membarrier",  # 324
+    "mlock2",  # 325
+    "copy_file_range",  # 326
+    "preadv2",  # 327
+    "pwritev2",  # 328
+    "pkey_mprotect",  # 329
+    "pkey_alloc",  # 330
+    "pkey_free",  # 331
+    "statx",  # 332
+    "io_pgetevents",  # 333
+    "rseq",  # 334
+    "uretprobe",  # 335
+    None,  # 336
+    None,  # 337
+    None,  # 338
+    None,  # 339
+    None,  # 340
+    None,  # 341
+    None,  # 342
+    None,  # 343
+    None,  # 344
+    None,  # 345
+    None,  # 346
+    None,  # 347
+    None,  # 348
+    None,  # 349
+    None,  # 350
+    None,  # 351
+    None,  # 352
+    None,  # 353
+    None,  # 354
+    None,  # 355
+    None,  # 356
+    None,  # 357
+    None,  # 358
+    None,  # 359
+    None,  # 360
+    None,  # 361
+    None,  # 362
+    None,  # 363
+    None,  # 364
+    None,  # 365
+    None,  # 366
+    None,  # 367
+    None,  # 368
+    None,  # 369
+    None,  # 370
+    None,  # 371
+    None,  # 372
+    None,  # 373
+    None,  # 374
+    None,  # 375
+    None,  # 376
+    None,  # 377
+    None,  # 378
+    None,  # 379
+    None,  # 380
+    None,  # 381
+    None,  # 382
+    None,  # 383
+    None,  # 384
+    None,  # 385
+    None,  # 386
+    None,  # 387
+    None,  # 388
+    None,  # 389
+    None,  # 390
+    None,  # 391
+    None,  # 392
+    None,  # 393
+    None,  # 394
+    None,  # 395
+    None,  # 396
+    None,  # 397
+    None,  # 398
+    None,  # 399
+    None,  # 400
+    None,  # 401
+    None,  # 402
+    None,  # 403
+    None,  # 404
+    None,  # 405
+    None,  # 406
+    None,  # 407
+    None,  # 408
+    None,  # 409
+    None,  # 410
+    None,  # 411
+    None,  # 412
+    None,  # 413
+    None,  # 414
+    None,  # 415
+    None,  # 416
+    None,  # 417
+    None,  # 418
+    None,  # 419
+    None,  # 420
+    None,  # 421
+    None,  # 422
+    None,  # 423
+    "pidfd_send_signal",  # 424
+    "io_uring_setup",  # 425
+    "io_uring_enter",  # 426
+    "io_uring_register",  # 427
+    "open_tree",  # 428
+    "move_mount",  # 429
+    "fsopen",  # 430
+    "fsconfig",  # 431
+    "fsmount",  # 432
+    "fspick",  # 433
+    "pidfd_open",  # 434
+    "clone3",  # 435
+    "close_range",  # 436
+    "openat2",  # 437
+    "pidfd_getfd",  # 438
+    "faccessat2",  # 439
+    "process_madvise",  # 440
+    "epoll_pwait2",  # 441
+    "mount_setattr",  # 442
+    "quotactl_fd",  # 443
+    "landlock_create_ruleset",  # 444
+    "landlock_add_rule",  # 445
+    "landlock_restrict_self",  # 446
+    "memfd_secret",  # 447
+    "process_mrelease",  # 448
+    "futex_waitv",  # 449
+    "set_mempolicy_home_node",  # 450
+    "cachestat",  # 451
+    "fchmodat2",  # 452
+    "map_shadow_stack",  # 453
+    "futex_wake",  # 454
+    "futex_wait",  # 455
+    "futex_requeue",  # 456
+    "statmount",  # 457
+    "listmount",  # 458
+    "lsm_get_self_attr",  # 459
+    "lsm_set_self_attr",  # 460
+    "lsm_list_modules",  # 461
+    "mseal",  # 462
+    "setxattrat",  # 463
+    "getxattrat",  # 464
+    "listxattrat",  # 465
+    "removexattrat",  # 466
+)
+
+# The argument declarations of the syscalls, indexed by number
+SYSCALL_SIGNATURES: tuple[tuple[str, ...] | None, ...] = (
+    ("unsigned int fd", "char *buf", "size_t count"),  # 0 read
+    ("unsigned int fd", "const char *buf", "size_t count"),  # 1 write
+    ("const char *filename", "int flags", "umode_t mode"),  # 2 open
+    ("unsigned int fd",),  # 3 close
+    ("const char *filename", "struct stat *statbuf"),  # 4 newstat
+    ("unsigned int fd", "struct stat *statbuf"),  # 5 newfstat
+    ("const char *filename", "struct stat *statbuf"),  # 6 newlstat
+    ("struct pollfd *ufds", "unsigned int nfds", "int timeout_msecs"),  # 7 poll
+    ("unsigned int fd", "off_t offset", "unsigned int whence"),  # 8 lseek
+    ("unsigned long addr", "unsigned long len", "unsigned long prot", "unsigned long flags", "unsigned long fd", "unsigned long off"),  # 9 mmap
+    ("unsigned long start", "size_t len", "unsigned long prot"),  # 10 mprotect
+    ("unsigned long addr", "size_t len"),  # 11 munmap
+    ("unsigned long brk",),  # 12 brk
+    ("int sig", "const struct sigaction *act", "struct sigaction *oact", "size_t sigsetsize"),  # 13 rt_sigaction
+    ("int how", "sigset_t *nset", "sigset_t *oset", "size_t sigsetsize"),  # 14 rt_sigprocmask
+    (),  # 15 rt_sigreturn
+    ("unsigned int fd", "unsigned int cmd", "unsigned long arg"),  # 16 ioctl
+    ("unsigned int fd", "char *buf", "size_t count", "loff_t pos"),  # 17 pread64
+    ("unsigned int fd", "const char *buf", "size_t count", "loff_t pos"),  # 18 pwrite64
+    ("unsigned long fd", "const struct iovec *vec", "unsigned long vlen"),  # 19 readv
+    ("unsigned long fd", "const struct iovec *vec", "unsigned long vlen"),  # 20 writev
+    ("const char *filename", "int mode"),  # 21 access
+    ("int *fildes",),  # 22 pipe
+    ("int n", "fd_set *inp", "fd_set *outp", "fd_set *exp", "struct __kernel_old_timeval *tvp"),  # 23 select
+    (),  # 24 sched_yield
+    ("unsigned long addr", "unsigned long old_len", "unsigned long new_len", "unsigned long flags", "unsigned long new_addr"),  # 25 mremap
+    ("unsigned long start", "size_t len", "int flags"),  # 26 msync
+    ("unsigned long start", "size_t len", "unsigned char *vec"),  # 27 mincore
+    ("unsigned long start", "size_t len_in", "int behavior"),  # 28 madvise
+    ("key_t key", "size_t size", "int shmflg"),  # 29 shmget
+    ("int shmid", "char *shmaddr", "int shmflg"),  # 30 shmat
+    ("int shmid", "int cmd", "struct shmid_ds *buf"),  # 31 shmctl
+    ("unsigned int fildes",),  # 32 dup
+    ("unsigned int oldfd", "unsigned int newfd"),  # 33 dup2
+    (),  # 34 pause
+    ("struct __kernel_timespec *rqtp", "struct __kernel_timespec *rmtp"),  # 35 nanosleep
+    ("int which", "struct __kernel_old_itimerval *value"),  # 36 getitimer
+    ("unsigned int seconds",),  # 37 alarm
+    ("int which", "struct __kernel_old_itimerval *value", "struct __kernel_old_itimerval *ovalue"),  # 38 setitimer
+    (),  # 39 getpid
+    ("int out_fd", "int in_fd", "loff_t *offset", "size_t count"),  # 40 sendfile64
+    ("int family", "int type", "int protocol"),  # 41 socket
+    ("int fd", "struct sockaddr *uservaddr", "int addrlen"),  # 42 connect
+    ("int fd", "struct sockaddr *upeer_sockaddr", "int *upeer_addrlen"),  # 43 accept
+    ("int fd", "void *buff", "size_t len", "unsigned int flags", "struct sockaddr *addr", "int addr_len"),  # 44 sendto
+    ("int fd", "void *ubuf", "size_t size", "unsigned int flags", "struct sockaddr *addr", "int *addr_len"),  # 45 recvfrom
+    ("int fd", "struct user_msghdr *msg", "unsigned int flags"),  # 46 sendmsg
+    ("int fd", "struct user_msghdr *msg", "unsigned int flags"),  # 47 recvmsg
+    ("int fd", "int how"),  # 48 shutdown
+    ("int fd", "struct sockaddr *umyaddr", "int addrlen"),  # 49 bind
+    ("int fd", "int backlog"),  # 50 listen
+    ("int fd", "struct sockaddr *usockaddr", "int *usockaddr_len"),  # 51 getsockname
+    ("int fd", "struct sockaddr *usockaddr", "int *usockaddr_len"),  # 52 getpeername
+    ("int family", "int type", "int protocol", "int *usockvec"),  # 53 socketpair
+    ("int fd", "int level", "int optname", "char *optval", "int optlen"),  # 54 setsockopt
+    ("int fd", "int level", "int optname", "char *optval", "int *optlen"),  # 55 getsockopt
+    ("unsigned long clone_flags", "unsigned long newsp", "int *parent_tidptr", "int *child_tidptr", "unsigned long tls"),  # 56 clone
+    (),  # 57 fork
+    (),  # 58 vfork
+    ("const char *filename", "const char *const *argv", "const char *const *envp"),  # 59 execve
+    ("int error_code",),  # 60 exit
+    ("pid_t upid", "int *stat_addr", "int options", "struct rusage *ru"),  # 61 wait4
+    ("pid_t pid", "int sig"),  # 62 kill
+    ("struct new_utsname *name",),  # 63 newuname
+    ("key_t key", "int nsems", "int semflg"),  # 64 semget
+    ("int semid", "struct sembuf *tsops", "unsigned nsops"),  # 65 semop
+    ("int semid", "int semnum", "int cmd", "unsigned long arg"),  # 66 semctl
+    ("char *shmaddr",),  # 67 shmdt
+    ("key_t key", "int msgflg"),  # 68 msgget
+    ("int msqid", "struct msgbuf *msgp", "size_t msgsz", "int msgflg"),  # 69 msgsnd
+    ("int msqid", "struct msgbuf *msgp", "size_t msgsz", "long msgtyp", "int msgflg"),  # 70 msgrcv
+    ("int msqid", "int cmd", "struct msqid_ds *buf"),  # 71 msgctl
+    ("unsigned int fd", "unsigned int cmd", "unsigned long arg"),  # 72 fcntl
+    ("unsigned int fd", "unsigned int cmd"),  # 73 flock
+    ("unsigned int fd",),  # 74 fsync
+    ("unsigned int fd",),  # 75 fdatasync
+    ("const char *path", "long length"),  # 76 truncate
+    ("unsigned int fd", "off_t length"),  # 77 ftruncate
+    ("unsigned int fd", "struct linux_dirent *dirent", "unsigned int count"),  # 78 getdents
+    ("char *buf", "unsigned long size"),  # 79 getcwd
+    ("const char *filename",),  # 80 chdir
+    ("unsigned int fd",),  # 81 fchdir
+    ("const char *oldname", "const char *newname"),  # 82 rename
+    ("const char *pathname", "umode_t mode"),  # 83 mkdir
+    ("const char *pathname",),  # 84 rmdir
+    ("const char *pathname", "umode_t mode"),  # 85 creat
+    ("const char *oldname", "const char *newname"),  # 86 link
+    ("const char *pathname",),  # 87 unlink
+    ("const char *oldname", "const char *newname"),  # 88 symlink
+    ("const char *path", "char *buf", "int bufsiz"),  # 89 readlink
+    ("const char *filename", "umode_t mode"),  # 90 chmod
+    ("unsigned int fd", "umode_t mode"),  # 91 fchmod
+    ("const char *filename", "uid_t user", "gid_t group"),  # 92 chown
+    ("unsigned int fd", "uid_t user", "gid_t group"),  # 93 fchown
+    ("const char *filename", "uid_t user", "gid_t group"),  # 94 lchown
+    ("int mask",),  # 95 umask
+    ("struct __kernel_old_timeval *tv", "struct timezone *tz"),  # 96 gettimeofday
+    ("unsigned int resource", "struct rlimit *rlim"),  # 97 getrlimit
+    ("int who", "struct rusage *ru"),  # 98 getrusage
+    ("struct sysinfo *info",),  # 99 sysinfo
+    ("struct tms *tbuf",),  # 100 times
+    ("long request", "long pid", "unsigned long addr", "unsigned long data"),  # 101 ptrace
+    (),  # 102 getuid
+    ("int type", "char *buf", "int len"),  # 103 syslog
+    (),  # 104 getgid
+    ("uid_t uid",),  # 105 setuid
+    ("gid_t gid",),  # 106 setgid
+    (),  # 107 geteuid
+    (),  # 108 getegid
+    ("pid_t pid", "pid_t pgid"),  # 109 setpgid
+    (),  # 110 getppid
+    (),  # 111 getpgrp
+    (),  # 112 setsid
+    ("uid_t ruid", "uid_t euid"),  # 113 setreuid
+    ("gid_t rgid", "gid_t egid"),  # 114 setregid
+    ("int gidsetsize", "gid_t *grouplist"),  # 115 getgroups
+    ("int gidsetsize", "gid_t *grouplist"),  # 116 setgroups
+    ("uid_t ruid", "uid_t euid", "uid_t suid"),  # 117 setresuid
+    ("uid_t *ruidp", "uid_t *euidp", "uid_t *suidp"),  # 118 getresuid
+    ("gid_t rgid", "gid_t egid", "gid_t sgid"),  # 119 setresgid
+    ("gid_t *rgidp", "gid_t *egidp", "gid_t *sgidp"),  # 120 getresgid
+    ("pid_t pid",),  # 121 getpgid
+    ("uid_t uid",),  # 122 setfsuid
+    ("gid_t gid",),  # 123 setfsgid
+    ("pid_t pid",),  # 124 getsid
+    ("cap_user_header_t header", "cap_user_data_t dataptr"),  # 125 capget
+    ("cap_user_header_t header", "const cap_user_data_t data"),  # 126 capset
+    ("sigset_t *uset", "size_t sigsetsize"),  # 127 rt_sigpending
+    ("const sigset_t *uthese", "siginfo_t *uinfo", "const struct __kernel_timespec *uts", "size_t sigsetsize"),  # 128 rt_sigtimedwait
+    ("pid_t pid", "int sig", "siginfo_t *uinfo"),  # 129 rt_sigqueueinfo
+    ("sigset_t *unewset", "size_t sigsetsize"),  # 130 rt_sigsuspend
+    ("const stack_t *uss", "stack_t *uoss"),  # 131 sigaltstack
+    ("char *filename", "struct utimbuf *times"),  # 132 utime
+    ("const char *filename", "umode_t mode", "unsigned dev"),  # 133 mknod
+    None,  # 134
+    ("unsigned int personality",),  # 135 personality
+    ("unsigned dev", "struct ustat *ubuf"),  # 136 ustat
+    ("const char *pathname", "struct statfs *buf"),  # 137 statfs
+    ("unsigned int fd", "struct statfs *buf"),  # 138 fstatfs
+    ("int option", "unsigned long arg1", "unsigned long arg2"),  # 139 sysfs
+    ("int which", "int who"),  # 140 getpriority
+    ("int which", "int who", "int niceval"),  # 141 setpriority
+    ("pid_t pid", "struct sched_param *param"),  # 142 sched_setparam
+    ("pid_t pid", "struct sched_param *param"),  # 143 sched_getparam
+    ("pid_t pid", "int policy", "struct sched_param *param"),  # 144 sched_setscheduler
+    ("pid_t pid",),  # 145 sched_getscheduler
+    ("int policy",),  # 146 sched_get_priority_max
+    ("int policy",),  # 147 sched_get_priority_min
+    ("pid_t pid", "struct __kernel_timespec *interval"),  # 148 sched_rr_get_interval
+    ("unsigned long start", "size_t len"),  # 149 mlock
+    ("unsigned long start", "size_t len"),  # 150 munlock
+    ("int flags",),  # 151 mlockall
+    (),  # 152 munlockall
+    (),  # 153 vhangup
+    ("int func", "void *ptr", "unsigned long bytecount"),  # 154 modify_ldt
+    ("const char *new_root", "const char *put_old"),  # 155 pivot_root
+    None,  # 156
+    ("int option", "unsigned long arg2", "unsigned long arg3", "unsigned long arg4", "unsigned long arg5"),  # 157 prctl
+    ("int option", "unsigned long arg2"),  # 158 arch_prctl
+    ("struct __kernel_timex *txc_p",),  # 159 adjtimex
+    ("unsigned int resource", "struct rlimit *rlim"),  # 160 setrlimit
+    ("const char *filename",),  # 161 chroot
+    (),  # 162 sync
+    ("const char *name",),  # 163 acct
+    ("struct __kernel_old_timeval *tv", "struct timezone *tz"),  # 164 settimeofday
+    ("char *dev_name", "char *dir_name", "char *type", "unsigned long flags", "void *data"),  # 165 mount
+    ("char *name", "int flags"),  # 166 umount
+    ("const char *specialfile", "int swap_flags"),  # 167 swapon
+    ("const char *specialfile",),  # 168 swapoff
+    ("int magic1", "int magic2", "unsigned int cmd", "void *arg"),  # 169 reboot
+    ("char *name", "int len"),  # 170 sethostname
+    ("char *name", "int len"),  # 171 setdomainname
+    ("unsigned int level",),  # 172 iopl
+    ("unsigned long from", "unsigned long num", "int turn_on"),  # 173 ioperm
+    None,  # 174
+    ("void *umod", "unsigned long len", "const char *uargs"),  # 175 init_module
+    ("const char *name_user", "unsigned int flags"),  # 176 delete_module
+    None,  # 177
+    None,  # 178
+    ("unsigned int cmd", "const char *special", "qid_t id", "void *addr"),  # 179 quotactl
+    None,  # 180
+    None,  # 181
+    None,  # 182
+    None,  # 183
+    None,  # 184
+    None,  # 185
+    (),  # 186 gettid
+    ("int fd", "loff_t offset", "size_t count"),  # 187 readahead
+    ("const char *pathname", "const char *name", "const void *value", "size_t size", "int flags"),  # 188 setxattr
+    ("const char *pathname", "const char *name", "const void *value", "size_t size", "int flags"),  # 189 lsetxattr
+    ("int fd", "const char *name", "const void *value", "size_t size", "int flags"),  # 190 fsetxattr
+    ("const char *pathname", "const char *name", "void *value", "size_t size"),  # 191 getxattr
+    ("const char *pathname", "const char *name", "void *value", "size_t size"),  # 192 lgetxattr
+    ("int fd", "const char *name", "void *value", "size_t size"),  # 193 fgetxattr
+    ("const char *pathname", "char *list", "size_t size"),  # 194 listxattr
+    ("const char *pathname", "char *list", "size_t size"),  # 195 llistxattr
+    ("int fd", "char *list", "size_t size"),  # 196 flistxattr
+    ("const char *pathname", "const char *name"),  # 197 removexattr
+    ("const char *pathname", "const char *name"),  # 198 lremovexattr
+    ("int fd", "const char *name"),  # 199 fremovexattr
+    ("pid_t pid", "int sig"),  # 200 tkill
+    ("__kernel_old_time_t *tloc",),  # 201 time
+    ("u32 *uaddr", "int op", "u32 val", "const struct __kernel_timespec *utime", "u32 *uaddr2", "u32 val3"),  # 202 futex
+    ("pid_t pid", "unsigned int len", "unsigned long *user_mask_ptr"),  # 203 sched_setaffinity
+    ("pid_t pid", "unsigned int len", "unsigned long *user_mask_ptr"),  # 204 sched_getaffinity
+    None,  # 205
+    ("unsigned nr_events", "aio_context_t *ctxp"),  # 206 io_setup
+    ("aio_context_t ctx",),  # 207 io_destroy
+    ("aio_context_t ctx_id", "long min_nr", "long nr", "struct io_event *events", "struct __kernel_timespec *timeout"),  # 208 io_getevents
+    ("aio_context_t ctx_id", "long nr", "struct iocb **iocbpp"),  # 209 io_submit
+    ("aio_context_t ctx_id", "struct iocb *iocb", "struct io_event *result"),  # 210 io_cancel
+    None,  # 211
+    None,  # 212
+    ("int size",),  # 213 epoll_create
+    None,  # 214
+    None,  # 215
+    ("unsigned long start", "unsigned long size", "unsigned long prot", "unsigned long pgoff", "unsigned long flags"),  # 216 remap_file_pages
+    ("unsigned int fd", "struct linux_dirent64 *dirent", "unsigned int count"),  # 217 getdents64
+    ("int *tidptr",),  # 218 set_tid_address
+    (),  # 219 restart_syscall
+    ("int semid", "struct sembuf *tsops", "unsigned int nsops", "const struct __kernel_timespec *timeout"),  # 220 semtimedop
+    ("int fd", "loff_t offset", "size_t len", "int advice"),  # 221 fadvise64
+    ("const clockid_t which_clock", "struct sigevent *timer_event_spec", "timer_t *created_timer_id"),  # 222 timer_create
+    ("timer_t timer_id", "int flags", "const struct __kernel_itimerspec *new_setting", "struct __kernel_itimerspec *old_setting"),  # 223 timer_settime
+    ("timer_t timer_id", "struct __kernel_itimerspec *setting"),  # 224 timer_gettime
+    ("timer_t timer_id",),  # 225 timer_getoverrun
+    ("timer_t timer_id",),  # 226 timer_delete
+    ("const clockid_t which_clock", "const struct __kernel_timespec *tp"),  # 227 clock_settime
+    ("const clockid_t which_clock", "struct __kernel_timespec *tp"),  # 228 clock_gettime
+    ("const clockid_t which_clock", "struct __kernel_timespec *tp"),  # 229 clock_getres
+    ("const clockid_t which_clock", "int flags", "const struct __kernel_timespec *rqtp", "struct __kernel_timespec *rmtp"),  # 230 clock_nanosleep
+    ("int error_code",),  # 231 exit_group
+    ("int epfd", "struct epoll_event *events", "int maxevents", "int timeout"),  # 232 epoll_wait
+    ("int epfd", "int op", "int fd", "struct epoll_event *event"),  # 233 epoll_ctl
+    ("pid_t tgid", "pid_t pid", "int sig"),  # 234 tgkill
+    ("char *filename", "struct __kernel_old_timeval *utimes"),  # 235 utimes
+    None,  # 236
+    ("unsigned long start", "unsigned long len", "unsigned long mode", "const unsigned long *nmask", "unsigned long maxnode", "unsigned int flags"),  # 237 mbind
+    ("int mode", "const unsigned long *nmask", "unsigned long maxnode"),  # 238 set_mempolicy
+    ("int *policy", "unsigned long *nmask", "unsigned long maxnode", "unsigned long addr", "unsigned long flags"),  # 239 get_mempolicy
+    ("const char *u_name", "int oflag", "umode_t mode", "struct mq_attr *u_attr"),  # 240 mq_open
+    ("const char *u_name",),  # 241 mq_unlink
+    ("mqd_t mqdes", "const char *u_msg_ptr", "size_t msg_len", "unsigned int msg_prio", "const struct __kernel_timespec *u_abs_timeout"),  # 242 mq_timedsend
+    ("mqd_t mqdes", "char *u_msg_ptr", "size_t msg_len", "unsigned int *u_msg_prio", "const struct __kernel_timespec *u_abs_timeout"),  # 243 mq_timedreceive
+    ("mqd_t mqdes", "const struct sigevent *u_notification"),  # 244 mq_notify
+    ("mqd_t mqdes", "const struct mq_attr *u_mqstat", "struct mq_attr *u_omqstat"),  # 245 mq_getsetattr
+    ("unsigned long entry", "unsigned long nr_segments", "struct kexec_segment *segments", "unsigned long flags"),  # 246 kexec_load
+    ("int which", "pid_t upid", "struct siginfo *infop", "int options", "struct rusage *ru"),  # 247 waitid
+    ("const char *_type", "const char *_description", "const void *_payload", "size_t plen", "key_serial_t ringid"),  # 248 add_key
+    ("const char *_type", "const char *_description", "const char *_callout_info", "key_serial_t destringid"),  # 249 request_key
+    ("int option", "unsigned long arg2", "unsigned long arg3", "unsigned long arg4", "unsigned long arg5"),  # 250 keyctl
+    ("int which", "int who", "int ioprio"),  # 251 ioprio_set
+    ("int which", "int who"),  # 252 ioprio_get
+    (),  # 253 inotify_init
+    ("int fd", "const char *pathname", "u32 mask"),  # 254 inotify_add_watch
+    ("int fd", "__s32 wd"),  # 255 inotify_rm_watch
+    ("pid_t pid", "unsigned long maxnode", "const unsigned long *old_nodes", "const unsigned long *new_nodes"),  # 256 migrate_pages
+    ("int dfd", "const char *filename", "int flags", "umode_t mode"),  # 257 openat
+    ("int dfd", "const char *pathname", "umode_t mode"),  # 258 mkdirat
+    ("int dfd", "const char *filename", "umode_t mode", "unsigned int dev"),  # 259 mknodat
+    ("int dfd", "const char *filename", "uid_t user", "gid_t group", "int flag"),  # 260 fchownat
+    ("int dfd", "const char *filename", "struct __kernel_old_timeval *utimes"),  # 261 futimesat
+    ("int dfd", "const char *filename", "struct stat *statbuf", "int flag"),  # 262 newfstatat
+    ("int dfd", "const char *pathname", "int flag"),  # 263 unlinkat
+    ("int olddfd", "const char *oldname", "int newdfd", "const char *newname"),  # 264 renameat
+    ("int olddfd", "const char *oldname", "int newdfd", "const char *newname", "int flags"),  # 265 linkat
+    ("const char *oldname", "int newdfd", "const char *newname"),  # 266 symlinkat
+    ("int dfd", "const char *pathname", "char *buf", "int bufsiz"),  # 267 readlinkat
+    ("int dfd", "const char *filename", "umode_t mode"),  # 268 fchmodat
+    ("int dfd", "const char *filename", "int mode"),  # 269 faccessat
+    ("int n", "fd_set *inp", "fd_set *outp", "fd_set *exp", "struct __kernel_timespec *tsp", "void *sig"),  # 270 pselect6
+    ("struct pollfd *ufds", "unsigned int nfds", "struct __kernel_timespec *tsp", "const sigset_t *sigmask", "size_t sigsetsize"),  # 271 ppoll
+    ("unsigned long unshare_flags",),  # 272 unshare
+    ("struct robust_list_head *head", "size_t len"),  # 273 set_robust_list
+    ("int pid", "struct robust_list_head **head_ptr", "size_t *len_ptr"),  # 274 get_robust_list
+    ("int fd_in", "loff_t *off_in", "int fd_out", "loff_t *off_out", "size_t len", "unsigned int flags"),  # 275 splice
+    ("int fdin", "int fdout", "size_t len", "unsigned int flags"),  # 276 tee
+    ("int fd", "loff_t offset", "loff_t nbytes", "unsigned int flags"),  # 277 sync_file_range
+    ("int fd", "const struct iovec *uiov", "unsigned long nr_segs", "unsigned int flags"),  # 278 vmsplice
+    ("pid_t pid", "unsigned long nr_pages", "const void **pages", "const int *nodes", "int *status", "int flags"),  # 279 move_pages
+    ("int dfd", "const char *filename", "struct __kernel_timespec *utimes", "int flags"),  # 280 utimensat
+    ("int epfd", "struct epoll_event *events", "int maxevents", "int timeout", "const sigset_t *sigmask", "size_t sigsetsize"),  # 281 epoll_pwait
+    ("int ufd", "sigset_t *user_mask", "size_t sizemask"),  # 282 signalfd
+    ("int clockid", "int flags"),  # 283 timerfd_create
+    ("unsigned int count",),  # 284 eventfd
+    ("int fd", "int mode", "loff_t offset", "loff_t len"),  # 285 fallocate
+    ("int ufd", "int flags", "const struct __kernel_itimerspec *utmr", "struct __kernel_itimerspec *otmr"),  # 286 timerfd_settime
+    ("int ufd", "struct __kernel_itimerspec *otmr"),  # 287 timerfd_gettime
+    ("int fd", "struct sockaddr *upeer_sockaddr", "int *upeer_addrlen", "int flags"),  # 288 accept4
+    ("int ufd", "sigset_t *user_mask", "size_t sizemask", "int flags"),  # 289 signalfd4
+    ("unsigned int count", "int flags"),  # 290 eventfd2
+    ("int flags",),  # 291 epoll_create1
+    ("unsigned int oldfd", "unsigned int newfd", "int flags"),  # 292 dup3
+    ("int *fildes", "int flags"),  # 293 pipe2
+    ("int flags",),  # 294 inotify_init1
+    ("unsigned long fd", "const struct iovec *vec", "unsigned long vlen", "unsigned long pos_l", "unsigned long pos_h"),  # 295 preadv
+    ("unsigned long fd", "const struct iovec *vec", "unsigned long vlen", "unsigned long pos_l", "unsigned long pos_h"),  # 296 pwritev
+    ("pid_t tgid", "pid_t pid", "int sig", "siginfo_t *uinfo"),  # 297 rt_tgsigqueueinfo
+    ("struct perf_event_attr *attr_uptr", "pid_t pid", "int cpu", "int group_fd", "unsigned long flags"),  # 298 perf_event_open
+    ("int fd", "struct mmsghdr *mmsg", "unsigned int vlen", "unsigned int flags", "struct __kernel_timespec *timeout"),  # 299 recvmmsg
+    ("unsigned int flags", "unsigned int event_f_flags"),  # 300 fanotify_init
+    ("int fanotify_fd", "unsigned int flags", "__u64 mask", "int dfd", "const char *pathname"),  # 301 fanotify_mark
+    ("pid_t pid", "unsigned int resource", "const struct rlimit64 *new_rlim", "struct rlimit64 *old_rlim"),  # 302 prlimit64
+    ("int dfd", "const char *name", "struct file_handle *handle", "void *mnt_id", "int flag"),  # 303 name_to_handle_at
+    ("int mountdirfd", "struct file_handle *handle", "int flags"),  # 304 open_by_handle_at
+    ("const clockid_t which_clock", "struct __kernel_timex *utx"),  # 305 clock_adjtime
+    ("int fd",),  # 306 syncfs
+    ("int fd", "struct mmsghdr *mmsg", "unsigned int vlen", "unsigned int flags"),  # 307 sendmmsg
+    ("int fd", "int flags"),  # 308 setns
+    ("unsigned *cpup", "unsigned *nodep", "struct getcpu_cache *unused"),  # 309 getcpu
+    ("pid_t pid", "const struct iovec *lvec", "unsigned long liovcnt", "const struct iovec *rvec", "unsigned long riovcnt", "unsigned long flags"),  # 310 process_vm_readv
+    ("pid_t pid", "const struct iovec *lvec", "unsigned long liovcnt", "const struct iovec *rvec", "unsigned long riovcnt", "unsigned long flags"),  # 311 process_vm_writev
+    ("pid_t pid1", "pid_t pid2", "int type", "unsigned long idx1", "unsigned long idx2"),  # 312 kcmp
+    ("int fd", "const char *uargs", "int flags"),  # 313 finit_module
+    ("pid_t pid", "struct sched_attr *uattr", "unsigned int flags"),  # 314 sched_setattr
+    ("pid_t pid", "struct sched_attr *uattr", "unsigned int usize", "unsigned int flags"),  # 315 sched_getattr
+    ("int olddfd", "const char *oldname", "int newdfd", "const char *newname", "unsigned int flags"),  # 316 renameat2
+    ("unsigned int op", "unsigned int flags", "void *uargs"),  # 317 seccomp
+    ("char *ubuf", "size_t len", "unsigned int flags"),  # 318 getrandom
+    ("const char *uname", "unsigned int flags"),  # 319 memfd_create
+    ("int kernel_fd", "int initrd_fd", "unsigned long cmdline_len", "const char *cmdline_ptr", "unsigned long flags"),  # 320 kexec_file_load
+    ("int cmd", "union bpf_attr *uattr", "unsigned int size"),  # 321 bpf
+    ("int fd", "const char *filename", "const char *const *argv", "const char *const *envp", "int flags"),  # 322 execveat
+    ("int flags",),  # 323 userfaultfd
+    ("int cmd", "unsigned int flags", "int cpu_id"),  # 324 membarrier
+    ("unsigned long start", "size_t len", "int flags"),  # 325 mlock2
+    ("int fd_in", "loff_t *off_in", "int fd_out", "loff_t *off_out", "size_t len", "unsigned int flags"),  # 326 copy_file_range
+    ("unsigned long fd", "const struct iovec *vec", "unsigned long vlen", "unsigned long pos_l", "unsigned long pos_h", "rwf_t flags"),  # 327 preadv2
+    ("unsigned long fd", "const struct iovec *vec", "unsigned long vlen", "unsigned long pos_l", "unsigned long pos_h", "rwf_t flags"),  # 328 pwritev2
+    ("unsigned long start", "size_t len", "unsigned long prot", "int pkey"),  # 329 pkey_mprotect
+    ("unsigned long flags", "unsigned long init_val"),  # 330 pkey_alloc
+    ("int pkey",),  # 331 pkey_free
+    ("int dfd", "const char *filename", "unsigned flags", "unsigned int mask", "struct statx *buffer"),  # 332 statx
+    ("aio_context_t ctx_id", "long min_nr", "long nr", "struct io_event *events", "struct __kernel_timespec *timeout", "const struct __aio_sigset *usig"),  # 333 io_pgetevents
+    ("struct rseq *rseq", "u32 rseq_len", "int flags", "u32 sig"),  # 334 rseq
+    (),  # 335 uretprobe
+    None,  # 336
+    None,  # 337
+    None,  # 338
+    None,  # 339
+    None,  # 340
+    None,  # 341
+    None,  # 342
+    None,  # 343
+    None,  # 344
+    None,  # 345
+    None,  # 346
+    None,  # 347
+    None,  # 348
+    None,  # 349
+    None,  # 350
+    None,  # 351
+    None,  # 352
+    None,  # 353
+    None,  # 354
+    None,  # 355
+    None,  # 356
+    None,  # 357
+    None,  # 358
+    None,  # 359
+    None,  # 360
+    None,  # 361
+    None,  # 362
+    None,  # 363
+    None,  # 364
+    None,  # 365
+    None,  # 366
+    None,  # 367
+    None,  # 368
+    None,  # 369
+    None,  # 370
+    None,  # 371
+    None,  # 372
+    None,  # 373
+    None,  # 374
+    None,  # 375
+    None,  # 376
+    None,  # 377
+    None,  # 378
+    None,  # 379
+    None,  # 380
+    None,  # 381
+    None,  # 382
+    None,  # 383
+    None,  # 384
+    None,  # 385
+    None,  # 386
+    None,  # 387
+    None,  # 388
+    None,  # 389
+    None,  # 390
+    None,  # 391
+    None,  # 392
+    None,  # 393
+    None,  # 394
+    None,  # 395
+    None,  # 396
+    None,  # 397
+    None,  # 398
+    None,  # 399
+    None,  # 400
+    None,  # 401
+    None,  # 402
+    None,  # 403
+    None,  # 404
+    None,  # 405
+    None,  # 406
+    None,  # 407
+    None,  # 408
+    None,  # 409
+    None,  # 410
+    None,  # 411
+    None,  # 412
+    None,  # 413
+    None,  # 414
+    None,  # 415
+    None,  # 416
+    None,  # 417
+    None,  # 418
+    None,  # 419
+    None,  # 420
+    None,  # 421
+    None,  # 422
+    None,  # 423
+    ("int pidfd", "int sig", "siginfo_t *info", "unsigned int flags"),  # 424 pidfd_send_signal
+    ("u32 entries", "struct io_uring_params *params"),  # 425 io_uring_setup
+    ("unsigned int fd", "u32 to_submit", "u32 min_complete", "u32 flags", "const void *argp", "size_t argsz"),  # 426 io_uring_enter
+    ("unsigned int fd", "unsigned int opcode", "void *arg", "unsigned int nr_args"),  # 427 io_uring_register
+    ("int dfd", "const char *filename", "unsigned flags"),  # 428 open_tree
+    ("int from_dfd", "const char *from_pathname", "int to_dfd", "const char *to_pathname", "unsigned int flags"),  # 429 move_mount
+    ("const char *_fs_name", "unsigned int flags"),  # 430 fsopen
+    ("int fd", "unsigned int cmd", "const char *_key", "const void *_value", "int aux"),  # 431 fsconfig
+    ("int fs_fd", "unsigned int flags", "unsigned int attr_flags"),  # 432 fsmount
+    ("int dfd", "const char *path", "unsigned int flags"),  # 433 fspick
+    ("pid_t pid", "unsigned int flags"),  # 434 pidfd_open
+    ("struct clone_args *uargs", "size_t size"),  # 435 clone3
+    ("unsigned int fd", "unsigned int max_fd", "unsigned int flags"),  # 436 close_range
+    ("int dfd", "const char *filename", "struct open_how *how", "size_t usize"),  # 437 openat2
+    ("int pidfd", "int fd", "unsigned int flags"),  # 438 pidfd_getfd
+    ("int dfd", "const char *filename", "int mode", "int flags"),  # 439 faccessat2
+    ("int pidfd", "const struct iovec *vec", "size_t vlen", "int behavior", "unsigned int flags"),  # 440 process_madvise
+    ("int epfd", "struct epoll_event *events", "int maxevents", "const struct __kernel_timespec *timeout", "const sigset_t *sigmask", "size_t sigsetsize"),  # 441 epoll_pwait2
+    ("int dfd", "const char *path", "unsigned int flags", "struct mount_attr *uattr", "size_t usize"),  # 442 mount_setattr
+    ("unsigned int fd", "unsigned int cmd", "qid_t id", "void *addr"),  # 443 quotactl_fd
+    ("const struct landlock_ruleset_attr *const attr", "const size_t size", "const __u32 flags"),  # 444 landlock_create_ruleset
+    ("const int ruleset_fd", "const enum landlock_rule_type rule_type", "const void *const rule_attr", "const __u32 flags"),  # 445 landlock_add_rule
+    ("const int ruleset_fd", "const __u32 flags"),  # 446 landlock_restrict_self
+    ("unsigned int flags",),  # 447 memfd_secret
+    ("int pidfd", "unsigned int flags"),  # 448 process_mrelease
+    ("struct futex_waitv *waiters", "unsigned int nr_futexes", "unsigned int flags", "struct __kernel_timespec *timeout", "clockid_t clockid"),  # 449 futex_waitv
+    ("unsigned long start", "unsigned long len", "unsigned long home_node", "unsigned long flags"),  # 450 set_mempolicy_home_node
+    ("unsigned int fd", "struct cachestat_range *cstat_range", "struct cachestat *cstat", "unsigned int flags"),  # 451 cachestat
+    ("int dfd", "const char *filename", "umode_t mode", "unsigned int flags"),  # 452 fchmodat2
+    ("unsigned long addr", "unsigned long size", "unsigned int flags"),  # 453 map_shadow_stack
+    ("void *uaddr", "unsigned long mask", "int nr", "unsigned int flags"),  # 454 futex_wake
+    ("void *uaddr", "unsigned long val", "unsigned long mask", "unsigned int flags", "struct __kernel_timespec *timeout", "clockid_t clockid"),  # 455 futex_wait
+    ("struct futex_waitv *waiters", "unsigned int flags", "int nr_wake", "int nr_requeue"),  # 456 futex_requeue
+    ("const struct mnt_id_req *req", "struct statmount *buf", "size_t bufsize", "unsigned int flags"),  # 457 statmount
+    ("const struct mnt_id_req *req", "u64 *mnt_ids", "size_t nr_mnt_ids", "unsigned int flags"),  # 458 listmount
+    ("unsigned int attr", "struct lsm_ctx *ctx", "u32 *size", "u32 flags"),  # 459 lsm_get_self_attr
+    ("unsigned int attr", "struct lsm_ctx *ctx", "u32 size", "u32 flags"),  # 460 lsm_set_self_attr
+    ("u64 *ids", "u32 *size", "u32 flags"),  # 461 lsm_list_modules
+    ("unsigned long start", "size_t len", "unsigned long flags"),  # 462 mseal
+    ("int dfd", "const char *pathname", "unsigned int at_flags", "const char *name", "const struct xattr_args *uargs", "size_t usize"),  # 463 setxattrat
+    ("int dfd", "const char *pathname", "unsigned int at_flags", "const char *name", "struct xattr_args *uargs", "size_t usize"),  # 464 getxattrat
+    ("int dfd", "const char *pathname", "unsigned int at_flags", "char *list", "size_t size"),  # 465 listxattrat
+    ("int dfd", "const char *pathname", "unsigned int at_flags", "const char *name"),  # 466 removexattrat
+)
+
+# The numbers of the syscalls, indexed by name
+SYSCALL_NUMBERS: dict[str, int] = {
+    name: number for number, name in enumerate(SYSCALL_NAMES) if name is not None
+}
@@ -0,0 +1,108 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+"""Generates the syscall table modules of this package from the syscall tables of https://syscalls.mebeim.net.
+
+Usage:
+    python -m libdebug.utils.syscall_tables.generate <arch> [--input table.json]
+
+Without --input, the latest table is downloaded. The output is written to `<arch>.py` next to this file.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+SYSCALLS_REMOTE = "https://syscalls.mebeim.net/db"
+OUTPUT_FOLDER_PATH = Path(__file__).parent
+
+HEADER = """#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+# Generated by libdebug/utils/syscall_tables/generate.py from the syscall table of https://syscalls.mebeim.net
+# Do not edit by hand, regenerate it instead.
+"""
+
+
+def get_remote_definition_url(arch: str) -> str:
+    """Returns the URL of the syscall table of the specified architecture."""
+    match arch:
+        case "amd64":
+            return f"{SYSCALLS_REMOTE}/x86/64/x64/latest/table.json"
+        case _:
+            raise ValueError(f"Architecture {arch} not supported")
+
+
+def fetch_remote_syscall_definition(arch: str) -> dict:
+    """Downloads the syscall table of the specified architecture."""
+    import requests
+
+    response = requests.get(get_remote_definition_url(arch), timeout=30)
+    response.raise_for_status()
+
+    return response.json()
+
+
+def render_table(definitions: dict) -> str:
+    """Renders the Python module holding the specified syscall table."""
+    syscalls = {syscall["number"]: syscall for syscall in definitions["syscalls"]}
+
+    names = []
+    signatures = []
+
+    for number in range(max(syscalls) + 1):
+        syscall = syscalls.get(number)
+
+        if syscall is None:
+            names.append(f"    None,  # {number}")
+            signatures.append(f"    None,  # {number}")
+            continue
+
+        names.append(f"    {json.dumps(syscall['name'])},  # {number}")
+
+        arguments = [json.dumps(argument) for argument in syscall["signature"]]
+        if len(arguments) == 1:
+            arguments.append("")
+        signatures.append(f"    ({', '.join(arguments).rstrip()}),  # {number} {syscall['name']}")
+
+    return (
+        HEADER
+        + "\n# The names of the syscalls, indexed by number\n"
+        + "SYSCALL_NAMES: tuple[str | None, ...] = (\n"
+        + "\n".join(names)
+        + "\n)\n\n# The argument declarations of the syscalls, indexed by number\n"
+        + "SYSCALL_SIGNATURES: tuple[tuple[str, ...] | None, ...] = (\n"
+        + "\n".join(signatures)
+        + "\n)\n\n# The numbers of the syscalls, indexed by name\n"
+        + "SYSCALL_NUMBERS: dict[str, int] = {\n"
+        + "    name: number for number, name in enumerate(SYSCALL_NAMES) if name is not None\n"
+        + "}\n"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a libdebug syscall table module.")
+    parser.add_argument("arch", help="The architecture of the table, such as amd64.")
+    parser.add_argument("--input", help="A syscall table in the JSON format of syscalls.mebeim.net.")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, "r") as table_file:
+            definitions = json.load(table_file)
+    else:
+        definitions = fetch_remote_syscall_definition(args.arch)
+
+    output = OUTPUT_FOLDER_PATH / f"{args.arch}.py"
+    output.write_text(render_table(definitions))
+
+    print(f"Written {len(definitions['syscalls'])} syscalls to {output}")
+
+
+if __name__ == "__main__":
+    main()
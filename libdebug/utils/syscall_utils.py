@@ -5,93 +5,67 @@
 #
 
 import functools
-import json
-import os
-from pathlib import Path
-import requests
+from importlib import import_module
+from types import ModuleType
 
 from libdebug.utils.libcontext import libcontext
 
-SYSCALLS_REMOTE = "https://syscalls.mebeim.net/db"
-LOCAL_FOLDER_PATH = str((Path(__file__) / ".." / "syscalls").resolve())
-
-
-def get_remote_definition_url(arch: str) -> str:
-    match arch:
-        case "amd64":
-            return f"{SYSCALLS_REMOTE}/x86/64/x64/latest/table.json"
-        case _:
-            raise ValueError(f"Architecture {arch} not supported")
-
-
-def fetch_remote_syscall_definition(arch: str) -> dict:
-    url = get_remote_definition_url(arch)
-
-    response = requests.get(url)
-    response.raise_for_status()
-
-    # Save the response to a local file
-    with open(f"{LOCAL_FOLDER_PATH}/{arch}.json", "w") as f:
-        f.write(response.text)
-
-    return response.json()
-
 
 @functools.cache
-def get_syscall_definitions(arch: str) -> dict:
-    if not os.path.exists(LOCAL_FOLDER_PATH):
-        os.makedirs(LOCAL_FOLDER_PATH)
+def get_syscall_table(arch: str) -> ModuleType:
+    """Returns the module holding the syscall table of the specified architecture.
 
-    if os.path.exists(f"{LOCAL_FOLDER_PATH}/{arch}.json"):
-        try:
-            with open(f"{LOCAL_FOLDER_PATH}/{arch}.json", "r") as f:
-                return json.load(f)
-        except json.decoder.JSONDecodeError:
-            pass
+    The tables are generated by `libdebug/utils/syscall_tables/generate.py` and shipped with the library.
 
-    return fetch_remote_syscall_definition(arch)
+    Args:
+        arch (str): The architecture, such as amd64.
+
+    Returns:
+        ModuleType: The module, with the SYSCALL_NAMES, SYSCALL_SIGNATURES and SYSCALL_NUMBERS tables.
+    """
+    try:
+        return import_module(f"libdebug.utils.syscall_tables.{arch}")
+    except ModuleNotFoundError:
+        raise ValueError(f"Architecture {arch} not supported")
 
 
-@functools.cache
 def resolve_syscall_number(name: str) -> int:
-    definitions = get_syscall_definitions(libcontext.arch)
+    table = get_syscall_table(libcontext.arch)
 
     try:
-        for syscall in definitions["syscalls"]:
-            if syscall["name"] == name:
-                return syscall["number"]
-        else:
-            raise KeyError()
+        return table.SYSCALL_NUMBERS[name]
     except KeyError:
         raise ValueError(f'Syscall "{name}" not found')
 
 
-@functools.cache
 def resolve_syscall_name(number: int) -> str:
-    definitions = get_syscall_definitions(libcontext.arch)
+    table = get_syscall_table(libcontext.arch)
 
-    try:
-        for syscall in definitions["syscalls"]:
-            if syscall["number"] == number:
-                return syscall["name"]
-    except KeyError:
+    name = table.SYSCALL_NAMES[number] if 0 <= number < len(table.SYSCALL_NAMES) else None
+
+    if name is None:
         raise ValueError(f'Syscall number "{number}" not found')
 
+    return name
 
-@functools.cache
-def resolve_syscall_arguments(number: int) -> list[str]:
-    definitions = get_syscall_definitions(libcontext.arch)
 
-    try:
-        for syscall in definitions["syscalls"]:
-            if syscall["number"] == number:
-                return syscall["signature"]
-    except KeyError:
+def resolve_syscall_arguments(number: int) -> tuple[str, ...]:
+    table = get_syscall_table(libcontext.arch)
+
+    signature = (
+        table.SYSCALL_SIGNATURES[number]
+        if 0 <= number < len(table.SYSCALL_SIGNATURES)
+        else None
+    )
+
+    if signature is None:
         raise ValueError(f'Syscall number "{number}" not found')
 
+    return signature
+
 
 @functools.cache
 def get_all_syscall_numbers() -> list[int]:
-    definitions = get_syscall_definitions(libcontext.arch)
+    table = get_syscall_table(libcontext.arch)
 
-    return [syscall["number"] for syscall in definitions["syscalls"]]
+    return list(table.SYSCALL_NUMBERS.values())
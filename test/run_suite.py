@@ -15,23 +15,37 @@ from scripts.breakpoint_test import BreakpointTest
 from scripts.brute_test import BruteTest
 from scripts.builtin_hooks_test import AntidebugEscapingTest
 from scripts.callback_test import CallbackTest
+from scripts.checkpoint_test import CheckpointTest
 from scripts.finish_test import FinishTest
+from scripts.fork_server_test import ForkServerTest
 from scripts.deep_dive_division import DeepDiveDivision
+from scripts.elf_reader_test import ElfReaderTest
 from scripts.hijack_syscall_test import SyscallHijackTest
 from scripts.jumpout import Jumpout
 from scripts.large_binary_sym_test import LargeBinarySymTest
+from scripts.memory_maps_test import MemoryMapsTest
+from scripts.memory_snapshot_test import MemorySnapshotTest
 from scripts.memory_test import MemoryTest
 from scripts.multiple_debuggers_test import MultipleDebuggersTest
 from scripts.ncuts import Ncuts
+from scripts.parallel_test import ParallelTest
+from scripts.pipe_manager_test import PipeManagerTest
 from scripts.pprint_syscalls_test import PPrintSyscallsTest
 from scripts.speed_test import SpeedTest
+from scripts.startup_test import StartupTest
+from scripts.symbols_test import SymbolsTest
+from scripts.syscall_decode_test import SyscallDecodeTest
 from scripts.syscall_hook_test import SyscallHookTest
+from scripts.syscall_record_test import SyscallRecordTest
+from scripts.syscall_stats_test import SyscallStatsTest
+from scripts.syscall_trace_test import SyscallTraceTest
 from scripts.thread_test import ComplexThreadTest, ThreadTest
 from scripts.vmwhere1 import Vmwhere1
 from scripts.waiting_test import WaitingNcuts, WaitingTest
 from scripts.watchpoint_alias_test import WatchpointAliasTest
 from scripts.watchpoint_test import WatchpointTest
 from scripts.signal_hook_test import SignalHookTest
+from scripts.source_line_test import SourceLineTest
 from scripts.signals_multithread_test import SignalMultithreadTest
 
 
@@ -53,6 +67,18 @@ def fast_suite():
     suite.addTest(MemoryTest("test_memory_multiple_runs"))
     suite.addTest(MemoryTest("test_memory_access_while_running"))
     suite.addTest(MemoryTest("test_memory_access_methods"))
+    suite.addTest(MemoryTest("test_memory_file_backed_reads"))
+    suite.addTest(MemoryTest("test_memory_file_backed_reads_rebuilt"))
+    suite.addTest(MemoryTest("test_memory_file_backed_reads_replaced"))
+    suite.addTest(MemoryTest("test_memory_file_backed_reads_private_copy"))
+    suite.addTest(MemoryTest("test_memory_maps_tracking"))
+    suite.addTest(MemoryTest("test_memory_maps_queries"))
+    suite.addTest(MemoryTest("test_memory_write_tracking"))
+    suite.addTest(MemoryTest("test_memory_find"))
+    suite.addTest(MemorySnapshotTest("test_memory_snapshot_diff"))
+    suite.addTest(MemorySnapshotTest("test_memory_snapshot_layout_changes"))
+    suite.addTest(MemorySnapshotTest("test_memory_snapshot_without_numpy"))
+    suite.addTest(MemoryMapsTest("test_parse"))
     suite.addTest(HwBasicTest("test_basic"))
     suite.addTest(HwBasicTest("test_registers"))
     suite.addTest(BacktraceTest("test_backtrace"))
@@ -82,6 +108,33 @@ def fast_suite():
     suite.addTest(FinishTest("test_exact_breakpoint_return"))
     suite.addTest(FinishTest("test_heuristic_breakpoint_return"))
     suite.addTest(FinishTest("test_breakpoint_collision"))
+    suite.addTest(ForkServerTest("test_fork_run"))
+    suite.addTest(ForkServerTest("test_fork_run_hardware_breakpoint"))
+    suite.addTest(ForkServerTest("test_fork_run_attached"))
+    suite.addTest(CheckpointTest("test_checkpoint_restore"))
+    suite.addTest(CheckpointTest("test_checkpoint_hardware_breakpoint"))
+    suite.addTest(CheckpointTest("test_checkpoint_attached"))
+    suite.addTest(ParallelTest("test_parallel_map"))
+    suite.addTest(ParallelTest("test_parallel_map_predicate"))
+    suite.addTest(ParallelTest("test_parallel_map_reuses_debugger"))
+    suite.addTest(PipeManagerTest("test_pipe_recvuntil_keeps_surplus"))
+    suite.addTest(PipeManagerTest("test_pipe_recvuntil_delimiter_across_reads"))
+    suite.addTest(PipeManagerTest("test_pipe_recvline_throughput"))
+    suite.addTest(PipeManagerTest("test_pipe_recvn"))
+    suite.addTest(PipeManagerTest("test_pipe_recvall"))
+    suite.addTest(PipeManagerTest("test_pipe_recvall_terminal"))
+    suite.addTest(PipeManagerTest("test_pipe_recvuntil_any"))
+    suite.addTest(PipeManagerTest("test_pipe_recvregex"))
+    suite.addTest(PipeManagerTest("test_pipe_recvregex_lookahead"))
+    suite.addTest(PipeManagerTest("test_pipe_recvregex_large_output"))
+    suite.addTest(PipeManagerTest("test_pipe_send_does_not_block"))
+    suite.addTest(PipeManagerTest("test_pipe_send_mutable_buffer"))
+    suite.addTest(PipeManagerTest("test_pipe_send_broken_pipe"))
+    suite.addTest(PipeManagerTest("test_pipe_send_while_stopped"))
+    suite.addTest(PipeManagerTest("test_pipe_capture_ring_buffer"))
+    suite.addTest(PipeManagerTest("test_pipe_capture_recv"))
+    suite.addTest(PipeManagerTest("test_pipe_capture_bounded_on_timeout"))
+    suite.addTest(PipeManagerTest("test_pipe_capture_process"))
     suite.addTest(Jumpout("test_jumpout"))
     suite.addTest(Ncuts("test_ncuts"))
     suite.addTest(ControlFlowTest("test_step_until_1"))
@@ -110,6 +163,22 @@ def fast_suite():
     suite.addTest(SyscallHookTest("test_hook_disabling_with_pprint"))
     suite.addTest(SyscallHookTest("test_hook_overwrite"))
     suite.addTest(SyscallHookTest("test_hook_overwrite_with_pprint"))
+    suite.addTest(SyscallHookTest("test_syscall_table"))
+    suite.addTest(SyscallDecodeTest("test_decode_strings_and_buffers"))
+    suite.addTest(SyscallDecodeTest("test_decode_structures"))
+    suite.addTest(SyscallDecodeTest("test_pprint_decoded"))
+    suite.addTest(SyscallTraceTest("test_trace"))
+    suite.addTest(SyscallTraceTest("test_trace_compressed_and_filtered"))
+    suite.addTest(SyscallTraceTest("test_trace_with_hooks"))
+    suite.addTest(SyscallStatsTest("test_stats"))
+    suite.addTest(SyscallStatsTest("test_stats_with_hooks"))
+    suite.addTest(SyscallStatsTest("test_stats_reset"))
+    suite.addTest(SyscallRecordTest("test_record"))
+    suite.addTest(SyscallRecordTest("test_replay"))
+    suite.addTest(SyscallRecordTest("test_replay_records_reused"))
+    suite.addTest(SyscallRecordTest("test_record_random_and_clock"))
+    suite.addTest(SyscallRecordTest("test_record_default_syscalls"))
+    suite.addTest(SyscallRecordTest("test_record_with_stats_threads"))
     suite.addTest(AntidebugEscapingTest("test_antidebug_escaping"))
     suite.addTest(SyscallHijackTest("test_hijack_syscall"))
     suite.addTest(SyscallHijackTest("test_hijack_syscall_with_pprint"))
@@ -154,6 +223,17 @@ def fast_suite():
     suite.addTest(SignalHookTest("test_override_hybrid"))
     suite.addTest(SignalMultithreadTest("test_signal_multithread_undet_hook"))
     suite.addTest(SignalMultithreadTest("test_signal_multithread_undet_pass"))
+    suite.addTest(SymbolsTest("test_find"))
+    suite.addTest(SymbolsTest("test_in_file"))
+    suite.addTest(SymbolsTest("test_near"))
+    suite.addTest(SymbolsTest("test_debuginfod_only_on_miss"))
+    suite.addTest(ElfReaderTest("test_headers"))
+    suite.addTest(ElfReaderTest("test_sections_and_notes"))
+    suite.addTest(ElfReaderTest("test_invalid_file"))
+    suite.addTest(SourceLineTest("test_breakpoint_on_line"))
+    suite.addTest(SourceLineTest("test_line_without_code"))
+    suite.addTest(SourceLineTest("test_resolve_lines"))
+    suite.addTest(SourceLineTest("test_invalid_line"))
     return suite
 
 
@@ -165,6 +245,9 @@ def complete_suite():
     suite.addTest(CallbackTest("test_callback_bruteforce"))
     suite.addTest(SpeedTest("test_speed"))
     suite.addTest(SpeedTest("test_speed_hardware"))
+    suite.addTest(StartupTest("test_import_time"))
+    suite.addTest(StartupTest("test_run_time"))
+    suite.addTest(MemoryMapsTest("test_parse_speed"))
     suite.addTest(DeepDiveDivision("test_deep_dive_division"))
     return suite
 
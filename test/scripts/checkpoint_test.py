@@ -0,0 +1,123 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import subprocess
+import unittest
+
+from libdebug import debugger
+
+
+class CheckpointTest(unittest.TestCase):
+    def test_checkpoint_restore(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        r = d.run()
+
+        # After the first write
+        bp = d.breakpoint(0x401185)
+
+        d.cont()
+        d.wait()
+
+        self.assertEqual(r.recvline(), b"Hello, World!")
+
+        rsp = d.regs.rsp
+        stack = d.memory[rsp, 8]
+
+        cp = d.checkpoint()
+
+        self.assertEqual(cp.instruction_pointer, bp.address)
+        self.assertNotEqual(cp.process_id, d.context.process_id)
+
+        # The process keeps running after the checkpoint
+        d.regs.rbx = 0x1337
+        d.memory[rsp, 8] = b"A" * 8
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        self.assertTrue(r.recvline().endswith(b"provola"))
+
+        for i in range(3):
+            d.restore(cp)
+
+            self.assertEqual(d.regs.rip, bp.address)
+            self.assertEqual(d.regs.rsp, rsp)
+            self.assertNotEqual(d.regs.rbx, 0x1337)
+            self.assertEqual(d.memory[rsp, 8], stack)
+
+            d.memory[rsp, 8] = b"B" * 8
+
+            r.sendline(b"branch%d" % i)
+
+            d.cont()
+            d.wait()
+
+            # The program writes the whole buffer, the NUL bytes precede the next line
+            self.assertTrue(r.recvline().endswith(b"branch%d" % i))
+
+        self.assertEqual(cp.restore_count, 3)
+
+        d.release_checkpoint(cp)
+
+        self.assertTrue(cp.released)
+
+        with self.assertRaises(RuntimeError):
+            d.restore(cp)
+
+        d.kill()
+
+    def test_checkpoint_hardware_breakpoint(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        r = d.run()
+
+        bp = d.breakpoint(0x401185, hardware=True)
+        read_bp = d.breakpoint(0x4011B0, hardware=True)
+
+        d.cont()
+        d.wait()
+
+        cp = d.checkpoint()
+
+        d.cont()
+        d.wait()
+
+        self.assertEqual(d.regs.rip, read_bp.address)
+
+        d.restore(cp)
+
+        self.assertEqual(d.regs.rip, bp.address)
+
+        # The hardware breakpoints are installed in the restored process
+        d.cont()
+        d.wait()
+
+        self.assertEqual(d.regs.rip, read_bp.address)
+        self.assertEqual(read_bp.hit_count, 2)
+
+        d.kill()
+
+        self.assertTrue(cp.released)
+
+    def test_checkpoint_attached(self):
+        process = subprocess.Popen(["binaries/attach_test"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+        d = debugger()
+        d.attach(process.pid)
+
+        # The copies would not be children of the debugger
+        with self.assertRaises(RuntimeError):
+            d.checkpoint()
+
+        d.kill()
+        process.wait()
+
+
+if __name__ == "__main__":
+    unittest.main()
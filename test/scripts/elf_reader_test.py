@@ -0,0 +1,62 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import unittest
+
+from elftools.elf.elffile import ELFFile
+
+from libdebug.utils.elf_reader import PT_INTERP, ElfReader
+
+
+class ElfReaderTest(unittest.TestCase):
+    def test_headers(self):
+        for path in ["binaries/basic_test", "binaries/basic_test_pie"]:
+            reader = ElfReader(path)
+
+            with open(path, "rb") as elf_file:
+                elf = ELFFile(elf_file)
+
+                self.assertEqual(reader.is_pie, elf.header.e_type == "ET_DYN")
+                self.assertEqual(reader.entry_point, elf.header.e_entry)
+                self.assertEqual(len(reader.program_headers), elf.num_segments())
+
+                for ours, theirs in zip(reader.program_headers, elf.iter_segments()):
+                    self.assertEqual(ours.p_vaddr, theirs["p_vaddr"])
+                    self.assertEqual(ours.p_memsz, theirs["p_memsz"])
+                    self.assertEqual(ours.p_flags, theirs["p_flags"])
+
+                    if theirs["p_type"] == "PT_INTERP":
+                        self.assertEqual(ours.p_type, PT_INTERP)
+                        self.assertEqual(reader.interpreter, theirs.get_interp_name())
+
+    def test_sections_and_notes(self):
+        path = "binaries/basic_test"
+        reader = ElfReader(path)
+
+        with open(path, "rb") as elf_file:
+            elf = ELFFile(elf_file)
+
+            self.assertEqual(
+                set(reader.sections), {section.name for section in elf.iter_sections()}
+            )
+
+            text = elf.get_section_by_name(".text")
+            self.assertEqual(reader.section(".text").sh_addr, text["sh_addr"])
+            self.assertEqual(reader.section(".text").sh_size, text["sh_size"])
+            self.assertIsNone(reader.section(".this_section_does_not_exist"))
+
+            notes = elf.get_section_by_name(".note.gnu.build-id")
+            build_id = next(notes.iter_notes())["n_desc"]
+            self.assertEqual(reader.build_id, build_id)
+
+            dynamic = elf.get_section_by_name(".dynamic")
+            tags = [tag for tag in dynamic.iter_tags() if tag.entry.d_tag != "DT_NULL"]
+            self.assertEqual(len(reader.dynamic), len(tags))
+            self.assertFalse(reader.has_textrel)
+
+    def test_invalid_file(self):
+        with self.assertRaises(ValueError):
+            ElfReader("scripts/elf_reader_test.py")
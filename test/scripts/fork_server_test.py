@@ -0,0 +1,130 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import os
+import subprocess
+import unittest
+
+from libdebug import debugger
+
+
+def _process_group_size(pgid: int) -> int:
+    size = 0
+
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+
+        if int(fields[2]) == pgid:
+            size += 1
+
+    return size
+
+
+class ForkServerTest(unittest.TestCase):
+    def test_fork_run(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        r = d.run()
+
+        # After the first write
+        bp = d.breakpoint(0x401185)
+
+        d.cont()
+        d.wait()
+
+        self.assertEqual(d.regs.rip, bp.address)
+        self.assertEqual(r.recvline(), b"Hello, World!")
+
+        template_pid = d.context.process_id
+        read_bp = d.breakpoint(0x4011B0)
+        write_hook = d.hook_syscall("write", on_exit=lambda t, _: None)
+
+        pids = set()
+
+        for i in range(10):
+            r = d.fork_run()
+
+            pids.add(d.context.process_id)
+            self.assertEqual(len(d.threads), 1)
+            self.assertEqual(d.regs.rip, bp.address)
+
+            r.sendline(b"provola%d" % i)
+
+            d.cont()
+            d.wait()
+
+            self.assertEqual(d.regs.rip, read_bp.address)
+
+            d.cont()
+            d.wait()
+
+            # The program writes the whole buffer, the NUL bytes precede the next line
+            self.assertTrue(r.recvline().endswith(b"provola%d" % i))
+
+        # Every copy is a new process, and the copies that exited or were killed are reaped
+        self.assertEqual(len(pids), 10)
+        self.assertNotIn(template_pid, pids)
+        self.assertEqual(_process_group_size(template_pid), 1)
+
+        self.assertEqual(read_bp.hit_count, 10)
+        self.assertEqual(write_hook.hit_count, 10)
+
+        d.kill()
+
+        self.assertEqual(_process_group_size(template_pid), 0)
+
+    def test_fork_run_hardware_breakpoint(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        r = d.run()
+
+        bp = d.breakpoint(0x401185, hardware=True)
+
+        d.cont()
+        d.wait()
+
+        self.assertEqual(r.recvline(), b"Hello, World!")
+
+        for i in range(3):
+            r = d.fork_run()
+
+            self.assertEqual(d.regs.rip, bp.address)
+
+            r.sendline(b"provola%d" % i)
+
+            d.cont()
+            d.wait()
+
+            # The program writes the whole buffer, the NUL bytes precede the next line
+            self.assertTrue(r.recvline().endswith(b"provola%d" % i))
+
+        self.assertEqual(bp.hit_count, 1)
+
+        d.kill()
+
+    def test_fork_run_attached(self):
+        process = subprocess.Popen(["binaries/attach_test"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+        d = debugger()
+        d.attach(process.pid)
+
+        # The copies would not be children of the debugger
+        with self.assertRaises(RuntimeError):
+            d.fork_run()
+
+        d.kill()
+        process.wait()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import unittest
+from time import perf_counter_ns
+
+from libdebug.data.memory_map import MemoryMap
+from libdebug.data.memory_maps import MemoryMaps
+
+
+def synthetic_maps(count: int) -> str:
+    """Returns the contents of a /proc/pid/maps file with the specified number of lines."""
+    lines = []
+    address = 0x7F0000000000
+
+    for i in range(count):
+        backing_file = f"/usr/lib/x86_64-linux-gnu/libjit{i % 50}.so" if i % 3 else ""
+        lines.append(
+            f"{address:x}-{address + 0x1000:x} r-xp {i * 0x1000:08x} fe:00 {i}"
+            + (" " * 18 + backing_file if backing_file else " ")
+        )
+        address += 0x2000
+
+    return "\n".join(lines) + "\n"
+
+
+class MemoryMapsTest(unittest.TestCase):
+    def test_parse(self):
+        with open("/proc/self/maps", "r") as maps_file:
+            raw = maps_file.read()
+
+        raw += (
+            "7ffff7ff0000-7ffff7ff1000 r--s 00001000 00:05 42"
+            "                         /tmp/a file with spaces (deleted)\n"
+        )
+
+        expected = [MemoryMap.parse(line) for line in raw.splitlines()]
+        maps = MemoryMaps.parse(raw)
+
+        self.assertEqual(len(maps), len(expected))
+        self.assertEqual(list(maps), expected)
+        self.assertEqual(maps[-1].backing_file, "/tmp/a file with spaces (deleted)")
+        self.assertEqual(len(MemoryMaps.parse("")), 0)
+
+        with self.assertRaises(ValueError):
+            MemoryMaps.parse(raw + "this is not a memory map\n")
+
+    def test_parse_speed(self):
+        raw = synthetic_maps(100000)
+
+        def best_of(parse) -> int:
+            timings = []
+            for _ in range(3):
+                start_time = perf_counter_ns()
+                parse(raw)
+                timings.append(perf_counter_ns() - start_time)
+            return min(timings)
+
+        line_by_line = best_of(lambda raw: [MemoryMap.parse(line) for line in raw.splitlines()])
+        whole_file = best_of(MemoryMaps.parse)
+
+        print(
+            f"\n100k maps: line by line {line_by_line / 1e6:.2f} ms, whole file {whole_file / 1e6:.2f} ms"
+        )
+
+        self.assertLess(whole_file, line_by_line)
+
+        maps = MemoryMaps.parse(raw)
+        self.assertEqual(maps.find(0x7F0000000000 + 0x2000 * 99999 + 0x10).offset, 99999 * 0x1000)
+        self.assertIsNone(maps.find(0x7F0000000000 + 0x1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
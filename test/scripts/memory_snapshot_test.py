@@ -0,0 +1,105 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import unittest
+from unittest.mock import patch
+
+from libdebug import debugger
+from libdebug.data.memory_snapshot import MemorySnapshot
+
+
+class MemorySnapshotTest(unittest.TestCase):
+    def test_memory_snapshot_diff(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        r = d.run()
+
+        # Before and after the call to read
+        d.breakpoint(0x4011B0)
+        d.breakpoint(0x4011B5)
+
+        d.cont()
+        d.wait()
+
+        buffer = d.regs.rsi
+        before = d.snapshot_memory()
+
+        self.assertIn(buffer, before)
+        self.assertEqual(before.read(buffer, 8), b"\0" * 8)
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        after = d.snapshot_memory()
+
+        self.assertEqual(after.read(buffer, 8), b"provola\n")
+        self.assertEqual(before.diff(before), [])
+
+        for word_size in (1, 8):
+            ranges = before.diff(after, word_size)
+
+            self.assertTrue(any(start <= buffer and buffer + 8 <= end for start, end in ranges))
+            self.assertFalse(any(start < buffer + 16 and buffer + 8 < end for start, end in ranges))
+
+        delta = before.delta(after)
+
+        self.assertEqual(before.apply_delta(delta), after)
+        self.assertLess(len(delta), after.size // 10)
+
+        # A snapshot of specific maps
+        stack = d.snapshot_memory(d.maps.filter(file="[stack]"))
+        self.assertEqual(len(stack.regions), 1)
+        self.assertEqual(stack.read(buffer, 8), b"provola\n")
+
+        d.kill()
+
+    def test_memory_snapshot_layout_changes(self):
+        before = MemorySnapshot(
+            {
+                0x1000: b"A" * 0x20,
+                0x2000: b"B" * 0x10,
+                0x3000: b"C" * 0x10,
+            }
+        )
+        after = MemorySnapshot(
+            {
+                0x1000: b"A" * 0x8 + b"X" * 0x3 + b"A" * 0x1B,
+                0x2000: b"B" * 0x8,
+                0x4000: b"D" * 0x10,
+            }
+        )
+
+        self.assertEqual(
+            before.diff(after),
+            [(0x1008, 0x1010), (0x1020, 0x1026), (0x2008, 0x2010), (0x3000, 0x3010), (0x4000, 0x4010)],
+        )
+        self.assertEqual(before.diff(after, 1)[0], (0x1008, 0x100B))
+
+        # The delta only carries what is needed to rebuild the new snapshot
+        delta = before.delta(after, 1)
+        self.assertEqual(before.apply_delta(delta), after)
+        self.assertEqual(after.apply_delta(after.delta(before)), before)
+
+        with self.assertRaises(ValueError):
+            before.diff(after, 3)
+
+    def test_memory_snapshot_without_numpy(self):
+        before = MemorySnapshot({0x1000: bytes(0x3003)})
+        after = MemorySnapshot({0x1000: bytes(0x1FF8) + b"\1" * 0x10 + bytes(0xFF8) + b"\0\0\1"})
+
+        expected = before.diff(after)
+
+        with patch("libdebug.data.memory_snapshot._numpy", return_value=None):
+            self.assertEqual(before.diff(after), expected)
+            self.assertEqual(before.diff(after, 1), [(0x2FF8, 0x3008), (0x4002, 0x4003)])
+
+        self.assertEqual(expected, [(0x2FF8, 0x3008), (0x4000, 0x4003)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,14 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
+import os
+import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from libdebug import debugger, libcontext
+from libdebug.utils.process_utils import get_process_maps_generation
 
 
 class MemoryTest(unittest.TestCase):
@@ -196,6 +201,259 @@ class MemoryTest(unittest.TestCase):
 
         d.kill()
 
+    def test_memory_file_backed_reads(self):
+        d = self.d
+
+        d.run()
+
+        code = d.rip & ~0xFFF
+        libc_code = next(
+            vmap.start
+            for vmap in d.interface.maps()
+            if "libc" in vmap.backing_file and "x" in vmap.permissions
+        )
+
+        expected_code = d.memory[code, 0x1000]
+        expected_libc_code = d.memory[libc_code, 0x1000]
+
+        d.memory.file_backed_reads = True
+
+        self.assertEqual(d.memory[code, 0x1000], expected_code)
+        self.assertEqual(d.memory[libc_code, 0x1000], expected_libc_code)
+
+        # Pages written by the debugger must be read from the process
+        d.memory[code + 0x10, 4] = b"\x90\x90\x90\x90"
+        self.assertEqual(d.memory[code + 0x10, 4], b"\x90\x90\x90\x90")
+
+        # So must pages holding software breakpoints
+        d.breakpoint(libc_code + 0x20)
+        from_file = d.memory[libc_code + 0x20, 1]
+        d.memory.file_backed_reads = False
+        self.assertEqual(from_file, d.memory[libc_code + 0x20, 1])
+
+        d.kill()
+
+    def binary_code(self, d, path: str) -> int:
+        return next(
+            vmap.start
+            for vmap in d.interface.maps()
+            if vmap.backing_file == path and "x" in vmap.permissions
+        )
+
+    def test_memory_file_backed_reads_rebuilt(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "binary")
+            shutil.copy("binaries/memory_test", path)
+
+            d = debugger(path)
+            d.memory.file_backed_reads = True
+
+            d.run()
+            code = self.binary_code(d, path)
+            d.memory[code, 0x1000]
+            d.kill()
+
+            # The file is replaced between two runs, as if it was rebuilt
+            os.unlink(path)
+            shutil.copy("binaries/basic_test", path)
+
+            d.run()
+            code = self.binary_code(d, path)
+            from_file = d.memory[code, 0x1000]
+            d.memory.file_backed_reads = False
+            self.assertEqual(from_file, d.memory[code, 0x1000])
+            d.kill()
+
+    def test_memory_file_backed_reads_replaced(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "binary")
+            shutil.copy("binaries/memory_test", path)
+
+            d = debugger(path)
+
+            d.run()
+            code = self.binary_code(d, path)
+            expected = d.memory[code, 0x1000]
+
+            # The file is replaced while the process is still running
+            os.unlink(path)
+            shutil.copy("binaries/basic_test", path)
+
+            d.memory.file_backed_reads = True
+            self.assertEqual(d.memory[code, 0x1000], expected)
+            d.kill()
+
+    def test_memory_file_backed_reads_private_copy(self):
+        d = self.d
+
+        d.run()
+
+        code = self.binary_code(d, os.path.abspath("binaries/memory_test"))
+
+        # The page is written behind the back of the debugger, leaving the process with a private copy of it
+        with open(f"/proc/{d.process_id}/mem", "r+b", buffering=0) as mem:
+            os.pwrite(mem.fileno(), b"\xcc\xcc\xcc\xcc", code + 0x10)
+
+        d.memory.file_backed_reads = True
+        self.assertEqual(d.memory[code + 0x10, 4], b"\xcc\xcc\xcc\xcc")
+
+        d.kill()
+
+    def test_memory_maps_tracking(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        r = d.run()
+
+        maps = d.interface.maps()
+        generation = get_process_maps_generation(d.interface.process_id)
+
+        # Stops that do not change the address space reuse the parsed maps
+        d.step()
+        self.assertIs(d.interface.maps(), maps)
+        self.assertEqual(get_process_maps_generation(d.interface.process_id), generation)
+
+        mapped = []
+        generations = []
+
+        def on_exit_mmap(t, _):
+            address = t.syscall_return
+            mapped.append(
+                any(vmap.start <= address < vmap.end for vmap in d.interface.maps())
+            )
+            generations.append(get_process_maps_generation(t.process_id))
+
+        # mmap is number 9 on amd64
+        d.hook_syscall(9, None, on_exit_mmap)
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.kill()
+
+        # Every new mapping must be visible as soon as the syscall returns
+        self.assertTrue(mapped)
+        self.assertTrue(all(mapped))
+        self.assertGreater(generations[0], generation)
+
+    def test_memory_maps_queries(self):
+        d = self.d
+
+        d.run()
+
+        maps = d.maps
+
+        self.assertIs(maps.find(d.rip), next(m for m in maps if m.start <= d.rip < m.end))
+        self.assertTrue(maps.contains(d.rsp))
+        self.assertFalse(maps.contains(0x10))
+        self.assertIsNone(maps.find(0x10))
+        self.assertIsNone(maps.find(maps[-1].end))
+
+        # Gaps between maps do not belong to any of them
+        for previous, current in zip(maps, maps[1:]):
+            if previous.end < current.start:
+                self.assertIsNone(maps.find(previous.end))
+                break
+
+        stack = maps.filter(file="[stack]")
+        self.assertEqual(len(stack), 1)
+        self.assertEqual(stack.find(d.rsp), stack[0])
+
+        libc_code = maps.filter(perms="rx", file="libc")
+        self.assertTrue(libc_code)
+        for vmap in libc_code:
+            self.assertIn("libc", vmap.backing_file)
+            self.assertIn("x", vmap.permissions)
+
+        d.kill()
+
+    def test_memory_write_tracking(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        r = d.run()
+
+        # Before and after the call to read
+        d.breakpoint(0x4011B0)
+        after_read = d.breakpoint(0x4011B5)
+
+        with self.assertRaises(RuntimeError):
+            d.memory.dirty_pages()
+
+        d.cont()
+        d.wait()
+
+        buffer = d.regs.rsi
+        page = buffer & ~0xFFF
+
+        d.memory.track_writes()
+
+        self.assertEqual(d.memory.dirty_pages(), [])
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        self.assertEqual(d.regs.rip, after_read.address)
+        self.assertIn(page, d.memory.dirty_pages())
+
+        pages = d.memory.read_dirty_pages()
+        self.assertEqual(sorted(pages), d.memory.dirty_pages())
+        self.assertEqual(pages[page][buffer - page :][:8], b"provola\n")
+        self.assertTrue(all(len(content) == 0x1000 for content in pages.values()))
+
+        # Tracking again forgets the previous writes, but not the ones of the debugger
+        d.memory.track_writes()
+        d.memory[buffer, 8] = b"libdebug"
+
+        self.assertEqual(d.memory.dirty_pages(), [page])
+
+        d.kill()
+
+    def test_memory_find(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        r = d.run()
+
+        # After the call to read
+        d.breakpoint(0x4011B5)
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        buffer = d.regs.rsi
+
+        self.assertEqual(d.memory.find(b"provola\n", "[stack]"), buffer)
+        self.assertEqual(d.memory.find("provola"), buffer)
+        self.assertEqual(d.memory.find([0x70, None, 0x6F, None, 0x6F], "[stack]"), buffer)
+        self.assertIsNone(d.memory.find(b"provola", align=16 * 1024))
+        self.assertIsNone(d.memory.find(b"not in memory"))
+
+        # Integers are searched as pointers
+        d.memory[buffer + 16, 8] = (buffer + 0x1337).to_bytes(8, "little")
+        self.assertEqual(d.memory.find(buffer + 0x1337, d.maps.filter(file="[stack]"), align=8), buffer + 16)
+
+        matches = d.memory.find_all(b"\0" * 8, "[stack]", align=8, limit=3)
+        self.assertEqual(len(matches), 3)
+        self.assertTrue(all(address % 8 == 0 for address in matches))
+        self.assertEqual(matches, sorted(matches))
+
+        # Matches that cross the boundary between two chunks
+        d.memory[buffer + 44, 8] = b"crossing"
+
+        with patch("libdebug.data.memory_view.SEARCH_CHUNK_SIZE", 16):
+            self.assertEqual(d.memory.find_all(b"crossing", "[stack]"), [buffer + 44])
+            self.assertEqual(d.memory.find(b"provola", "[stack]", align=16), buffer)
+
+        with self.assertRaises(ValueError):
+            d.memory.find(b"")
+
+        with self.assertRaises(TypeError):
+            d.memory.find(1.5)
+
+        d.kill()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import os
+import string
+import unittest
+
+from libdebug import parallel
+
+
+def _hit_count(d, candidate):
+    r = d.run()
+    bp = d.breakpoint(0x1222, hardware=True)
+    d.cont()
+
+    r.sendlineafter(b"chars\n", candidate.encode())
+
+    while bp.address == d.rip:
+        d.cont()
+
+    return bp.hit_count
+
+
+def _worker_pid(d, candidate):
+    d.run()
+
+    return os.getpid(), id(d)
+
+
+class ParallelTest(unittest.TestCase):
+    def test_parallel_map(self):
+        candidates = ["A", "B", "C", "BR", "BRX"]
+
+        results = dict(
+            parallel.map("binaries/brute_test", candidates, _hit_count, workers=2)
+        )
+
+        self.assertEqual(results, {"A": 1, "B": 2, "C": 1, "BR": 3, "BRX": 3})
+
+    def test_parallel_map_predicate(self):
+        results = list(
+            parallel.map(
+                "binaries/brute_test",
+                string.printable,
+                _hit_count,
+                workers=2,
+                predicate=lambda hits: hits > 1,
+            )
+        )
+
+        # The search stops at the first match
+        candidate, hits = results[-1]
+        self.assertEqual(candidate, "B")
+        self.assertEqual(hits, 2)
+        self.assertTrue(all(hits == 1 for _, hits in results[:-1]))
+        self.assertLess(len(results), len(string.printable))
+
+    def test_parallel_map_reuses_debugger(self):
+        results = list(
+            parallel.map("binaries/basic_test", range(5), _worker_pid, workers=1)
+        )
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len({result for _, result in results}), 1)
+        self.assertNotEqual(results[0][1][0], os.getpid())
+
+
+if __name__ == "__main__":
+    unittest.main()
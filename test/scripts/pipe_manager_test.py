@@ -0,0 +1,439 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import io
+import os
+import pty
+import re
+import sys
+import tempfile
+import tty
+import unittest
+from threading import Event, Thread, Timer
+from time import perf_counter
+
+from libdebug import debugger
+from libdebug.utils.pipe_manager import PipeManager
+
+
+class PipeManagerTest(unittest.TestCase):
+    def setUp(self):
+        stdin_read, stdin_write = os.pipe()
+        stdout_read, self.stdout_write = os.pipe()
+        stderr_read, self.stderr_write = os.pipe()
+
+        self.stdin_read = stdin_read
+        self.pipe = PipeManager(stdin_write, stdout_read, stderr_read)
+
+    def tearDown(self):
+        self.pipe.close()
+
+        for fd in (self.stdin_read, self.stdout_write, self.stderr_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def write_in_background(self, data: bytes, fd: int | None = None) -> Thread:
+        fd = self.stdout_write if fd is None else fd
+
+        def write():
+            view = memoryview(data)
+
+            while view:
+                view = view[os.write(fd, view) :]
+
+        thread = Thread(target=write)
+        thread.start()
+        return thread
+
+    def test_pipe_recvuntil_keeps_surplus(self):
+        os.write(self.stdout_write, b"first line\nsecond line\nthird")
+        os.write(self.stderr_write, b"error\n")
+
+        self.assertEqual(self.pipe.recvline(), b"first line")
+        self.assertEqual(self.pipe.recvuntil(b"line"), b"second line")
+        self.assertEqual(self.pipe.recv(2), b"\nt")
+        self.assertEqual(self.pipe.recverrline(), b"error")
+
+        # The data received before a timeout is not lost
+        with self.assertRaises(TimeoutError):
+            self.pipe.recvuntil(b"!", timeout=0.1)
+
+        os.write(self.stdout_write, b"! fourth")
+
+        self.assertEqual(self.pipe.recvuntil(b"!", drop=True), b"hird")
+        self.assertEqual(self.pipe.recv(), b" fourth")
+        self.assertEqual(self.pipe.recv(timeout=0.1), b"")
+
+    def test_pipe_recvuntil_delimiter_across_reads(self):
+        os.write(self.stdout_write, b"Write up to 64 ch")
+
+        thread = Thread(target=lambda: os.write(self.stdout_write, b"ars\nrest"))
+        thread.start()
+
+        self.assertEqual(self.pipe.recvuntil(b"chars\n"), b"Write up to 64 chars\n")
+        thread.join()
+
+        self.assertEqual(self.pipe.recv(4), b"rest")
+
+    def test_pipe_recvline_throughput(self):
+        lines = 200000
+        data = b"".join(b"%08d: some output from a chatty target\n" % i for i in range(lines))
+
+        thread = self.write_in_background(data)
+
+        start = perf_counter()
+
+        for i in range(lines):
+            self.assertEqual(self.pipe.recvline(), b"%08d: some output from a chatty target" % i)
+
+        elapsed = perf_counter() - start
+
+        thread.join()
+
+        # Roughly 8 MB of output
+        self.assertGreater(len(data), 8 * 1024 * 1024)
+        self.assertLess(elapsed, 10)
+
+    def test_pipe_recvn(self):
+        os.write(self.stdout_write, b"0123456789")
+
+        self.assertEqual(self.pipe.recvuntil(b"3"), b"0123")
+
+        thread = self.write_in_background(b"abcdef" * 100000)
+
+        # The buffered data comes first
+        data = self.pipe.recvn(6 + 6 * 99999)
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(data[:12], b"456789abcdef")
+
+        thread.join()
+
+        self.assertEqual(self.pipe.recvn(3), b"abc")
+        self.assertEqual(self.pipe.recv(), b"def")
+
+        # The data received before a timeout is not lost
+        os.write(self.stdout_write, b"partial")
+
+        with self.assertRaises(TimeoutError):
+            self.pipe.recvn(100, timeout=0.1)
+
+        self.assertEqual(self.pipe.recv(), b"partial")
+
+    def test_pipe_recvall(self):
+        data = os.urandom(1024 * 1024) * 32
+
+        os.write(self.stdout_write, b"header\n")
+        header = self.pipe.recvall(until_eof=False)
+        self.assertEqual(header, b"header\n")
+
+        # The returned data does not keep the whole receive buffer alive
+        self.assertLess(sys.getsizeof(header.obj), 4096)
+
+        self.assertEqual(self.pipe.recvall(until_eof=False), b"")
+
+        with self.assertRaises(TimeoutError):
+            self.pipe.recvall(timeout=0.1)
+
+        def write_and_close():
+            view = memoryview(data)
+
+            while view:
+                view = view[os.write(self.stdout_write, view) :]
+
+            os.close(self.stdout_write)
+
+        thread = Thread(target=write_and_close)
+        thread.start()
+
+        start = perf_counter()
+        received = self.pipe.recvall()
+        elapsed = perf_counter() - start
+
+        thread.join()
+
+        self.assertEqual(len(received), len(data))
+        self.assertTrue(received == data)
+        self.assertLess(elapsed, 10)
+
+    def test_pipe_recvall_terminal(self):
+        master, slave = pty.openpty()
+        tty.setraw(slave)
+
+        os.write(slave, b"output of the child process")
+        os.close(slave)
+
+        pipe = PipeManager(os.dup(self.pipe.stdin_write), master, os.dup(self.pipe.stderr_read))
+
+        # The end of the stream is reported as an I/O error by the terminal
+        self.assertEqual(pipe.recvall(timeout=5), b"output of the child process")
+
+        pipe.close()
+
+    def test_pipe_recvuntil_any(self):
+        os.write(self.stdout_write, b"Welcome\n1) login\n2) register\n> ")
+
+        data, delim = self.pipe.recvuntil_any([b"> ", b"$ ", b"Password: "])
+        self.assertEqual(data, b"Welcome\n1) login\n2) register\n> ")
+        self.assertEqual(delim, b"> ")
+
+        # The delimiters may arrive split across reads
+        os.write(self.stdout_write, b"Pass")
+        thread = Thread(target=lambda: os.write(self.stdout_write, b"word: secret"))
+        thread.start()
+
+        data, delim = self.pipe.recvuntil_any([b"> ", b"Password: "], drop=True)
+        thread.join()
+
+        self.assertEqual(data, b"")
+        self.assertEqual(delim, b"Password: ")
+
+        # The longest delimiter wins when several start at the same position
+        os.write(self.stdout_write, b"abcd")
+        self.assertEqual(self.pipe.recvuntil_any([b"ab", b"abc", b"d"]), (b"secretabc", b"abc"))
+
+        with self.assertRaises(TimeoutError):
+            self.pipe.recvuntil_any([b"x", b"y"], timeout=0.1)
+
+        os.write(self.stderr_write, b"error: failure\n")
+        self.assertEqual(self.pipe.recverruntil_any([b"\n"]), (b"error: failure\n", b"\n"))
+
+    def test_pipe_recvregex(self):
+        os.write(self.stdout_write, b"round 1\nscore: 12")
+
+        thread = Thread(target=lambda: os.write(self.stdout_write, b"34 points\nnext"))
+        thread.start()
+
+        data, match = self.pipe.recvregex(rb"score: (\d+) points")
+        thread.join()
+
+        self.assertEqual(data, b"round 1\nscore: 1234 points")
+        self.assertEqual(int(match.group(1)), 1234)
+
+        data, match = self.pipe.recvregex(re.compile(rb"n(e)xt"), drop=True)
+        self.assertEqual(data, b"\n")
+        self.assertEqual(match.group(1), b"e")
+
+        with self.assertRaises(TimeoutError):
+            self.pipe.recvregex(rb".+!", timeout=0.1)
+
+    def test_pipe_recvregex_lookahead(self):
+        os.write(self.stdout_write, b"xxxxfoo")
+
+        # The rest of the data arrives after the first search
+        thread = Timer(0.1, os.write, (self.stdout_write, b"bar"))
+        thread.start()
+
+        # The lookahead only succeeds once the rest of the data arrives
+        data, match = self.pipe.recvregex(rb"foo(?=bar)")
+        thread.join()
+
+        self.assertEqual(data, b"xxxxfoo")
+        self.assertEqual(match.group(), b"foo")
+        self.assertEqual(self.pipe.recv(), b"bar")
+
+    def test_pipe_recvregex_large_output(self):
+        data = b"".join(b"%08d: some output from a chatty target\n" % i for i in range(100000))
+
+        thread = self.write_in_background(data + b"FLAG{found}")
+
+        start = perf_counter()
+        received, match = self.pipe.recvregex(rb"FLAG\{(\w+)\}")
+        elapsed = perf_counter() - start
+
+        thread.join()
+
+        self.assertEqual(match.group(1), b"found")
+        self.assertEqual(len(received), len(data) + len(b"FLAG{found}"))
+        self.assertLess(elapsed, 10)
+
+    def read_in_background(self, size: int) -> tuple[Thread, bytearray]:
+        received = bytearray()
+
+        def read():
+            while len(received) < size:
+                received.extend(os.read(self.stdin_read, 65536))
+
+        thread = Thread(target=read)
+        thread.start()
+        return thread, received
+
+    def test_pipe_send_does_not_block(self):
+        data = os.urandom(1024 * 1024)
+
+        # Nobody reads, the pipe fills up and the rest is queued
+        start = perf_counter()
+        self.assertEqual(self.pipe.send(data), len(data))
+        self.assertLess(perf_counter() - start, 1)
+
+        self.assertGreater(self.pipe.pending_bytes, 0)
+
+        with self.assertRaises(TimeoutError):
+            self.pipe.flush(timeout=0.1)
+
+        # Small lines queued behind a full pipe are written together
+        for i in range(100):
+            self.pipe.sendline(b"line %d" % i)
+
+        lines = b"".join(b"line %d\n" % i for i in range(100))
+
+        thread, received = self.read_in_background(len(data) + len(lines))
+
+        self.pipe.flush(timeout=10)
+        thread.join()
+
+        self.assertEqual(self.pipe.pending_bytes, 0)
+        self.assertEqual(received, data + lines)
+
+    def test_pipe_send_mutable_buffer(self):
+        filler = b"A" * 1024 * 1024
+        self.pipe.send(filler)
+
+        data = bytearray(b"original")
+        self.pipe.send(data)
+        data[:] = b"modified"
+
+        thread, received = self.read_in_background(len(filler) + 8)
+        self.pipe.flush(timeout=10)
+        thread.join()
+
+        self.assertEqual(received[len(filler) :], b"original")
+
+    def test_pipe_send_broken_pipe(self):
+        os.close(self.stdin_read)
+
+        with self.assertRaises(RuntimeError):
+            self.pipe.sendline(b"nobody is listening")
+
+        self.assertEqual(self.pipe.pending_bytes, 0)
+
+    def test_pipe_send_while_stopped(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        r = d.run()
+
+        # Before the call to read
+        bp = d.breakpoint(0x4011B0)
+
+        d.cont()
+        d.wait()
+
+        self.assertEqual(d.regs.rip, bp.address)
+
+        # Much more than the capacity of the pipe, while the process is stopped
+        r.sendline(b"provola" + b"A" * 1024 * 1024)
+
+        self.assertGreater(r.pending_bytes, 0)
+
+        d.cont()
+        d.wait()
+
+        self.assertTrue(r.recvline().endswith(b"Hello, World!"))
+        self.assertTrue(r.recvn(1024).tobytes().startswith(b"provola"))
+
+        d.kill()
+
+    def test_pipe_capture_ring_buffer(self):
+        data = os.urandom(1024 * 1024) * 4
+        tee = io.BytesIO()
+
+        self.pipe.capture(max_buffer_size=64 * 1024, tee=tee)
+
+        with self.assertRaises(RuntimeError):
+            self.pipe.capture()
+
+        # Nobody receives, yet the writer never stalls
+        thread = self.write_in_background(data)
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+
+        os.write(self.stderr_write, b"error\n")
+        os.close(self.stdout_write)
+
+        # Only the most recent data is retained, but the tee gets everything
+        received = self.pipe.recvall(timeout=5)
+        self.assertEqual(received, data[-64 * 1024 :])
+        self.assertEqual(self.pipe.dropped_bytes, len(data) - 64 * 1024)
+        self.assertEqual(tee.getvalue(), data)
+
+        self.assertEqual(self.pipe.recverrline(), b"error")
+        self.assertEqual(self.pipe.dropped_err_bytes, 0)
+
+    def test_pipe_capture_recv(self):
+        self.pipe.capture()
+
+        os.write(self.stdout_write, b"Write up to 64 ch")
+        thread = Thread(target=lambda: os.write(self.stdout_write, b"ars\nrest of the output"))
+        thread.start()
+
+        self.assertEqual(self.pipe.recvline(), b"Write up to 64 chars")
+        thread.join()
+
+        self.assertEqual(self.pipe.recvn(4), b"rest")
+        self.assertEqual(self.pipe.recvuntil_any([b"the", b"of"]), (b" of", b"of"))
+
+        with self.assertRaises(TimeoutError):
+            self.pipe.recvline(timeout=0.1)
+
+        self.assertEqual(self.pipe.recv(), b" the output")
+
+    def test_pipe_capture_bounded_on_timeout(self):
+        self.pipe.capture(max_buffer_size=64 * 1024)
+
+        chunk = b"x" * 64 * 1024
+        written = 0
+        done = Event()
+
+        def write():
+            nonlocal written
+
+            while not done.is_set():
+                written += os.write(self.stdout_write, chunk)
+
+        thread = Thread(target=write)
+        thread.start()
+
+        # The data searched before each timeout stays buffered
+        for _ in range(3):
+            with self.assertRaises(TimeoutError):
+                self.pipe.recvuntil(b"PROMPT", timeout=0.3)
+
+        done.set()
+        thread.join()
+        os.close(self.stdout_write)
+
+        # Both the capture and the receive buffer only retain the most recent data
+        received = self.pipe.recvall(timeout=5)
+        self.assertLessEqual(len(received), 2 * 64 * 1024)
+        self.assertEqual(len(received) + self.pipe.dropped_bytes, written)
+
+    def test_pipe_capture_process(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stdout")
+
+            r = d.run()
+            r.capture(tee=path)
+
+            r.sendline(b"provola")
+
+            d.cont()
+            d.wait()
+
+            self.assertEqual(r.recvline(), b"Hello, World!")
+            self.assertTrue(r.recvline().startswith(b"provola"))
+
+            # Killing the process closes the file
+            d.kill()
+
+            with open(path, "rb") as f:
+                self.assertTrue(f.read().startswith(b"Hello, World!\nprovola\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
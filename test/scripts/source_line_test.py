@@ -0,0 +1,96 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import unittest
+
+from libdebug import debugger
+
+
+class SourceLineTest(unittest.TestCase):
+    def setUp(self):
+        self.d = debugger("binaries/line_test")
+
+    def test_breakpoint_on_line(self):
+        d = self.d
+
+        d.run()
+
+        bp = d.breakpoint("line_test.c:20")
+
+        d.cont()
+
+        self.assertEqual(d.rip, bp.address)
+
+        file, line = d.resolve_line(d.rip)
+        self.assertTrue(file.endswith("line_test.c"))
+        self.assertEqual(line, 20)
+
+        # The loop body runs once per iteration
+        hits = 1
+        while True:
+            d.cont()
+            if d.rip != bp.address:
+                break
+            hits += 1
+
+        self.assertEqual(hits, 7)
+
+        d.kill()
+
+    def test_line_without_code(self):
+        d = self.d
+
+        d.run()
+
+        # Line 18 is blank, the breakpoint goes to the first line with code after it
+        bp = d.breakpoint("line_test.c:18")
+
+        d.cont()
+
+        self.assertEqual(d.rip, bp.address)
+        self.assertEqual(d.resolve_line(d.rip)[1], 19)
+
+        d.kill()
+
+    def test_resolve_lines(self):
+        d = self.d
+
+        d.run()
+
+        bp_add = d.breakpoint("line_test.c:11")
+        bp_main = d.breakpoint("line_test.c:30")
+
+        addresses = []
+
+        d.cont()
+        addresses.append(d.rip)
+        self.assertEqual(d.rip, bp_add.address)
+
+        bp_add.disable()
+
+        d.cont()
+        addresses.append(d.rip)
+        self.assertEqual(d.rip, bp_main.address)
+
+        lines = d.resolve_lines(addresses + [0x10])
+
+        self.assertEqual([entry[1] for entry in lines[:2]], [11, 30])
+        self.assertIsNone(lines[2])
+
+        d.kill()
+
+    def test_invalid_line(self):
+        d = self.d
+
+        d.run()
+
+        with self.assertRaises(ValueError):
+            d.breakpoint("line_test.c:1000")
+
+        with self.assertRaises(ValueError):
+            d.breakpoint("missing_file.c:10")
+
+        d.kill()
@@ -0,0 +1,68 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import subprocess
+import sys
+import unittest
+from time import perf_counter_ns
+
+from libdebug import debugger
+
+# Measures the import in a fresh interpreter, so that the modules cached by the test runner do not count
+IMPORT_SCRIPT = """
+import sys
+from time import perf_counter_ns
+
+start_time = perf_counter_ns()
+import libdebug
+end_time = perf_counter_ns()
+
+heavy = ["requests", "elftools", "psutil", "libdebug.cffi.debug_sym_cffi"]
+print(end_time - start_time)
+print(",".join(module for module in heavy if module in sys.modules))
+"""
+
+
+class StartupTest(unittest.TestCase):
+    def test_import_time(self):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        elapsed, loaded = result.stdout.splitlines()
+        elapsed = int(elapsed)
+
+        print(f"\nimport libdebug: {elapsed / 1e6:.2f} ms")
+
+        # Heavy dependencies must only be loaded when they are used
+        self.assertEqual(loaded, "")
+        self.assertLess(elapsed, 0.5 * 1e9)  # 500 milliseconds
+
+    def test_run_time(self):
+        timings = []
+
+        for _ in range(10):
+            d = debugger("binaries/basic_test")
+
+            start_time = perf_counter_ns()
+            d.run()
+            timings.append(perf_counter_ns() - start_time)
+
+            d.kill()
+            d.terminate()
+
+        timings.sort()
+
+        print(f"\ndebugger().run(): median {timings[len(timings) // 2] / 1e6:.2f} ms")
+
+        self.assertLess(timings[len(timings) // 2], 0.5 * 1e9)  # 500 milliseconds
+
+
+if __name__ == "__main__":
+    unittest.main()
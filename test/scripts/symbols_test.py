@@ -0,0 +1,106 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from libdebug import debugger, libcontext
+
+
+class SymbolsTest(unittest.TestCase):
+    def setUp(self):
+        self.d = debugger("binaries/backtrace_test")
+
+    def test_find(self):
+        d = self.d
+
+        d.run()
+
+        functions = d.symbols.find(prefix="function")
+        self.assertEqual(
+            [symbol.name for symbol in functions],
+            [f"function{i}" for i in range(1, 7)],
+        )
+
+        for symbol in functions:
+            self.assertTrue(symbol.backing_file.endswith("backtrace_test"))
+            self.assertEqual(symbol.start, d.context.resolve_symbol(symbol.name))
+
+        globbed = d.symbols.find(glob="function[2-4]")
+        self.assertEqual(
+            [symbol.name for symbol in globbed], ["function2", "function3", "function4"]
+        )
+
+        matched = d.symbols.find(regex=r"^function[56]$")
+        self.assertEqual([symbol.name for symbol in matched], ["function5", "function6"])
+
+        combined = d.symbols.find(prefix="func", glob="*6")
+        self.assertEqual([symbol.name for symbol in combined], ["function6"])
+
+        self.assertEqual(d.symbols.find(prefix="main", glob="function*"), [])
+        self.assertEqual(d.symbols.find(prefix="this_symbol_does_not_exist"), [])
+
+        d.kill()
+
+    def test_in_file(self):
+        d = self.d
+
+        d.run()
+
+        symbols = d.symbols.in_file("backtrace_test")
+        names = [symbol.name for symbol in symbols]
+
+        self.assertIn("main", names)
+        self.assertIn("function1", names)
+        self.assertEqual(symbols, sorted(symbols, key=lambda symbol: symbol.start))
+
+        libc_symbols = d.symbols.in_file("libc")
+        self.assertIn("printf", [symbol.name for symbol in libc_symbols])
+
+        with self.assertRaises(ValueError):
+            d.symbols.in_file("this_file_is_not_mapped")
+
+        d.kill()
+
+    def test_near(self):
+        d = self.d
+
+        d.run()
+
+        main = d.symbols.find(prefix="main", glob="main")[0]
+
+        symbol = d.symbols.near(main.start + 8)
+        self.assertEqual(symbol, main)
+
+        function6 = d.symbols.find(glob="function6")[0]
+        self.assertEqual(d.symbols.near(function6.start), function6)
+
+        self.assertIsNone(d.symbols.near(0x10))
+
+        d.kill()
+
+    def test_debuginfod_only_on_miss(self):
+        d = self.d
+
+        d.run()
+
+        with libcontext.tmp(sym_lvl=5), patch(
+            "libdebug.utils.elf_utils._debuginfod",
+            return_value=Path("/nonexistent/debuginfo"),
+        ) as debuginfod:
+            # The local symbols are enough, nothing is downloaded
+            d.context.resolve_symbol("function1")
+            d.symbols.find(prefix="function")
+            d.symbols.near(d.context.resolve_symbol("main"))
+            debuginfod.assert_not_called()
+
+            with self.assertRaises(ValueError):
+                d.context.resolve_symbol("this_symbol_does_not_exist")
+
+            debuginfod.assert_called()
+
+        d.kill()
@@ -0,0 +1,111 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import io
+import os
+import stat
+import sys
+import unittest
+
+from libdebug import debugger
+
+
+class SyscallDecodeTest(unittest.TestCase):
+    def test_decode_strings_and_buffers(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        decoded = {}
+
+        def on_enter_write(t, _):
+            decoded.setdefault("write", []).append(t.syscall_decoded_args)
+
+        def on_exit_read(t, _):
+            decoded["read"] = t.syscall_decoded_args
+
+        def on_exit_getcwd(t, _):
+            decoded["getcwd"] = t.syscall_decoded_args
+
+        r = d.run()
+
+        d.hook_syscall("write", on_enter=on_enter_write)
+        d.hook_syscall("read", on_exit=on_exit_read)
+        d.hook_syscall("getcwd", on_exit=on_exit_getcwd)
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        with self.assertRaises(RuntimeError):
+            d.threads[0].syscall_decoded_args
+
+        d.kill()
+
+        self.assertEqual(decoded["write"][0], {"buf": b"Hello, World!\n"})
+        self.assertEqual(decoded["write"][1]["buf"][:9], b"provola\n\x00")
+
+        # Output buffers are sized by the return value
+        self.assertEqual(decoded["read"], {"buf": b"provola\n"})
+        self.assertEqual(decoded["getcwd"]["buf"].rstrip(b"\x00"), os.getcwd().encode())
+
+    def test_decode_structures(self):
+        d = debugger("binaries/syscall_decode_test")
+
+        decoded = {}
+
+        def on_exit(t, number):
+            decoded[number] = t.syscall_decoded_args
+
+        r = d.run()
+
+        for name in ["newfstatat", "writev", "connect"]:
+            d.hook_syscall(name, on_exit=on_exit)
+
+        d.cont()
+        d.wait()
+
+        self.assertEqual(r.recvline(), b"Hello, World!")
+
+        d.kill()
+
+        newfstatat, writev, connect = decoded[262], decoded[20], decoded[42]
+
+        self.assertEqual(newfstatat["filename"], b"/dev/null")
+        self.assertTrue(stat.S_ISCHR(newfstatat["statbuf"]["st_mode"]))
+        self.assertEqual(newfstatat["statbuf"]["st_rdev"], os.stat("/dev/null").st_rdev)
+
+        self.assertEqual(writev["vec"], [b"Hello, ", b"World!\n"])
+
+        self.assertEqual(
+            connect["uservaddr"],
+            {"family": "AF_INET", "address": "127.0.0.1", "port": 1337},
+        )
+
+    def test_pprint_decoded(self):
+        d = debugger("binaries/syscall_hook_test")
+
+        captured = io.StringIO()
+        sys.stdout = captured
+
+        try:
+            r = d.run()
+            d.pprint_syscalls = True
+
+            r.sendline(b"provola")
+
+            d.cont()
+            d.kill()
+        finally:
+            sys.stdout = sys.__stdout__
+
+        output = captured.getvalue()
+
+        self.assertIn(repr(b"Hello, World!\n"), output)
+        self.assertIn(repr(b"provola\n"), output)
+
+
+if __name__ == "__main__":
+    unittest.main()
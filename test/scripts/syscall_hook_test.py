@@ -11,6 +11,12 @@ import sys
 import unittest
 
 from libdebug import debugger
+from libdebug.utils.syscall_utils import (
+    get_all_syscall_numbers,
+    resolve_syscall_arguments,
+    resolve_syscall_name,
+    resolve_syscall_number,
+)
 
 
 class SyscallHookTest(unittest.TestCase):
@@ -413,3 +419,26 @@ class SyscallHookTest(unittest.TestCase):
             "Syscall write is already hooked by a user-defined hook. Overriding it.",
             self.log_capture_string.getvalue(),
         )
+
+    def test_syscall_table(self):
+        # The syscall table is shipped with the library, no download is needed
+        self.assertEqual(resolve_syscall_number("write"), 1)
+        self.assertEqual(resolve_syscall_number("exit_group"), 231)
+        self.assertEqual(resolve_syscall_name(9), "mmap")
+        self.assertEqual(
+            resolve_syscall_arguments(1),
+            ("unsigned int fd", "const char *buf", "size_t count"),
+        )
+        self.assertEqual(resolve_syscall_arguments(39), ())
+
+        for number in get_all_syscall_numbers():
+            self.assertEqual(resolve_syscall_number(resolve_syscall_name(number)), number)
+
+        with self.assertRaises(ValueError):
+            resolve_syscall_number("this_syscall_does_not_exist")
+
+        with self.assertRaises(ValueError):
+            resolve_syscall_name(400)
+
+        with self.assertRaises(ValueError):
+            resolve_syscall_arguments(-1)
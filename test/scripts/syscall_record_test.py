@@ -0,0 +1,169 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import io
+import os
+import tempfile
+import unittest
+
+from libdebug import debugger
+from libdebug.builtin.syscall_recorder import load_syscall_recording
+
+
+class SyscallRecordTest(unittest.TestCase):
+    def setUp(self):
+        self.d = debugger("binaries/syscall_hook_test")
+
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def record(self):
+        d = self.d
+
+        r = d.run()
+        d.record_syscalls(self.path)
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        self.assertEqual(r.recvline(), b"Hello, World!")
+        self.assertEqual(r.recvline(), b"provola")
+
+        d.kill()
+
+    def test_record(self):
+        self.record()
+
+        records = load_syscall_recording(self.path)
+
+        # Only the syscalls that depend on the environment are recorded
+        self.assertEqual([record["name"] for record in records], ["read"])
+        self.assertEqual(records[0]["return"], 8)
+        self.assertEqual(records[0]["outputs"], {"buf": "provola\n"})
+
+    def test_replay(self):
+        self.record()
+
+        d = self.d
+
+        returns = []
+
+        def on_exit_read(t, _):
+            returns.append(t.syscall_return)
+
+        r = d.run()
+        replayer = d.replay_syscalls(self.path)
+        d.hook_syscall("read", on_exit=on_exit_read)
+
+        # Nothing is sent, the read is emulated
+        d.cont()
+        d.wait()
+
+        self.assertEqual(r.recvline(), b"Hello, World!")
+        self.assertEqual(r.recvline(), b"provola")
+        self.assertEqual(returns, [8])
+        self.assertEqual(replayer.remaining, 0)
+
+        with self.assertRaises(RuntimeError):
+            d.stop_recording_syscalls()
+
+        d.stop_replaying_syscalls()
+        d.kill()
+
+    def test_replay_records_reused(self):
+        self.record()
+
+        d = self.d
+        records = load_syscall_recording(self.path)
+
+        for _ in range(3):
+            r = d.run()
+            d.replay_syscalls(records)
+
+            with self.assertRaises(RuntimeError):
+                d.record_syscalls(io.BytesIO())
+
+            d.cont()
+            d.wait()
+
+            self.assertEqual(r.recvline(), b"Hello, World!")
+            self.assertEqual(r.recvline(), b"provola")
+
+            # The replayer is dropped when the process is killed
+            d.kill()
+
+    def test_record_random_and_clock(self):
+        d = debugger("binaries/syscall_record_test")
+
+        r = d.run()
+        d.record_syscalls(self.path, syscalls=["getrandom", "clock_gettime"])
+        d.cont()
+        d.wait()
+
+        random = r.recvline()
+        clock = r.recvline()
+
+        d.kill()
+
+        records = load_syscall_recording(self.path)
+
+        # The allocator of libc asks for random bytes of its own
+        self.assertEqual([record["name"] for record in records], ["getrandom", "getrandom", "clock_gettime"])
+        self.assertEqual(records[0]["return"], 16)
+        self.assertEqual(records[0]["outputs"]["ubuf"].encode("latin-1").hex().encode(), random)
+
+        # The same random bytes and time come back on every replay
+        for _ in range(2):
+            r = d.run()
+            d.replay_syscalls(self.path)
+            d.cont()
+            d.wait()
+
+            self.assertEqual(r.recvline(), random)
+            self.assertEqual(r.recvline(), clock)
+
+            d.kill()
+
+    def test_record_default_syscalls(self):
+        d = debugger("binaries/syscall_record_test")
+
+        d.run()
+        d.record_syscalls(self.path)
+        d.cont()
+        d.wait()
+        d.kill()
+
+        # The clock is not recorded unless asked for
+        records = load_syscall_recording(self.path)
+        self.assertEqual({record["name"] for record in records}, {"getrandom"})
+
+    def test_record_with_stats_threads(self):
+        d = debugger("binaries/syscall_record_thread_test")
+
+        r = d.run()
+        d.enable_syscall_stats()
+        d.record_syscalls(self.path, syscalls=["getrandom"])
+        d.cont()
+        d.wait()
+
+        count = int(r.recvline())
+
+        d.kill()
+
+        # The syscalls that are only counted must not be mistaken for the exit of the recorded ones, the allocator of
+        # libc asks for random bytes of its own
+        records = load_syscall_recording(self.path)
+        self.assertEqual(len([record for record in records if record["return"] == 12]), count)
+        self.assertTrue(all(record["return"] >= 0 for record in records))
+
+
+if __name__ == "__main__":
+    unittest.main()
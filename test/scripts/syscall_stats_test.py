@@ -0,0 +1,115 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import unittest
+
+from libdebug import debugger
+
+
+class SyscallStatsTest(unittest.TestCase):
+    def setUp(self):
+        self.d = debugger("binaries/syscall_hook_test")
+
+    def test_stats(self):
+        d = self.d
+
+        r = d.run()
+        d.enable_syscall_stats()
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        stats = d.syscall_stats()
+
+        d.kill()
+
+        self.assertEqual(stats["write"].calls, 2)
+        self.assertEqual(stats["read"].calls, 1)
+        self.assertEqual(stats["getcwd"].calls, 1)
+        self.assertEqual(stats[1], stats["write"])
+        self.assertEqual(stats["write"].errors, 0)
+        self.assertGreater(stats["read"].total_time, 0)
+
+        # exit_group never returns, so it is never completed
+        self.assertNotIn("exit_group", stats)
+
+        # The process has a single thread
+        self.assertEqual(len(stats.threads), 1)
+        thread_stats = next(iter(stats.threads.values()))
+        self.assertEqual(thread_stats[1].calls, 2)
+
+        self.assertEqual(stats.calls, sum(stat.calls for stat in stats.syscalls.values()))
+        self.assertIn("getcwd", str(stats))
+        self.assertTrue(str(stats).endswith("total"))
+
+    def test_stats_with_hooks(self):
+        d = self.d
+
+        r = d.run()
+
+        def on_enter_getcwd(t, _):
+            # The buffer is too small, so the syscall fails with ERANGE
+            t.syscall_arg1 = 1
+
+        write_hook = d.hook_syscall("write", on_exit=lambda t, _: None)
+        getcwd_hook = d.hook_syscall("getcwd", on_enter=on_enter_getcwd)
+
+        d.enable_syscall_stats()
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        stats = d.syscall_stats()
+
+        d.kill()
+
+        # The hooked syscalls are still reported to the hooks
+        self.assertEqual(write_hook.hit_count, 2)
+        self.assertEqual(getcwd_hook.hit_count, 1)
+
+        self.assertEqual(stats["write"].calls, 2)
+        self.assertEqual(stats["read"].calls, 1)
+        self.assertEqual(stats["getcwd"].calls, 1)
+        self.assertEqual(stats["getcwd"].errors, 1)
+        self.assertEqual(stats.errors, sum(stat.errors for stat in stats.syscalls.values()))
+
+    def test_stats_reset(self):
+        d = self.d
+
+        r = d.run()
+
+        # After the first write
+        bp = d.breakpoint(0x401185)
+
+        d.enable_syscall_stats()
+
+        d.cont()
+
+        self.assertEqual(d.rip, bp.address)
+        self.assertEqual(d.syscall_stats()["write"].calls, 1)
+
+        d.reset_syscall_stats()
+        self.assertEqual(len(d.syscall_stats()), 0)
+
+        r.sendline(b"provola")
+
+        d.disable_syscall_stats()
+
+        d.cont()
+        d.wait()
+
+        # Nothing is counted while the stats are disabled
+        self.assertEqual(len(d.syscall_stats()), 0)
+
+        d.kill()
+
+
+if __name__ == "__main__":
+    unittest.main()
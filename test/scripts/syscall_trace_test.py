@@ -0,0 +1,117 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+import io
+import os
+import tempfile
+import unittest
+
+from libdebug import debugger
+from libdebug.builtin.syscall_tracer import read_syscall_trace
+
+
+class SyscallTraceTest(unittest.TestCase):
+    def setUp(self):
+        self.d = debugger("binaries/syscall_hook_test")
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_trace(self):
+        d = self.d
+        path = os.path.join(self.directory.name, "trace.jsonl")
+
+        r = d.run()
+        d.trace_syscalls(path)
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.kill()
+
+        records = list(read_syscall_trace(path))
+        names = [record["name"] for record in records]
+
+        for name in ["write", "read", "mmap", "getcwd", "exit_group"]:
+            self.assertIn(name, names)
+
+        writes = [record for record in records if record["name"] == "write"]
+        self.assertEqual(writes[0]["args"][0], 1)
+        self.assertEqual(writes[0]["return"], 14)
+        self.assertEqual(writes[0]["decoded"]["buf"], "Hello, World!\n")
+        self.assertEqual(writes[0]["tid"], records[0]["tid"])
+
+        read = records[names.index("read")]
+        self.assertEqual(read["decoded"]["buf"], "provola\n")
+        self.assertEqual(read["return"], 8)
+
+        getcwd = records[names.index("getcwd")]
+        self.assertEqual(getcwd["decoded"]["buf"].rstrip("\x00"), os.getcwd())
+
+        # exit_group never returns
+        self.assertIsNone(records[-1]["return"])
+        self.assertEqual(records[-1]["name"], "exit_group")
+
+        timestamps = [record["timestamp"] for record in records]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+    def test_trace_compressed_and_filtered(self):
+        d = self.d
+
+        for suffix in [".gz", ".xz"]:
+            path = os.path.join(self.directory.name, "trace.jsonl" + suffix)
+
+            r = d.run()
+            d.trace_syscalls(path, syscalls=["write", "mmap"], decode=False)
+
+            r.sendline(b"provola")
+
+            d.cont()
+            d.kill()
+
+            with open(path, "rb") as trace_file:
+                self.assertNotEqual(trace_file.read(1), b"{")
+
+            records = list(read_syscall_trace(path))
+
+            self.assertEqual({record["name"] for record in records}, {"write", "mmap"})
+            self.assertEqual(len([r for r in records if r["name"] == "write"]), 2)
+            self.assertNotIn("decoded", records[0])
+
+    def test_trace_with_hooks(self):
+        d = self.d
+        sink = io.BytesIO()
+
+        r = d.run()
+
+        def on_exit_write(t, _):
+            t.syscall_return = 0x1337
+
+        hook = d.hook_syscall("write", on_exit=on_exit_write)
+        d.trace_syscalls(sink, syscalls=["write"])
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        d.stop_tracing_syscalls()
+
+        with self.assertRaises(RuntimeError):
+            d.stop_tracing_syscalls()
+
+        d.kill()
+
+        records = list(read_syscall_trace(io.BytesIO(sink.getvalue())))
+
+        # The trace holds what the kernel returned, before the hooks run
+        self.assertEqual([record["return"] for record in records], [14, 1024])
+        self.assertEqual(hook.hit_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+//
+// This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+// Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+// Licensed under the MIT license. See LICENSE file in the project root for details.
+//
+
+#include <stdio.h>
+
+int add(int a, int b)
+{
+    int result = a + b;
+    return result;
+}
+
+int multiply(int a, int b)
+{
+    int result = 0;
+
+    for (int i = 0; i < b; i++) {
+        result = add(result, a);
+    }
+
+    return result;
+}
+
+int main()
+{
+    int value = multiply(6, 7);
+
+    printf("Result: %d\n", value);
+
+    return 0;
+}
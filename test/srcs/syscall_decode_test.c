@@ -0,0 +1,41 @@
+//
+// This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+// Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+// Licensed under the MIT license. See LICENSE file in the project root for details.
+//
+#define _GNU_SOURCE
+
+#include <arpa/inet.h>
+#include <netinet/in.h>
+#include <sys/socket.h>
+#include <sys/stat.h>
+#include <sys/uio.h>
+#include <unistd.h>
+
+int main()
+{
+    struct stat st;
+
+    stat("/dev/null", &st);
+
+    struct iovec iov[2] = {
+        {.iov_base = "Hello, ", .iov_len = 7},
+        {.iov_base = "World!\n", .iov_len = 7},
+    };
+
+    writev(1, iov, 2);
+
+    int fd = socket(AF_INET, SOCK_STREAM, 0);
+
+    struct sockaddr_in addr = {
+        .sin_family = AF_INET,
+        .sin_port = htons(1337),
+        .sin_addr.s_addr = htonl(INADDR_LOOPBACK),
+    };
+
+    connect(fd, (struct sockaddr *)&addr, sizeof(addr));
+
+    close(fd);
+
+    return 0;
+}
@@ -0,0 +1,34 @@
+//
+// This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+// Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+// Licensed under the MIT license. See LICENSE file in the project root for details.
+//
+#define _GNU_SOURCE
+
+#include <stdio.h>
+#include <sys/random.h>
+#include <sys/syscall.h>
+#include <time.h>
+#include <unistd.h>
+
+int main()
+{
+    unsigned char random[16];
+
+    getrandom(random, sizeof(random), 0);
+
+    for (size_t i = 0; i < sizeof(random); i++) {
+        printf("%02x", random[i]);
+    }
+
+    printf("\n");
+
+    // The libc wrapper would go through the vDSO
+    struct timespec now;
+
+    syscall(SYS_clock_gettime, CLOCK_REALTIME, &now);
+
+    printf("%ld.%09ld\n", now.tv_sec, now.tv_nsec);
+
+    return 0;
+}
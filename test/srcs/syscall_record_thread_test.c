@@ -0,0 +1,46 @@
+//
+// This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+// Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+// Licensed under the MIT license. See LICENSE file in the project root for details.
+//
+#define _GNU_SOURCE
+
+#include <pthread.h>
+#include <stdio.h>
+#include <sys/random.h>
+#include <unistd.h>
+
+#define THREADS 4
+#define ITERATIONS 100
+
+void *thread_function(void *arg)
+{
+    unsigned char random[12];
+
+    for (int i = 0; i < ITERATIONS; i++) {
+        // Syscalls that are not recorded, between the recorded ones
+        getppid();
+        getppid();
+
+        getrandom(random, sizeof(random), 0);
+    }
+
+    return arg;
+}
+
+int main()
+{
+    pthread_t threads[THREADS];
+
+    for (int i = 0; i < THREADS; i++) {
+        pthread_create(&threads[i], NULL, thread_function, NULL);
+    }
+
+    for (int i = 0; i < THREADS; i++) {
+        pthread_join(threads[i], NULL);
+    }
+
+    printf("%d\n", THREADS * ITERATIONS);
+
+    return 0;
+}